@@ -11,11 +11,12 @@ def boyer_moore(text, pattern):
     if m > n:
         return -1
     
-    bad_char = [-1] * 256
+    # Last occurrence of each character; a dict works for every Unicode code point
+    bad_char = {}
 
     # Preprocess the pattern
     for i in range(m):
-        bad_char[ord(pattern[i])] = i
+        bad_char[pattern[i]] = i
 
     # Searching phase
     s = 0
@@ -26,7 +27,7 @@ def boyer_moore(text, pattern):
         if j < 0:
             return s
         else:
-            s += max(1, j - bad_char[ord(text[s + j])])
+            s += max(1, j - bad_char.get(text[s + j], -1))
     return -1
 
 def boyer_moore_all(text, pattern):
@@ -42,12 +43,13 @@ def boyer_moore_all(text, pattern):
     if m > n:
         return []
     
-    bad_char = [-1] * 256
+    # Last occurrence of each character; a dict works for every Unicode code point
+    bad_char = {}
     positions = []
 
     # Preprocess the pattern
     for i in range(m):
-        bad_char[ord(pattern[i])] = i
+        bad_char[pattern[i]] = i
 
     # Searching phase
     s = 0
@@ -57,8 +59,276 @@ def boyer_moore_all(text, pattern):
             j -= 1
         if j < 0:
             positions.append(s)
-            s += max(1, m - bad_char[ord(text[s + m])] if s + m < n else 1)
+            s += max(1, m - bad_char.get(text[s + m], -1) if s + m < n else 1)
         else:
-            s += max(1, j - bad_char[ord(text[s + j])])
+            s += max(1, j - bad_char.get(text[s + j], -1))
     
     return positions
+
+def good_suffix_shifts(pattern):
+    """
+    Strong good suffix table: after a mismatch at pattern index j the pattern
+    can be shifted by shift[j + 1], after a full match by shift[0]
+    """
+    m = len(pattern)
+    shift = [0] * (m + 1)
+    border = [0] * (m + 1)
+
+    # Case 1: the matched suffix occurs elsewhere in the pattern
+    i = m
+    j = m + 1
+    border[i] = j
+    while i > 0:
+        while j <= m and pattern[i - 1] != pattern[j - 1]:
+            if shift[j] == 0:
+                shift[j] = j - i
+            j = border[j]
+        i -= 1
+        j -= 1
+        border[i] = j
+
+    # Case 2: only a prefix of the pattern matches a part of the matched suffix
+    j = border[0]
+    for i in range(m + 1):
+        if shift[i] == 0:
+            shift[i] = j
+        if i == j:
+            j = border[j]
+    return shift
+
+class BMSearcher:
+    """
+    Precompiled Boyer-Moore pattern (bad character rule, same as boyer_moore_all):
+    the shift table is built once and reused for every text. Instances are immutable.
+    """
+    __slots__ = ('pattern', '_table')
+
+    def __init__(self, pattern):
+        object.__setattr__(self, 'pattern', pattern)
+        object.__setattr__(self, '_table', self._build_table(pattern))
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.pattern!r})"
+
+    @staticmethod
+    def _build_table(pattern):
+        # Last occurrence of each character in the pattern (missing characters count as -1)
+        bad_char = {}
+        for i, char in enumerate(pattern):
+            bad_char[char] = i
+        return bad_char
+
+    def next_shift(self, text, s, j):
+        """Shift after comparing the alignment at s (j is the mismatch index, -1 on a match)"""
+        m = len(self.pattern)
+        if j < 0:
+            return max(1, m - self._table.get(text[s + m], -1) if s + m < len(text) else 1)
+        return max(1, j - self._table.get(text[s + j], -1))
+
+    def find_all(self, text):
+        """Return all occurrence positions, same as boyer_moore_all(text, pattern)"""
+        pattern = self.pattern
+        last = self._table.get
+        m = len(pattern)
+        n = len(text)
+
+        if m == 0:
+            return [0]
+        if m > n:
+            return []
+
+        positions = []
+        s = 0
+        while s <= n - m:
+            j = m - 1
+            while j >= 0 and pattern[j] == text[s + j]:
+                j -= 1
+            if j < 0:
+                positions.append(s)
+                s += max(1, m - last(text[s + m], -1) if s + m < n else 1)
+            else:
+                s += max(1, j - last(text[s + j], -1))
+        return positions
+
+    def count(self, text):
+        """Return the number of occurrences in the text"""
+        return len(self.find_all(text))
+
+    def shift_stats(self, text):
+        """
+        Scan the text and report how far the pattern moves per alignment,
+        used to compare the variants (a longer average shift means fewer comparisons)
+        """
+        pattern = self.pattern
+        m = len(pattern)
+        n = len(text)
+        alignments = 0
+        comparisons = 0
+        total_shift = 0
+
+        s = 0
+        while m and s <= n - m:
+            j = m - 1
+            comparisons += 1
+            while j >= 0 and pattern[j] == text[s + j]:
+                j -= 1
+                if j >= 0:
+                    comparisons += 1
+            shift = self.next_shift(text, s, j)
+            alignments += 1
+            total_shift += shift
+            s += shift
+
+        return {
+            'alignments': alignments,
+            'comparisons': comparisons,
+            'average_shift': total_shift / alignments if alignments else 0.0
+        }
+
+class BMFullSearcher(BMSearcher):
+    """Boyer-Moore with both the bad character and the good suffix rule"""
+    __slots__ = ('_good_suffix',)
+
+    def __init__(self, pattern):
+        super().__init__(pattern)
+        object.__setattr__(self, '_good_suffix', tuple(good_suffix_shifts(pattern)))
+
+    def next_shift(self, text, s, j):
+        if j < 0:
+            return self._good_suffix[0]
+        return max(self._good_suffix[j + 1], j - self._table.get(text[s + j], -1))
+
+    def find_all(self, text):
+        """Return all occurrence positions, same as boyer_moore_all(text, pattern)"""
+        pattern = self.pattern
+        last = self._table.get
+        good_suffix = self._good_suffix
+        m = len(pattern)
+        n = len(text)
+
+        if m == 0:
+            return [0]
+        if m > n:
+            return []
+
+        positions = []
+        match_shift = good_suffix[0]
+        s = 0
+        while s <= n - m:
+            j = m - 1
+            while j >= 0 and pattern[j] == text[s + j]:
+                j -= 1
+            if j < 0:
+                positions.append(s)
+                s += match_shift
+            else:
+                bad_char_shift = j - last(text[s + j], -1)
+                good_suffix_shift = good_suffix[j + 1]
+                s += bad_char_shift if bad_char_shift > good_suffix_shift else good_suffix_shift
+        return positions
+
+class HorspoolSearcher(BMSearcher):
+    """Boyer-Moore-Horspool: always shifts on the text character under the last pattern position"""
+    __slots__ = ()
+
+    @staticmethod
+    def _build_table(pattern):
+        # Distance from the last occurrence (excluding the final character) to the end of the pattern
+        m = len(pattern)
+        shift = {}
+        for i in range(m - 1):
+            shift[pattern[i]] = m - 1 - i
+        return shift
+
+    def next_shift(self, text, s, j):
+        m = len(self.pattern)
+        return self._table.get(text[s + m - 1], m)
+
+    def find_all(self, text):
+        """Return all occurrence positions, same as boyer_moore_all(text, pattern)"""
+        pattern = self.pattern
+        shift = self._table.get
+        m = len(pattern)
+        n = len(text)
+
+        if m == 0:
+            return [0]
+        if m > n:
+            return []
+
+        positions = []
+        s = 0
+        while s <= n - m:
+            j = m - 1
+            while j >= 0 and pattern[j] == text[s + j]:
+                j -= 1
+            if j < 0:
+                positions.append(s)
+            s += shift(text[s + m - 1], m)
+        return positions
+
+class SundaySearcher(BMSearcher):
+    """Sunday (Quick Search): shifts on the text character just after the current window"""
+    __slots__ = ()
+
+    @staticmethod
+    def _build_table(pattern):
+        # Characters not in the pattern let the window jump past them (m + 1)
+        m = len(pattern)
+        shift = {}
+        for i, char in enumerate(pattern):
+            shift[char] = m - i
+        return shift
+
+    def next_shift(self, text, s, j):
+        m = len(self.pattern)
+        if s + m >= len(text):
+            return m + 1
+        return self._table.get(text[s + m], m + 1)
+
+    def find_all(self, text):
+        """Return all occurrence positions, same as boyer_moore_all(text, pattern)"""
+        pattern = self.pattern
+        shift = self._table.get
+        m = len(pattern)
+        n = len(text)
+
+        if m == 0:
+            return [0]
+        if m > n:
+            return []
+
+        positions = []
+        s = 0
+        while s <= n - m:
+            j = m - 1
+            while j >= 0 and pattern[j] == text[s + j]:
+                j -= 1
+            if j < 0:
+                positions.append(s)
+            if s + m >= n:
+                break
+            s += shift(text[s + m], m + 1)
+        return positions
+
+# Selectable Boyer-Moore variants
+BM_VARIANTS = {
+    'bad_char': BMSearcher,
+    'full': BMFullSearcher,
+    'horspool': HorspoolSearcher,
+    'sunday': SundaySearcher,
+}
+
+def compile_bm(pattern, variant='bad_char'):
+    """
+    Build a reusable Boyer-Moore searcher for the pattern.
+    variant is one of 'bad_char' (default), 'full', 'horspool' or 'sunday'
+    """
+    try:
+        searcher_class = BM_VARIANTS[variant]
+    except KeyError:
+        raise ValueError(f"Unknown Boyer-Moore variant '{variant}'") from None
+    return searcher_class(pattern)
@@ -84,3 +84,61 @@ def compute_lps(pattern, m, lps):
             else:
                 lps[i] = 0
                 i += 1
+
+class KMPSearcher:
+    """
+    Precompiled KMP pattern: the LPS table is built once and reused for every text.
+    Instances are immutable.
+    """
+    __slots__ = ('pattern', 'lps')
+
+    def __init__(self, pattern):
+        m = len(pattern)
+        lps = [0] * m
+        if m:
+            compute_lps(pattern, m, lps)
+        object.__setattr__(self, 'pattern', pattern)
+        object.__setattr__(self, 'lps', tuple(lps))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("KMPSearcher is immutable")
+
+    def __repr__(self):
+        return f"KMPSearcher({self.pattern!r})"
+
+    def find_all(self, text):
+        """Return all occurrence positions, same as kmp_search_all(text, pattern)"""
+        pattern = self.pattern
+        lps = self.lps
+        m = len(pattern)
+        n = len(text)
+
+        if m == 0:
+            return [0]
+        if m > n:
+            return []
+
+        positions = []
+        i = 0
+        j = 0
+        while i < n:
+            if pattern[j] == text[i]:
+                i += 1
+                j += 1
+            if j == m:
+                positions.append(i - j)  # Match found
+                j = lps[j - 1]
+            elif i < n and pattern[j] != text[i]:
+                if j != 0:
+                    j = lps[j - 1]
+                else:
+                    i += 1
+        return positions
+
+    def count(self, text):
+        """Return the number of occurrences in the text"""
+        return len(self.find_all(text))
+
+def compile_kmp(pattern):
+    """Build a reusable KMP searcher for the pattern"""
+    return KMPSearcher(pattern)
@@ -2,16 +2,29 @@
 """
 Pattern matching algorithms for the ATS system:
 - KMP (Knuth-Morris-Pratt)
-- Boyer-Moore
-- Levenshtein Distance
+- Boyer-Moore (bad character, good suffix, Horspool and Sunday variants)
+- Aho-Corasick (multi-keyword)
+- Bitap (approximate phrase search with k errors)
+- Native (CPython str.find / regex baseline)
+- Levenshtein Distance (dynamic programming and bit-parallel Myers)
 """
 
-from .KMP import kmp_search, kmp_search_all
-from .BM import boyer_moore, boyer_moore_all
-from .levenshtein import levenshtein_distance
+from .KMP import kmp_search, kmp_search_all, compile_kmp, KMPSearcher
+from .BM import (boyer_moore, boyer_moore_all, compile_bm, BMSearcher,
+                 BMFullSearcher, HorspoolSearcher, SundaySearcher)
+from .aho_corasick import AhoCorasickAutomaton, aho_corasick_search_all
+from .bitap import BitapSearcher, compile_bitap, bitap_search_all
+from .native import NativeSearcher, NativeMultiSearcher, compile_native, native_search_all
+from .levenshtein import (levenshtein_distance, levenshtein_within, max_distance_for_similarity,
+                          compile_levenshtein, LevenshteinMatcher)
 
 __all__ = [
-    'kmp_search', 'kmp_search_all',
-    'boyer_moore', 'boyer_moore_all', 
-    'levenshtein_distance'
+    'kmp_search', 'kmp_search_all', 'compile_kmp', 'KMPSearcher',
+    'boyer_moore', 'boyer_moore_all', 'compile_bm', 'BMSearcher',
+    'BMFullSearcher', 'HorspoolSearcher', 'SundaySearcher',
+    'AhoCorasickAutomaton', 'aho_corasick_search_all',
+    'BitapSearcher', 'compile_bitap', 'bitap_search_all',
+    'NativeSearcher', 'NativeMultiSearcher', 'compile_native', 'native_search_all',
+    'levenshtein_distance', 'levenshtein_within', 'max_distance_for_similarity',
+    'compile_levenshtein', 'LevenshteinMatcher'
 ]
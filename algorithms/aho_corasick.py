@@ -0,0 +1,75 @@
+from collections import deque
+
+class AhoCorasickAutomaton:
+    """
+    Aho-Corasick automaton that finds every occurrence of every pattern
+    in a single pass over the text
+    """
+    def __init__(self, patterns):
+        self.patterns = list(dict.fromkeys(patterns))  # Unique patterns, original order
+        self.goto = [{}]
+        self.fail = [0]
+        self.output = [[]]  # Pattern indexes that end in each state
+
+        # Build the trie of all patterns
+        for index, pattern in enumerate(self.patterns):
+            if not pattern:
+                continue
+            state = 0
+            for char in pattern:
+                next_state = self.goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self.goto)
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.output.append([])
+                    self.goto[state][char] = next_state
+                state = next_state
+            self.output[state].append(index)
+
+        # Compute failure links breadth-first and merge outputs along them
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self.goto[state].items():
+                queue.append(next_state)
+                fallback = self.fail[state]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                target = self.goto[fallback].get(char, 0)
+                self.fail[next_state] = target if target != next_state else 0
+                self.output[next_state] = self.output[next_state] + self.output[self.fail[next_state]]
+
+    def search_all(self, text):
+        """
+        Search the text once and return a dict mapping each pattern
+        to the list of positions where it is found
+        """
+        positions = {pattern: [] for pattern in self.patterns}
+        lengths = [len(pattern) for pattern in self.patterns]
+        hits = [positions[pattern] for pattern in self.patterns]
+
+        # Empty pattern behaves like kmp_search_all / boyer_moore_all
+        for index, pattern in enumerate(self.patterns):
+            if not pattern:
+                hits[index].append(0)
+
+        goto = self.goto
+        fail = self.fail
+        output = self.output
+        state = 0
+        for i, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for index in output[state]:
+                hits[index].append(i - lengths[index] + 1)
+
+        return positions
+
+def aho_corasick_search_all(text, patterns):
+    """
+    Aho-Corasick search that returns all occurrence positions of every pattern
+    Returns dict of pattern -> list of positions where it is found
+    """
+    return AhoCorasickAutomaton(patterns).search_all(text)
@@ -0,0 +1,132 @@
+from .levenshtein import compile_levenshtein
+
+class BitapSearcher:
+    """
+    Approximate substring search with at most max_errors edits (Wu-Manber Bitap,
+    shift-and form) using Python ints as bit masks. One pass over the text keeps
+    one state mask per error count; bit i of the mask for d errors is set when
+    pattern[:i + 1] matches a substring ending at the current character with
+    at most d edits. Instances are immutable.
+    """
+    __slots__ = ('pattern', 'max_errors', 'masks', 'mask', 'accept')
+
+    def __init__(self, pattern, max_errors):
+        masks = {}
+        for i, char in enumerate(pattern):
+            masks[char] = masks.get(char, 0) | (1 << i)
+        object.__setattr__(self, 'pattern', pattern)
+        object.__setattr__(self, 'max_errors', max(0, max_errors))
+        object.__setattr__(self, 'masks', masks)
+        object.__setattr__(self, 'mask', (1 << len(pattern)) - 1)
+        object.__setattr__(self, 'accept', 1 << (len(pattern) - 1) if pattern else 0)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("BitapSearcher is immutable")
+
+    def __repr__(self):
+        return f"BitapSearcher({self.pattern!r}, {self.max_errors})"
+
+    def end_distances(self, text):
+        """
+        Yield (end, distance) for every position where a substring ending at text[end]
+        is within max_errors edits of the pattern, distance being the smallest such
+        """
+        m = len(self.pattern)
+        k = self.max_errors
+        if m == 0 or k >= m:
+            # Every position matches trivially; not useful as a search
+            return
+
+        masks = self.masks
+        mask = self.mask
+        accept = self.accept
+        # With d errors, the first d pattern characters can be deleted before any text
+        states = [(1 << d) - 1 for d in range(k + 1)]
+
+        for end, char in enumerate(text):
+            char_mask = masks.get(char, 0)
+            previous = states[0]
+            states[0] = ((previous << 1) | 1) & char_mask
+            found = 0 if states[0] & accept else None
+            for d in range(1, k + 1):
+                current = states[d]
+                states[d] = (
+                    (((current << 1) | 1) & char_mask)   # match
+                    | (previous << 1) | 1                # substitution
+                    | previous                           # extra text character
+                    | (states[d - 1] << 1)               # missing text character
+                ) & mask
+                previous = current
+                if found is None and states[d] & accept:
+                    found = d
+            if found is not None:
+                yield end, found
+
+    def candidate_windows(self, text):
+        """
+        Disjoint (start, end) ranges of the text that can contain a match.
+        Split into max_errors + 1 pieces, the pattern keeps at least one piece
+        unchanged in any match, so only the surroundings of exact piece
+        occurrences (found with str.find) need the Bitap pass
+        """
+        m = len(self.pattern)
+        k = self.max_errors
+        if not isinstance(text, str):
+            return [(0, len(text))]
+
+        reach = m + k
+        ranges = []
+        for i in range(k + 1):
+            piece = self.pattern[i * m // (k + 1):(i + 1) * m // (k + 1)]
+            position = text.find(piece)
+            while position != -1:
+                ranges.append((max(0, position - reach), min(len(text), position + reach)))
+                position = text.find(piece, position + 1)
+
+        windows = []
+        for start, end in sorted(ranges):
+            if windows and start <= windows[-1][1]:
+                windows[-1][1] = max(windows[-1][1], end)
+            else:
+                windows.append([start, end])
+        return [tuple(window) for window in windows]
+
+    def find_all(self, text):
+        """
+        Return non-overlapping approximate matches as (start, end, distance) with
+        text[start:end] the matched substring. Consecutive end positions are one
+        match, reported at its smallest distance; the start is the one giving that
+        distance, closest to a substring of the pattern's length
+        """
+        m = len(self.pattern)
+        k = self.max_errors
+        matches = []
+        run = []
+
+        def close_run():
+            best_end, distance = min(run, key=lambda hit: hit[1])
+            end = best_end + 1
+            matcher = compile_levenshtein(self.pattern)
+            starts = range(max(0, end - m - k), max(0, end - m + k) + 1)
+            start = min(starts, key=lambda s: (matcher.distance(text[s:end]), abs(end - s - m)))
+            if not matches or start >= matches[-1][1]:
+                matches.append((start, end, matcher.distance(text[start:end])))
+
+        for window_start, window_end in self.candidate_windows(text):
+            for end, distance in self.end_distances(text[window_start:window_end]):
+                end += window_start
+                if run and end != run[-1][0] + 1:
+                    close_run()
+                    run = []
+                run.append((end, distance))
+        if run:
+            close_run()
+        return matches
+
+def compile_bitap(pattern, max_errors):
+    """Build a reusable approximate searcher for the pattern"""
+    return BitapSearcher(pattern, max_errors)
+
+def bitap_search_all(text, pattern, max_errors):
+    """Approximate matches of the pattern as (start, end, distance) tuples"""
+    return BitapSearcher(pattern, max_errors).find_all(text)
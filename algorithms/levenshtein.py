@@ -14,3 +14,142 @@ def levenshtein_distance(str1, str2):
             else:
                 dp[i][j] = 1 + min(dp[i - 1][j], dp[i][j - 1], dp[i - 1][j - 1])
     return dp[len_str1][len_str2]
+
+def levenshtein_within(str1, str2, max_distance):
+    """
+    Bounded Levenshtein distance.
+    Returns the distance if it is at most max_distance, otherwise max_distance + 1
+    as soon as it is clear the limit cannot be met
+    """
+    exceeds = max_distance + 1
+    len_str1 = len(str1)
+    len_str2 = len(str2)
+
+    # The distance is at least the difference in length
+    if abs(len_str1 - len_str2) > max_distance:
+        return exceeds
+    if len_str1 == 0 or len_str2 == 0:
+        return max(len_str1, len_str2)
+
+    # Only cells with |i - j| <= max_distance can stay within the limit,
+    # everything outside the diagonal band is treated as "exceeds"
+    previous = [j if j <= max_distance else exceeds for j in range(len_str2 + 1)]
+
+    for i in range(1, len_str1 + 1):
+        current = [exceeds] * (len_str2 + 1)
+        if i <= max_distance:
+            current[0] = i
+        row_min = current[0]
+        char1 = str1[i - 1]
+
+        for j in range(max(1, i - max_distance), min(len_str2, i + max_distance) + 1):
+            if char1 == str2[j - 1]:
+                value = previous[j - 1]
+            else:
+                value = 1 + min(previous[j], current[j - 1], previous[j - 1])
+                if value > exceeds:
+                    value = exceeds
+            current[j] = value
+            if value < row_min:
+                row_min = value
+
+        # Distances never decrease from one row to the next, so stop early
+        if row_min > max_distance:
+            return exceeds
+        previous = current
+
+    distance = previous[len_str2]
+    return distance if distance <= max_distance else exceeds
+
+def max_distance_for_similarity(max_len, threshold):
+    """
+    Largest edit distance that can still give similarity >= threshold,
+    where similarity = 1 - distance / max_len
+    """
+    # Small epsilon so float rounding never drops a distance that reaches the threshold
+    return int((1 - threshold) * max_len + 1e-9)
+
+# Longest pattern handled with a single machine-word bit vector;
+# longer patterns fall back to the dynamic programming versions
+WORD_BITS = 64
+
+class LevenshteinMatcher:
+    """
+    Precompiled Levenshtein pattern using the bit-parallel algorithm of Myers
+    (global distance formulation by Hyyro). The Peq table (character -> bit mask
+    of its positions in the pattern) is built once and reused for every word.
+    Instances are immutable.
+    """
+    __slots__ = ('pattern', 'peq', 'mask', 'last')
+
+    def __init__(self, pattern):
+        peq = {}
+        for i, char in enumerate(pattern):
+            peq[char] = peq.get(char, 0) | (1 << i)
+        object.__setattr__(self, 'pattern', pattern)
+        object.__setattr__(self, 'peq', peq)
+        object.__setattr__(self, 'mask', (1 << len(pattern)) - 1)
+        object.__setattr__(self, 'last', 1 << (len(pattern) - 1) if pattern else 0)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("LevenshteinMatcher is immutable")
+
+    def __repr__(self):
+        return f"LevenshteinMatcher({self.pattern!r})"
+
+    def distance(self, text):
+        """Edit distance to the text, same as levenshtein_distance(pattern, text)"""
+        return self.within(text, None)
+
+    def within(self, text, max_distance):
+        """
+        Bounded edit distance, same as levenshtein_within(pattern, text, max_distance).
+        With max_distance None the exact distance is returned
+        """
+        m = len(self.pattern)
+        n = len(text)
+        if max_distance is not None and abs(m - n) > max_distance:
+            return max_distance + 1
+        if m == 0 or n == 0:
+            return max(m, n)
+        if m > WORD_BITS:
+            if max_distance is None:
+                return levenshtein_distance(self.pattern, text)
+            return levenshtein_within(self.pattern, text, max_distance)
+
+        peq = self.peq
+        mask = self.mask
+        last = self.last
+        pv = mask  # Vertical deltas +1 (column 0 is 0, 1, ..., m)
+        mv = 0     # Vertical deltas -1
+        score = m
+        remaining = n
+
+        for char in text:
+            eq = peq.get(char, 0)
+            xv = eq | mv
+            xh = (((eq & pv) + pv) ^ pv) | eq
+            ph = (mv | ~(xh | pv)) & mask
+            mh = pv & xh
+            if ph & last:
+                score += 1
+            elif mh & last:
+                score -= 1
+            # Row 0 is 0, 1, ..., n, so a +1 horizontal delta enters at the top
+            ph = (ph << 1) | 1
+            mh <<= 1
+            pv = (mh | ~(xv | ph)) & mask
+            mv = ph & xv
+
+            remaining -= 1
+            # The score changes by at most one per remaining character
+            if max_distance is not None and score - remaining > max_distance:
+                return max_distance + 1
+
+        if max_distance is not None and score > max_distance:
+            return max_distance + 1
+        return score
+
+def compile_levenshtein(pattern):
+    """Build a reusable bit-parallel Levenshtein matcher for the pattern"""
+    return LevenshteinMatcher(pattern)
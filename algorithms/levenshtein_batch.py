@@ -0,0 +1,101 @@
+"""
+Levenshtein distance from one keyword to many words at once with NumPy.
+
+Words are grouped into length buckets and padded into a fixed-width matrix
+of code points, then the DP is computed row by row (one row per keyword
+character) for every word of the bucket in the same vector operations.
+Insertions within a row are resolved with a running minimum:
+D[i][j] = j + min over k <= j of (T[k] - k), where T holds the deletion and
+substitution candidates. Padding never changes D[m][n] for a word of length n,
+since a cell only depends on the columns to its left.
+
+NumPy is optional; check HAS_NUMPY before calling levenshtein_batch or
+levenshtein_batch_within.
+"""
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    np = None
+    HAS_NUMPY = False
+
+# Words whose lengths fall in the same bucket of this width share one matrix
+BUCKET_WIDTH = 4
+
+
+def levenshtein_batch(keyword, words, bucket_width=BUCKET_WIDTH):
+    """
+    Edit distance from keyword to every word, as an int ndarray in the order of words.
+    Same values as levenshtein_distance(keyword, word) for each word
+    """
+    if not HAS_NUMPY:
+        raise ImportError("levenshtein_batch requires NumPy")
+
+    words = list(words)
+    distances = np.empty(len(words), dtype=np.int64)
+    if not words:
+        return distances
+
+    m = len(keyword)
+    keyword_codes = np.array([ord(char) for char in keyword], dtype=np.uint32)
+
+    buckets = {}
+    for index, word in enumerate(words):
+        buckets.setdefault(len(word) // bucket_width, []).append(index)
+
+    for indexes in buckets.values():
+        bucket = [words[index] for index in indexes]
+        lengths = np.array([len(word) for word in bucket], dtype=np.int64)
+        width = int(lengths.max())
+        count = len(bucket)
+
+        # Row 0: D[0][j] = j
+        columns = np.arange(width + 1, dtype=np.int64)
+        row = np.broadcast_to(columns, (count, width + 1)).copy()
+
+        if m and width:
+            # Code points padded to the bucket width (the padding value never matters)
+            codes = np.frombuffer(
+                ''.join(word.ljust(width, '\0') for word in bucket).encode('utf-32-le'), dtype=np.uint32
+            ).reshape(count, width)
+
+            for i in range(1, m + 1):
+                substitution = (codes != keyword_codes[i - 1]).astype(np.int64)
+                candidates = np.empty_like(row)
+                candidates[:, 0] = i
+                # Deletion from the row above, or match/substitution from the diagonal
+                np.minimum(row[:, 1:] + 1, row[:, :-1] + substitution, out=candidates[:, 1:])
+                # Insertions: running minimum of candidates[k] + (j - k)
+                row = np.minimum.accumulate(candidates - columns, axis=1) + columns
+        elif m:
+            row[:, 0] = m
+
+        distances[indexes] = row[np.arange(count), lengths]
+
+    return distances
+
+
+def levenshtein_batch_within(keyword, words, threshold):
+    """
+    Bounded distances for a similarity threshold, the batch form of
+    levenshtein_within(keyword, word, max_distance_for_similarity(max_len, threshold)).
+    Words whose length difference alone exceeds the limit are not computed.
+    Returns (distances, max_distances) as int ndarrays in the order of words;
+    a distance above its limit is reported as limit + 1
+    """
+    if not HAS_NUMPY:
+        raise ImportError("levenshtein_batch_within requires NumPy")
+
+    words = list(words)
+    lengths = np.fromiter(map(len, words), dtype=np.int64, count=len(words))
+    max_lengths = np.maximum(lengths, len(keyword))
+    # Same formula as max_distance_for_similarity, including the rounding epsilon
+    max_distances = ((1 - threshold) * max_lengths + 1e-9).astype(np.int64)
+
+    distances = max_distances + 1
+    candidates = np.flatnonzero(np.abs(lengths - len(keyword)) <= max_distances)
+    if len(candidates):
+        computed = levenshtein_batch(keyword, [words[index] for index in candidates])
+        distances[candidates] = np.minimum(computed, max_distances[candidates] + 1)
+    return distances, max_distances
@@ -0,0 +1,94 @@
+import re
+
+class NativeSearcher:
+    """
+    Baseline searcher using CPython's C-level str.find (or bytes.find) in a loop.
+    Finds overlapping occurrences, same positions as kmp_search_all.
+    Instances are immutable.
+    """
+    __slots__ = ('pattern', '_regex')
+
+    def __init__(self, pattern):
+        object.__setattr__(self, 'pattern', pattern)
+        # Zero-width lookahead, for buffers without a find method (e.g. memoryview)
+        object.__setattr__(self, '_regex', re.compile(b'(?=' + re.escape(pattern) + b')'
+                                                      if isinstance(pattern, bytes)
+                                                      else '(?=' + re.escape(pattern) + ')'))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("NativeSearcher is immutable")
+
+    def __repr__(self):
+        return f"NativeSearcher({self.pattern!r})"
+
+    def find_all(self, text):
+        """Return all occurrence positions, same as kmp_search_all(text, pattern)"""
+        pattern = self.pattern
+        if not pattern:
+            return [0]
+        find = getattr(text, 'find', None)
+        if find is None:
+            return [match.start() for match in self._regex.finditer(text)]
+
+        positions = []
+        position = find(pattern)
+        while position != -1:
+            positions.append(position)
+            position = find(pattern, position + 1)
+        return positions
+
+    def count(self, text):
+        """Return the number of occurrences in the text"""
+        return len(self.find_all(text))
+
+class NativeMultiSearcher:
+    """
+    Several keywords at once: a precompiled lookahead alternation of the escaped
+    patterns finds every position where some keyword starts, then each keyword
+    is checked there. Same results as AhoCorasickAutomaton.search_all
+    """
+    def __init__(self, patterns):
+        self.patterns = list(dict.fromkeys(patterns))  # Unique patterns, original order
+        non_empty = [pattern for pattern in self.patterns if pattern]
+        self._regex = None
+        if non_empty:
+            if isinstance(non_empty[0], bytes):
+                self._regex = re.compile(b'(?=' + b'|'.join(map(re.escape, non_empty)) + b')')
+            else:
+                self._regex = re.compile('(?=' + '|'.join(map(re.escape, non_empty)) + ')')
+
+    def search_all(self, text):
+        """
+        Search the text and return a dict mapping each pattern
+        to the list of positions where it is found
+        """
+        positions = {pattern: [] for pattern in self.patterns}
+        if self._regex is None:
+            for pattern in self.patterns:
+                positions[pattern].append(0)
+            return positions
+
+        checks = [(pattern, len(pattern), positions[pattern]) for pattern in self.patterns if pattern]
+        startswith = getattr(text, 'startswith', None)
+        for match in self._regex.finditer(text):
+            start = match.start()
+            for pattern, length, hits in checks:
+                if startswith(pattern, start) if startswith else text[start:start + length] == pattern:
+                    hits.append(start)
+
+        # Empty pattern behaves like kmp_search_all
+        for pattern in self.patterns:
+            if not pattern:
+                positions[pattern].append(0)
+        return positions
+
+def compile_native(pattern):
+    """Build a reusable str.find searcher for the pattern"""
+    return NativeSearcher(pattern)
+
+def native_search_all(text, pattern):
+    """
+    str.find search that returns all occurrence positions
+    Returns list of positions where pattern is found
+    """
+    return NativeSearcher(pattern).find_all(text)
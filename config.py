@@ -19,11 +19,40 @@ DB_CONFIG = {
     'allow_local_infile': False
 }
 
+# Database connection pool settings
+DB_POOL_CONFIG = {
+    'use_pool': True,  # Reuse warm connections instead of connecting for every query
+    'min_size': 1,  # Connections kept open even when idle
+    'max_size': 5,  # Maximum open connections
+    'max_idle_time': 300,  # Seconds before an idle connection above min_size is closed
+    'acquire_timeout': 10  # Seconds to wait for a free connection
+}
+
 # Application settings
 APP_CONFIG = {
     'similarity_threshold': 0.7,  # Minimum similarity for fuzzy matching
     'max_results': 50,  # Maximum number of results to return
     'supported_formats': ['.pdf'],  # Supported CV file formats
+    'use_extraction_cache': True,  # Reuse extracted CV text for unchanged PDFs
+    'extraction_cache_path': 'temp/extraction_cache.sqlite3',  # SQLite file for the cache
+    'search_workers': 1,  # Worker processes for CV search (1 = sequential, 0 = all CPU cores)
+    'parallel_chunk_size': 25,  # Number of CVs sent to a worker process at once
+    'progress_interval': 25,  # Report search progress every N CVs
+    'progress_preview_size': 50,  # Best results sent with each progress report (rows shown while searching)
+    'seed_batch_size': 500,  # Rows inserted and committed per batch when seeding
+    'fulltext_search': False,  # Name/skill/role searches use MATCH ... AGAINST (word prefixes) instead of LIKE '%term%'
+    'search_prefilter': False,  # Narrow KMP/BM applicant searches with one LIKE query in the database first
+    'result_cache_size': 32,  # Search results kept in memory for repeated queries (0 = disabled)
+    'result_cache_ttl': 300,  # Seconds before a cached search result expires (0 = no expiry)
+    'result_cache_max_results': 5000,  # Result rows kept over all cached searches (larger searches are not cached)
+    'profile_search': False,  # Run searches under cProfile (also enabled by ATS_PROFILE=1)
+    'profile_dir': 'logs/profiles',  # Folder for the .prof files of profiled searches
+    'use_corpus_index': True,  # Scan one memory-mapped file of all CV texts instead of each CV separately
+    'corpus_index_path': 'temp/corpus_index',  # Corpus files (.bin text and .idx offsets) are written here
+    'fuzzy_batch': True,  # Compare large batches of new words with NumPy (when installed)
+    'fuzzy_batch_min_words': 256,  # Smaller batches use the bit-parallel matcher, which is faster there
+    'startup_import_budget_ms': 1000,  # Upper bound for importing the GUI module (checked by tests/test_startup.py)
+    'sharded_search': False,  # Search each role as its own shard (always used when a role filter is given)
 }
 
 # File paths
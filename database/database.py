@@ -1,18 +1,227 @@
-import pymysql
+import re
+import json
 import logging
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+from utils.result_cache import bump_corpus_version
+
+# InnoDB does not index words shorter than innodb_ft_min_token_size (3 by default)
+FULLTEXT_MIN_WORD_LENGTH = 3
+# Words of InnoDB's default stopword list that are long enough to be indexed otherwise
+FULLTEXT_STOPWORDS = frozenset({'about', 'are', 'com', 'for', 'from', 'how', 'that', 'the', 'this',
+                                'was', 'what', 'when', 'where', 'who', 'will', 'with', 'und', 'www'})
+
+def fulltext_query(term):
+    """
+    Boolean mode query that requires every word of term as a word prefix, e.g.
+    'customer serv' -> '+customer* +serv*'. Returns None unless the FULLTEXT index
+    can serve the whole term: every space-separated part must be a plain word that
+    is long enough and not a stopword ('c++', 'ui design', 'the' go to LIKE instead)
+    """
+    words = term.lower().split()
+    if not words or not all(re.fullmatch(r'[^\W_]+', word) and len(word) >= FULLTEXT_MIN_WORD_LENGTH
+                            and word not in FULLTEXT_STOPWORDS for word in words):
+        return None
+    return " ".join(f"+{word}*" for word in words)
+
+def like_pattern(term):
+    """'%term%' with LIKE wildcards in term escaped, so they match literally"""
+    return "%" + re.sub(r'([\\%_])', r'\\\1', term) + "%"
+
+def decode_sections(sections):
+    """CV sections as a dict (JSON columns come back from PyMySQL as strings)"""
+    if isinstance(sections, (str, bytes)):
+        return json.loads(sections)
+    return sections
+
+class ConnectionPool:
+    """Thread-safe pool of PyMySQL connections that are reused between queries"""
+    def __init__(self, host='localhost', port=3306, user='root', password='', database='ats_db',
+                 min_size=1, max_size=5, max_idle_time=300, acquire_timeout=10):
+        self.host = host
+        self.port = port
+        self.user = user
+        self.password = password
+        self.database = database
+        self.min_size = max(0, min_size)
+        self.max_size = max(1, max_size, self.min_size)
+        self.max_idle_time = max_idle_time
+        self.acquire_timeout = acquire_timeout
+        
+        self._idle = deque()  # (connection, time it was returned to the pool)
+        self._size = 0  # Open connections, idle or checked out
+        self._condition = threading.Condition()
+        self._closed = False
+
+    def _create_connection(self):
+        """Open a new database connection"""
+        import pymysql  # Loaded on the first connection, not when the GUI starts
+        return pymysql.connect(
+            host=self.host,
+            port=self.port,
+            user=self.user,
+            password=self.password,
+            database=self.database,
+            charset='utf8mb4',
+            cursorclass=pymysql.cursors.DictCursor,
+            autocommit=True
+        )
+
+    def _close_quietly(self, connection):
+        try:
+            connection.close()
+        except Exception:
+            pass
+
+    def _prune_idle(self):
+        """Close connections idle for too long, keeping at least min_size open (lock held)"""
+        now = time.monotonic()
+        while self._idle and self._size > self.min_size:
+            connection, returned_at = self._idle[0]  # Oldest idle connection
+            if now - returned_at <= self.max_idle_time:
+                break
+            self._idle.popleft()
+            self._size -= 1
+            self._close_quietly(connection)
+
+    def fill(self):
+        """Open connections until min_size are available"""
+        while True:
+            with self._condition:
+                if self._closed or self._size >= self.min_size:
+                    return
+                self._size += 1
+            try:
+                connection = self._create_connection()
+            except Exception:
+                with self._condition:
+                    self._size -= 1
+                    self._condition.notify()
+                raise
+            self.release(connection)
+
+    def acquire(self):
+        """Check out a healthy connection, waiting if max_size are already in use"""
+        deadline = time.monotonic() + self.acquire_timeout
+        with self._condition:
+            while True:
+                if self._closed:
+                    raise RuntimeError("Connection pool is closed")
+                self._prune_idle()
+                if self._idle:
+                    # Most recently used connection is the most likely to still be alive
+                    connection, _ = self._idle.pop()
+                    break
+                if self._size < self.max_size:
+                    self._size += 1
+                    connection = None
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(f"No database connection available after {self.acquire_timeout}s")
+                self._condition.wait(remaining)
+
+        try:
+            if connection is None:
+                connection = self._create_connection()
+            else:
+                # Health check; reconnects transparently if the server dropped the connection
+                connection.ping(reconnect=True)
+            return connection
+        except Exception:
+            if connection is not None:
+                self._close_quietly(connection)
+            with self._condition:
+                self._size -= 1
+                self._condition.notify()
+            raise
+
+    def release(self, connection):
+        """Return a connection to the pool"""
+        with self._condition:
+            if self._closed or not connection.open:
+                self._size -= 1
+                self._close_quietly(connection)
+            else:
+                self._idle.append((connection, time.monotonic()))
+                self._prune_idle()
+            self._condition.notify()
+
+    @contextmanager
+    def connection(self):
+        """Context manager that checks out a connection and always returns it"""
+        connection = self.acquire()
+        try:
+            yield connection
+        finally:
+            self.release(connection)
+
+    def close_all(self):
+        """Close every idle connection; checked out ones are closed when released"""
+        with self._condition:
+            self._closed = True
+            while self._idle:
+                connection, _ = self._idle.pop()
+                self._size -= 1
+                self._close_quietly(connection)
+            self._condition.notify_all()
+
+    def stats(self):
+        """Get pool usage statistics"""
+        with self._condition:
+            return {
+                'open': self._size,
+                'idle': len(self._idle),
+                'in_use': self._size - len(self._idle),
+                'min_size': self.min_size,
+                'max_size': self.max_size
+            }
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+def get_pool(host='localhost', port=3306, user='root', password='', database='ats_db', **pool_options):
+    """Get the shared pool for a database, creating it on first use"""
+    key = (host, port, user, password, database)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None or pool._closed:
+            pool = ConnectionPool(host, port, user, password, database, **pool_options)
+            _pools[key] = pool
+        return pool
 
 class DatabaseConnection:
-    def __init__(self, host='localhost', port=3306, user='root', password='', database='ats_db'):
+    def __init__(self, host='localhost', port=3306, user='root', password='', database='ats_db',
+                 use_pool=False, use_fulltext=False, **pool_options):
         self.host = host
         self.port = port
         self.user = user
         self.password = password
         self.database = database
         self.connection = None
+        # Search with MATCH ... AGAINST on the FULLTEXT indexes (word prefixes) instead of LIKE '%term%'
+        self.use_fulltext = use_fulltext
+        # With a pool, every query checks out a warm connection shared with other users of the same database
+        self.pool = get_pool(host, port, user, password, database, **pool_options) if use_pool else None
 
     def connect(self):
         """Establish database connection"""
+        if self.pool is not None:
+            try:
+                self.pool.fill()
+                if self.pool.stats()['open'] == 0:
+                    # min_size is 0, so check the server is reachable with one checkout
+                    with self.pool.connection():
+                        pass
+                return True
+            except Exception as e:
+                logging.error(f"Error connecting to database: {e}")
+                return False
         try:
+            import pymysql
             self.connection = pymysql.connect(
                 host=self.host,
                 port=self.port,
@@ -31,22 +240,46 @@ class DatabaseConnection:
 
     def disconnect(self):
         """Close database connection"""
+        # Pooled connections are returned after every query, nothing to close here
         if self.connection:
             self.connection.close()
             logging.info("Database connection closed")
 
+    def close_connection(self):
+        """Close the connection and, if used, the pool"""
+        self.disconnect()
+        if self.pool is not None:
+            self.pool.close_all()
+
     def is_connected(self):
         """Check if database is connected"""
+        if self.pool is not None:
+            return self.pool.stats()['open'] > 0
         return self.connection and self.connection.open
 
+    @contextmanager
+    def _cursor(self):
+        """Cursor on a pooled connection, or on the single connection without a pool"""
+        if self.pool is not None:
+            with self.pool.connection() as connection:
+                cursor = connection.cursor()
+                try:
+                    yield cursor
+                finally:
+                    cursor.close()
+        else:
+            cursor = self.connection.cursor()
+            try:
+                yield cursor
+            finally:
+                cursor.close()
+
     def execute_query(self, query, params=None):
         """Execute SELECT query and return results"""
         try:
-            cursor = self.connection.cursor()
-            cursor.execute(query, params)
-            results = cursor.fetchall()
-            cursor.close()
-            return results
+            with self._cursor() as cursor:
+                cursor.execute(query, params)
+                return cursor.fetchall()
         except Exception as e:
             logging.error(f"Error executing query: {e}")
             return None
@@ -54,15 +287,20 @@ class DatabaseConnection:
     def execute_update(self, query, params=None):
         """Execute INSERT, UPDATE, DELETE query"""
         try:
-            cursor = self.connection.cursor()
-            cursor.execute(query, params)
-            affected_rows = cursor.rowcount
-            cursor.close()
-            return affected_rows
+            with self._cursor() as cursor:
+                cursor.execute(query, params)
+                return cursor.rowcount
         except Exception as e:
             logging.error(f"Error executing update: {e}")
             return 0
 
+    def _update_corpus(self, query, params=None):
+        """execute_update for changes to the searchable corpus (invalidates cached search results)"""
+        rowcount = self.execute_update(query, params)
+        if rowcount:
+            bump_corpus_version()
+        return rowcount
+
     def get_applicant_profiles(self):
         """Get all applicant profiles"""
         query = "SELECT * FROM ApplicantProfile ORDER BY created_at DESC"
@@ -73,25 +311,49 @@ class DatabaseConnection:
         query = "SELECT * FROM ApplicationDetail ORDER BY applied_date DESC"
         return self.execute_query(query)
 
+    def _match_or_like(self, match_query, like_query, term, like_params=1):
+        """
+        With use_fulltext on, terms the FULLTEXT index can serve (see fulltext_query) run
+        match_query only, so they match word prefixes: 'sql' finds "SQL Server" but not
+        "MySQL". Other terms, and every term when use_fulltext is off, run like_query
+        ('%term%' bound like_params times), which matches substrings. like_query is also
+        used when match_query fails, e.g. because the FULLTEXT index is missing
+        """
+        boolean_query = fulltext_query(term) if self.use_fulltext else None
+        if boolean_query:
+            results = self.execute_query(match_query, (boolean_query,))
+            if results is not None:
+                return results
+        search_term = f"%{term}%"
+        return self.execute_query(like_query, (search_term,) * like_params)
+
     def search_applicants_by_name(self, name):
         """Search applicants by name"""
-        query = """
+        match_query = """
+        SELECT * FROM ApplicantProfile 
+        WHERE MATCH(first_name, last_name) AGAINST (%s IN BOOLEAN MODE)
+        ORDER BY first_name, last_name
+        """
+        like_query = """
         SELECT * FROM ApplicantProfile 
         WHERE first_name LIKE %s OR last_name LIKE %s
         ORDER BY first_name, last_name
         """
-        search_term = f"%{name}%"
-        return self.execute_query(query, (search_term, search_term))
+        return self._match_or_like(match_query, like_query, name, like_params=2)
 
     def search_applicants_by_skill(self, skill):
         """Search applicants by skill"""
-        query = """
+        match_query = """
+        SELECT * FROM ApplicantProfile 
+        WHERE MATCH(skills) AGAINST (%s IN BOOLEAN MODE)
+        ORDER BY first_name, last_name
+        """
+        like_query = """
         SELECT * FROM ApplicantProfile 
         WHERE skills LIKE %s
         ORDER BY first_name, last_name
         """
-        search_term = f"%{skill}%"
-        return self.execute_query(query, (search_term,))
+        return self._match_or_like(match_query, like_query, skill)
 
     def add_applicant(self, first_name, last_name, phone_number, email, address, 
                      date_of_birth, summary, skills, experience, education):
@@ -104,7 +366,7 @@ class DatabaseConnection:
         """
         params = (first_name, last_name, phone_number, email, address, 
                  date_of_birth, summary, skills, experience, education)
-        return self.execute_update(query, params)
+        return self._update_corpus(query, params)
 
     def add_application(self, applicant_id, application_role, cv_path, 
                        application_status='pending', notes=None):
@@ -115,7 +377,7 @@ class DatabaseConnection:
         VALUES (%s, %s, %s, %s, %s)
         """
         params = (applicant_id, application_role, cv_path, application_status, notes)
-        return self.execute_update(query, params)
+        return self._update_corpus(query, params)
 
     def update_application_status(self, application_id, status, notes=None):
         """Update application status"""
@@ -142,35 +404,69 @@ class DatabaseConnection:
 
     def search_applications_by_role(self, role):
         """Search applications by role"""
-        query = """
+        match_query = """
+        SELECT * FROM ApplicationDetail 
+        WHERE MATCH(application_role) AGAINST (%s IN BOOLEAN MODE)
+        ORDER BY applied_date DESC
+        """
+        like_query = """
         SELECT * FROM ApplicationDetail 
         WHERE application_role LIKE %s
         ORDER BY applied_date DESC
         """
-        search_term = f"%{role}%"
-        return self.execute_query(query, (search_term,))
+        return self._match_or_like(match_query, like_query, role)
+
+    def upsert_cv_content(self, applicant_id, content_hash, cv_text, sections):
+        """Store the extracted text and parsed sections of an applicant's CV"""
+        query = """
+        INSERT INTO CVContent (applicant_id, content_hash, cv_text, sections)
+        VALUES (%s, %s, %s, %s)
+        ON DUPLICATE KEY UPDATE
+            content_hash = VALUES(content_hash),
+            cv_text = VALUES(cv_text),
+            sections = VALUES(sections)
+        """
+        params = (applicant_id, content_hash, cv_text, json.dumps(sections))
+        return self._update_corpus(query, params)
+
+    def get_cv_content(self, applicant_id):
+        """Get the stored CV text and sections of an applicant (sections decoded to a dict)"""
+        query = "SELECT * FROM CVContent WHERE applicant_id = %s"
+        results = self.execute_query(query, (applicant_id,))
+        if not results:
+            return None
+        content = results[0]
+        content['sections'] = decode_sections(content['sections'])
+        return content
 
     def get_all_applicants(self):
-        """Get all applicants with their application details"""
+        """Get all applicants with their application details and stored CV content"""
         query = """
-        SELECT ap.*, ad.application_role, ad.cv_path, ad.application_status, ad.applied_date
+        SELECT ap.*, ad.application_role, ad.cv_path, ad.application_status, ad.applied_date,
+               cc.cv_text, cc.sections AS cv_sections, cc.content_hash
         FROM ApplicantProfile ap
         LEFT JOIN ApplicationDetail ad ON ap.applicant_id = ad.applicant_id
+        LEFT JOIN CVContent cc ON ap.applicant_id = cc.applicant_id
         ORDER BY ap.first_name, ap.last_name
         """
         return self.execute_query(query)
 
     def get_applicants_by_role(self, role):
         """Get applicants by role"""
-        query = """
+        select = """
         SELECT ap.*, ad.application_role, ad.cv_path, ad.application_status, ad.applied_date
         FROM ApplicantProfile ap
         INNER JOIN ApplicationDetail ad ON ap.applicant_id = ad.applicant_id
+        """
+        match_query = select + """
+        WHERE MATCH(ad.application_role) AGAINST (%s IN BOOLEAN MODE)
+        ORDER BY ap.first_name, ap.last_name
+        """
+        like_query = select + """
         WHERE ad.application_role LIKE %s
         ORDER BY ap.first_name, ap.last_name
         """
-        search_term = f"%{role}%"
-        return self.execute_query(query, (search_term,))
+        return self._match_or_like(match_query, like_query, role)
 
     def get_all_roles(self):
         """Get all unique roles"""
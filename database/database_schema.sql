@@ -33,6 +33,27 @@ CREATE TABLE IF NOT EXISTS ApplicationDetail (
     FOREIGN KEY (applicant_id) REFERENCES ApplicantProfile(applicant_id) ON DELETE CASCADE
 );
 
+-- Table for storing the extracted CV text and parsed sections (filled at ingest time)
+CREATE TABLE IF NOT EXISTS CVContent (
+    applicant_id INT PRIMARY KEY,
+    content_hash CHAR(64) NOT NULL,
+    cv_text MEDIUMTEXT NOT NULL,
+    sections JSON,
+    extracted_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    FOREIGN KEY (applicant_id) REFERENCES ApplicantProfile(applicant_id) ON DELETE CASCADE
+);
+
+-- Fingerprints of the CV files under data/, used by the incremental corpus sync
+CREATE TABLE IF NOT EXISTS CorpusFile (
+    cv_path VARCHAR(500) PRIMARY KEY,
+    applicant_id INT NOT NULL,
+    mtime_ns BIGINT NOT NULL,
+    size BIGINT NOT NULL,
+    file_hash CHAR(64) NOT NULL,
+    synced_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    FOREIGN KEY (applicant_id) REFERENCES ApplicantProfile(applicant_id) ON DELETE CASCADE
+);
+
 -- Additional table for keyword tracking (for analytics)
 CREATE TABLE IF NOT EXISTS SearchKeywords (
     keyword_id INT AUTO_INCREMENT PRIMARY KEY,
@@ -49,9 +70,16 @@ CREATE INDEX idx_application_role ON ApplicationDetail(application_role);
 CREATE INDEX idx_cv_path ON ApplicationDetail(cv_path);
 CREATE INDEX idx_application_status ON ApplicationDetail(application_status);
 CREATE INDEX idx_applied_date ON ApplicationDetail(applied_date);
+CREATE INDEX idx_detail_applicant ON ApplicationDetail(applicant_id);
+
+-- FULLTEXT indexes for MATCH ... AGAINST searches (instead of LIKE '%term%' table scans)
+CREATE FULLTEXT INDEX ft_applicant_name ON ApplicantProfile(first_name, last_name);
+CREATE FULLTEXT INDEX ft_applicant_skills ON ApplicantProfile(skills);
+CREATE FULLTEXT INDEX ft_applicant_profile ON ApplicantProfile(summary, skills, experience, education);
+CREATE FULLTEXT INDEX ft_application_role ON ApplicationDetail(application_role);
 
 -- Create view for easy joins
-CREATE VIEW ApplicantDetails AS
+CREATE OR REPLACE VIEW ApplicantDetails AS
 SELECT 
     ap.applicant_id,
     ap.first_name,
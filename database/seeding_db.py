@@ -1,16 +1,17 @@
 import os
+import sys
+import json
+import time
+import uuid
 import logging
-import pymysql
-from faker import Faker
-
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(message)s",
-    handlers=[
-        logging.FileHandler("cv_seeding.log", mode='w', encoding="utf-8"),
-        logging.StreamHandler()
-    ]
-)
+import argparse
+
+# Add project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.ekstrak_regex import build_cv_content
+from config import APP_CONFIG
+from utils.corpus_fingerprint import file_fingerprint
 
 DB_CONFIG = {
     'host': 'localhost',
@@ -18,17 +19,39 @@ DB_CONFIG = {
     'user': 'root',
     'password': 'root',
     'database': 'ats_db',
-    'charset': 'utf8mb4',
-    'cursorclass': pymysql.cursors.DictCursor
+    'charset': 'utf8mb4'
 }
 
 DATA_DIR = "data"
-fake = Faker('id_ID')
+_fake = None
+
+# Email dibuat unik per proses (token + nomor urut) supaya applicant_id bisa dicari sekaligus lewat email
+_email_token = uuid.uuid4().hex[:8]
+_email_counter = 0
 
 
-def get_dataset_files(data_folder_path: str) -> list:
+def get_fake():
     """
-    Mengambil 20 file CV pertama dari setiap folder.
+    Instance Faker, dibuat saat pertama kali dipakai (import faker cukup lambat).
+    """
+    global _fake
+    if _fake is None:
+        from faker import Faker
+        _fake = Faker('id_ID')
+    return _fake
+
+
+def connect_db():
+    """
+    Koneksi PyMySQL dengan DictCursor (pymysql baru di-import di sini).
+    """
+    import pymysql
+    return pymysql.connect(cursorclass=pymysql.cursors.DictCursor, **DB_CONFIG)
+
+
+def get_dataset_files(data_folder_path: str, limit_per_category: int = 20) -> list:
+    """
+    Mengambil N file CV pertama dari setiap folder (0 atau None = semua file).
     """
     all_selected_files = []
     try:
@@ -41,7 +64,7 @@ def get_dataset_files(data_folder_path: str) -> list:
         category_path = os.path.join(data_folder_path, category)
         try:
             files_in_category = sorted([f for f in os.listdir(category_path) if f.lower().endswith('.pdf')])
-            selected_files = files_in_category[:20]
+            selected_files = files_in_category[:limit_per_category] if limit_per_category else files_in_category
             for file_name in selected_files:
                 full_path = os.path.join(category_path, file_name)
                 all_selected_files.append(os.path.normpath(full_path))
@@ -51,64 +74,204 @@ def get_dataset_files(data_folder_path: str) -> list:
     return all_selected_files
 
 
-def main():
+def flatten_section(items) -> str:
+    """
+    Ubah satu section hasil extract_details_regex menjadi teks biasa
+    (untuk kolom summary/skills/experience/education di ApplicantProfile).
+    """
+    lines = []
+    for item in items:
+        if isinstance(item, dict):
+            lines.append(f"{item['periode']} {item['info_jabatan']}")
+            lines.extend(item['deskripsi'])
+        else:
+            lines.append(item)
+    return "\n".join(lines)
+
+
+def fake_profile() -> dict:
+    """
+    Buat data profil palsu (nama, telepon, alamat, tanggal lahir) dengan Faker.
+    """
+    global _email_counter
+    _email_counter += 1
+    fake = get_fake()
+    full_name = fake.name()
+    name_parts = full_name.split()
+    birth_date_obj = fake.date_of_birth(minimum_age=22, maximum_age=55)
+    return {
+        'first_name': name_parts[0],
+        'last_name': " ".join(name_parts[1:]) if len(name_parts) > 1 else '',
+        'email': f"{fake.user_name()}.{_email_token}{_email_counter}@{fake.free_email_domain()}",
+        'phone_number': fake.phone_number(),
+        'address': fake.address(),
+        'date_of_birth': birth_date_obj.strftime('%Y-%m-%d'),
+    }
+
+
+def section_columns(content) -> tuple:
+    """
+    Nilai kolom summary, skills, experience, education dari hasil build_cv_content.
+    """
+    sections = content['sections'] if content else {}
+    return tuple(
+        flatten_section(sections.get(name, []))
+        for name in ('summary', 'skills', 'experience', 'education')
+    )
+
+
+SQL_PROFILE = """
+    INSERT INTO ApplicantProfile
+    (first_name, last_name, email, phone_number, address, date_of_birth,
+     summary, skills, experience, education)
+    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+"""
+
+SQL_DETAIL = "INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (%s, %s, %s)"
+
+SQL_CONTENT = """
+    INSERT INTO CVContent (applicant_id, content_hash, cv_text, sections)
+    VALUES (%s, %s, %s, %s)
+    ON DUPLICATE KEY UPDATE
+        content_hash = VALUES(content_hash),
+        cv_text = VALUES(cv_text),
+        sections = VALUES(sections)
+"""
+
+# Fingerprint file CV untuk sync_corpus (path, mtime, ukuran, hash isi)
+SQL_FINGERPRINT = """
+    INSERT INTO CorpusFile (cv_path, applicant_id, mtime_ns, size, file_hash)
+    VALUES (%s, %s, %s, %s, %s)
+    ON DUPLICATE KEY UPDATE
+        applicant_id = VALUES(applicant_id),
+        mtime_ns = VALUES(mtime_ns),
+        size = VALUES(size),
+        file_hash = VALUES(file_hash)
+"""
+
+
+def profile_row(profile: dict, content) -> tuple:
+    return (
+        profile['first_name'], profile['last_name'], profile['email'], profile['phone_number'],
+        profile['address'], profile['date_of_birth']
+    ) + section_columns(content)
+
+
+def detail_row(applicant_id: int, cv_path: str) -> tuple:
+    category = os.path.basename(os.path.dirname(cv_path))
+    return (applicant_id, category, cv_path)
+
+
+def content_row(applicant_id: int, content: dict) -> tuple:
+    return (applicant_id, content['content_hash'], content['cv_text'], json.dumps(content['sections']))
+
+
+def save_cv_content(cursor, applicant_id: int, content: dict):
+    """
+    Simpan (atau perbarui) teks dan section CV di CVContent.
+    """
+    cursor.execute(SQL_CONTENT, content_row(applicant_id, content))
+
+
+def insert_batch(cursor, cv_paths: list, contents: list, fingerprints: dict = None) -> dict:
+    """
+    Simpan satu batch CV baru dengan executemany (PyMySQL menggabungkannya menjadi
+    INSERT multi-baris). applicant_id diambil sekaligus lewat email yang unik.
+    Fingerprint CorpusFile ikut disimpan di transaksi yang sama, supaya sync_corpus
+    berikutnya tidak memproses ulang CV ini. fingerprints: dict cv_path ->
+    (mtime_ns, size, file_hash); jika None, dihitung dari file.
+    Mengembalikan dict cv_path -> applicant_id.
+    """
+    profiles = [fake_profile() for _ in cv_paths]
+    cursor.executemany(SQL_PROFILE, [
+        profile_row(profile, content) for profile, content in zip(profiles, contents)
+    ])
+
+    emails = [profile['email'] for profile in profiles]
+    placeholders = ", ".join(["%s"] * len(emails))
+    cursor.execute(f"SELECT applicant_id, email FROM ApplicantProfile WHERE email IN ({placeholders})", emails)
+    id_by_email = {row['email']: row['applicant_id'] for row in cursor.fetchall()}
+    applicant_ids = {cv_path: id_by_email[profile['email']] for cv_path, profile in zip(cv_paths, profiles)}
+
+    cursor.executemany(SQL_DETAIL, [detail_row(applicant_ids[cv_path], cv_path) for cv_path in cv_paths])
+    content_rows = [
+        content_row(applicant_ids[cv_path], content)
+        for cv_path, content in zip(cv_paths, contents) if content
+    ]
+    if content_rows:
+        cursor.executemany(SQL_CONTENT, content_rows)
+
+    if fingerprints is None:
+        fingerprints = {cv_path: file_fingerprint(cv_path) for cv_path in cv_paths}
+    fingerprint_rows = [
+        (cv_path, applicant_ids[cv_path], *fingerprints[cv_path])
+        for cv_path in cv_paths if fingerprints.get(cv_path)
+    ]
+    if fingerprint_rows:
+        cursor.executemany(SQL_FINGERPRINT, fingerprint_rows)
+    return applicant_ids
+
+
+def main(batch_size: int = None, limit_per_category: int = 20):
     """
     Fungsi utama untuk menjalankan alur seeding.
-    Menggunakan metode TRUNCATE untuk mereset database.
+    CV disimpan per batch dan di-commit setiap batch_size baris.
     """
+    # Logging dikonfigurasi di sini (bukan saat import) supaya sync_corpus bisa memakai helper di file ini
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s [%(levelname)s] %(message)s",
+        handlers=[
+            logging.FileHandler("cv_seeding.log", mode='w', encoding="utf-8"),
+            logging.StreamHandler()
+        ]
+    )
+    batch_size = batch_size or APP_CONFIG.get('seed_batch_size', 500)
     logging.info("Memulai proses seeding.")
-    cv_files = get_dataset_files(DATA_DIR)
+    cv_files = get_dataset_files(DATA_DIR, limit_per_category)
     if not cv_files:
         return
-    logging.info(f"Ditemukan {len(cv_files)} file untuk diproses.")
+    logging.info(f"Ditemukan {len(cv_files)} file untuk diproses (batch {batch_size}).")
 
     conn = None
     try:
-        conn = pymysql.connect(**DB_CONFIG)
+        conn = connect_db()
         cursor = conn.cursor()
         logging.info("Koneksi database berhasil.")
 
-        for cv_path in cv_files:
-            filename = os.path.basename(cv_path)
-            logging.info(f"Memproses: {filename}")
+        start = time.perf_counter()
+        inserted = 0
+        for offset in range(0, len(cv_files), batch_size):
+            batch = cv_files[offset:offset + batch_size]
 
-            full_name = fake.name()
-            name_parts = full_name.split()
-            first_name = name_parts[0]
-            last_name = " ".join(name_parts[1:]) if len(name_parts) > 1 else ''
-            phone = fake.phone_number()
-            address = fake.address()
-            birth_date_obj = fake.date_of_birth(minimum_age=22, maximum_age=55)
-            birth_date_str = birth_date_obj.strftime('%Y-%m-%d')
+            # Ekstraksi PDF hanya sekali saat ingest; hasilnya disimpan di CVContent
+            contents = [build_cv_content(cv_path) for cv_path in batch]
+            for cv_path, content in zip(batch, contents):
+                if not content:
+                    logging.warning(f"Teks tidak dapat diekstrak dari {os.path.basename(cv_path)}, CVContent dilewati.")
 
             try:
-                sql_profile = """
-                    INSERT INTO ApplicantProfile
-                    (first_name, last_name, phone_number, address, date_of_birth)
-                    VALUES (%s, %s, %s, %s, %s)
-                """
-                cursor.execute(sql_profile, (
-                    first_name, last_name, phone, address, birth_date_str
-                ))
-                applicant_id = cursor.lastrowid
-
-                category = os.path.basename(os.path.dirname(cv_path))
-                sql_detail = "INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (%s, %s, %s)"
-                cursor.execute(sql_detail, (applicant_id, category, cv_path))
-
-                logging.info(f"Data untuk '{full_name}' (ID: {applicant_id}) disimpan.")
-
+                insert_batch(cursor, batch, contents)
+                conn.commit()
+                inserted += len(batch)
             except Exception as e:
-                logging.error(f"Gagal menyimpan {filename}: {e}")
+                logging.error(f"Gagal menyimpan batch {offset // batch_size + 1}: {e}")
                 conn.rollback()
+                continue
+
+            elapsed = time.perf_counter() - start
+            logging.info(f"{inserted}/{len(cv_files)} CV disimpan ({inserted / elapsed:.0f} baris/detik).")
 
-        conn.commit()
-        logging.info("Proses seeding selesai.")
+        elapsed = time.perf_counter() - start
+        rate = inserted / elapsed if elapsed else 0.0
+        logging.info(f"Proses seeding selesai: {inserted} CV dalam {elapsed:.2f} detik ({rate:.0f} baris/detik).")
 
     except Exception as e:
-        if e.errno == 1045:
+        # Kode error MySQL ada di args[0] (PyMySQL tidak punya atribut errno)
+        error_code = e.args[0] if e.args else None
+        if error_code == 1045:
             logging.error(f"Koneksi Gagal: Akses ditolak untuk user '{DB_CONFIG['user']}'.")
-        elif e.errno == 1049:
+        elif error_code == 1049:
             logging.error(f"Database '{DB_CONFIG['database']}' tidak ditemukan.")
         else:
             logging.error(f"Kesalahan database: {e}")
@@ -120,4 +283,8 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Seeding database ATS dari folder data/")
+    parser.add_argument('--batch-size', type=int, help="Jumlah baris per batch/commit")
+    parser.add_argument('--per-category', type=int, default=20, help="Jumlah CV per kategori (0 = semua)")
+    args = parser.parse_args()
+    main(args.batch_size, args.per_category)
@@ -0,0 +1,168 @@
+import os
+import sys
+import time
+import logging
+import argparse
+
+# Add project root to Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.ekstrak_regex import build_cv_content
+from database.seeding_db import (DATA_DIR, SQL_FINGERPRINT, connect_db, insert_batch, save_cv_content,
+                                 section_columns)
+from config import APP_CONFIG
+from utils.corpus_fingerprint import safe_file_hash, scan_corpus, plan_sync
+
+# Commit setiap sejumlah file yang diproses, supaya transaksi tidak terlalu besar
+COMMIT_EVERY = 100
+
+
+def save_fingerprint(cursor, cv_path: str, applicant_id: int, mtime_ns: int, size: int, file_hash: str):
+    """
+    Simpan (atau perbarui) fingerprint sebuah file di CorpusFile.
+    """
+    cursor.execute(SQL_FINGERPRINT, (cv_path, applicant_id, mtime_ns, size, file_hash))
+
+
+def load_fingerprints(cursor) -> tuple:
+    """
+    Ambil semua fingerprint, serta CV di ApplicationDetail yang belum punya fingerprint.
+    """
+    cursor.execute("SELECT cv_path, applicant_id, mtime_ns, size, file_hash FROM CorpusFile")
+    stored = {row['cv_path']: row for row in cursor.fetchall()}
+
+    cursor.execute("""
+        SELECT ad.cv_path, ad.applicant_id
+        FROM ApplicationDetail ad
+        LEFT JOIN CorpusFile cf ON ad.cv_path = cf.cv_path
+        WHERE cf.cv_path IS NULL
+    """)
+    untracked = {row['cv_path']: row['applicant_id'] for row in cursor.fetchall()}
+    return stored, untracked
+
+
+def apply_plan(conn, plan: dict, scanned: dict, batch_size: int = None) -> int:
+    """
+    Jalankan rencana sinkronisasi. Mengembalikan jumlah file yang diproses.
+    File baru disimpan per batch seperti seeding_db.
+    """
+    batch_size = batch_size or APP_CONFIG.get('seed_batch_size', 500)
+    cursor = conn.cursor()
+    processed = 0
+
+    def checkpoint():
+        nonlocal processed
+        processed += 1
+        if processed % COMMIT_EVERY == 0:
+            conn.commit()
+            logging.info(f"{processed} perubahan disimpan.")
+
+    for offset in range(0, len(plan['new']), batch_size):
+        batch = []
+        hashes = {}
+        for cv_path in plan['new'][offset:offset + batch_size]:
+            file_hash = safe_file_hash(cv_path)
+            if file_hash is not None:
+                batch.append(cv_path)
+                hashes[cv_path] = file_hash
+        if not batch:
+            continue
+        contents = [build_cv_content(cv_path) for cv_path in batch]
+        insert_batch(cursor, batch, contents,
+                     {cv_path: (*scanned[cv_path], hashes[cv_path]) for cv_path in batch})
+        conn.commit()
+        processed += len(batch)
+        logging.info(f"Baru: {processed}/{len(plan['new'])} CV disimpan.")
+
+    for cv_path, applicant_id, file_hash in plan['changed']:
+        if file_hash is None:
+            continue
+        content = build_cv_content(cv_path)
+        cursor.execute("""
+            UPDATE ApplicantProfile
+            SET summary = %s, skills = %s, experience = %s, education = %s
+            WHERE applicant_id = %s
+        """, section_columns(content) + (applicant_id,))
+        if content:
+            save_cv_content(cursor, applicant_id, content)
+        else:
+            cursor.execute("DELETE FROM CVContent WHERE applicant_id = %s", (applicant_id,))
+        save_fingerprint(cursor, cv_path, applicant_id, *scanned[cv_path], file_hash)
+        logging.info(f"Diperbarui: {cv_path} (ID: {applicant_id})")
+        checkpoint()
+
+    for cv_path, applicant_id, file_hash in plan['touched']:
+        save_fingerprint(cursor, cv_path, applicant_id, *scanned[cv_path], file_hash)
+        checkpoint()
+
+    for cv_path, applicant_id in plan['deleted']:
+        # ApplicationDetail, CVContent dan CorpusFile ikut terhapus (ON DELETE CASCADE)
+        cursor.execute("DELETE FROM ApplicantProfile WHERE applicant_id = %s", (applicant_id,))
+        logging.info(f"Dihapus: {cv_path} (ID: {applicant_id})")
+        checkpoint()
+
+    conn.commit()
+    cursor.close()
+    return processed
+
+
+def main():
+    """
+    Sinkronisasi inkremental folder data/ dengan database:
+    hanya CV baru, berubah, atau terhapus yang diproses.
+    """
+    parser = argparse.ArgumentParser(description="Sinkronisasi inkremental korpus CV ke database")
+    parser.add_argument('--data-dir', default=DATA_DIR, help="Folder berisi PDF CV per kategori")
+    parser.add_argument('--dry-run', action='store_true', help="Tampilkan rencana tanpa mengubah database")
+    args = parser.parse_args()
+
+    # Logging dan pymysql disiapkan di sini (bukan saat import), seperti seeding_db
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s [%(levelname)s] %(message)s",
+        handlers=[
+            logging.FileHandler("cv_sync.log", mode='w', encoding="utf-8"),
+            logging.StreamHandler()
+        ]
+    )
+    import pymysql
+
+    start = time.perf_counter()
+    scanned = scan_corpus(args.data_dir)
+    scan_time = time.perf_counter() - start
+    logging.info(f"{len(scanned)} file dipindai dalam {scan_time:.2f} detik.")
+
+    conn = None
+    try:
+        conn = connect_db()
+        cursor = conn.cursor()
+        stored, untracked = load_fingerprints(cursor)
+        cursor.close()
+
+        plan = plan_sync(scanned, stored, untracked)
+        logging.info(
+            f"Baru: {len(plan['new'])}, berubah: {len(plan['changed'])}, "
+            f"metadata saja: {len(plan['touched'])}, dihapus: {len(plan['deleted'])}, "
+            f"tidak berubah: {plan['unchanged']}"
+        )
+
+        processed = 0
+        if not args.dry_run:
+            processed = apply_plan(conn, plan, scanned)
+
+        elapsed = time.perf_counter() - start
+        rate = len(scanned) / elapsed if elapsed else 0.0
+        logging.info(
+            f"Sinkronisasi selesai dalam {elapsed:.2f} detik: {processed} perubahan, "
+            f"{rate:.0f} file/detik."
+        )
+
+    except pymysql.MySQLError as e:
+        logging.error(f"Kesalahan database: {e}")
+    finally:
+        if conn:
+            conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,9 @@ import webbrowser
 from typing import List, Dict
 import json
 import sys
+import time
+import threading
+import queue
 
 # Add project root to path
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -15,15 +18,24 @@ sys.path.insert(0, project_root)
 # Check for required imports
 try:
     from database.database import DatabaseConnection
-    from config import DB_CONFIG
+    from config import DB_CONFIG, DB_POOL_CONFIG, APP_CONFIG
     from src.cv_matcher import CVMatcher
-    from src.ekstrak_regex import extract_details_regex, extract_regex
+    from src.sharding import ShardedSearch
+    from src.stage_timing import STAGE_LABELS
 except ImportError as e:
     print(f"Import Error: {e}")
     print("Some features may not be available.")
     # Continue anyway for basic functionality
 
 class ATSApplication:
+    # Boyer-Moore variant shown in the GUI -> algorithm name for CVMatcher
+    BM_VARIANTS = {
+        "Bad Character": "boyer_moore",
+        "Good Suffix": "bm_full",
+        "Horspool": "horspool",
+        "Sunday": "sunday",
+    }
+    
     def __init__(self, root):
         self.root = root
         self.root.title("ATS - Applicant Tracking System")
@@ -34,24 +46,53 @@ class ATSApplication:
             port=DB_CONFIG['port'],
             user=DB_CONFIG['user'],
             password=DB_CONFIG['password'],
-            database=DB_CONFIG['database']
+            database=DB_CONFIG['database'],
+            use_fulltext=APP_CONFIG.get('fulltext_search', False),
+            **DB_POOL_CONFIG
         )
         
-        # Initialize CV matcher
+        # Initialize CV matcher (shares the connection pool with the GUI)
         try:
             self.cv_matcher = CVMatcher()
+            self.sharded_search = ShardedSearch()
         except:
             self.cv_matcher = None
-        
-        # Connect to database
-        if not self.db.connect():
-            messagebox.showwarning("Database Warning", 
-                "Database connection failed. Please check your database settings.")
+            self.sharded_search = None
         
         self.current_results = []
-        self.timing_info = {}        
+        self.timing_info = {}
+        
+        # Background search state
+        self.search_thread = None
+        self.search_queue = None
+        self.cancel_event = None
+        self.db_queue = None
         self.setup_ui()
         
+        # Connect once the window is up so a slow database does not delay the first frame
+        self.root.after(100, self.connect_database)
+    
+    def connect_database(self):
+        """Connect to the database on a background thread"""
+        self.summary_label.config(text="🔌 Connecting to database...")
+        self.db_queue = queue.Queue()
+        threading.Thread(target=lambda: self.db_queue.put(self.db.connect()), daemon=True).start()
+        self.root.after(100, self._poll_database_connection)
+    
+    def _poll_database_connection(self):
+        """Main thread: report the result of connect_database"""
+        try:
+            connected = self.db_queue.get_nowait()
+        except queue.Empty:
+            self.root.after(100, self._poll_database_connection)
+            return
+        
+        if not self.current_results:
+            self.summary_label.config(text="No search performed yet.")
+        if not connected:
+            messagebox.showwarning("Database Warning", 
+                "Database connection failed. Please check your database settings.")
+        
     def setup_ui(self):
         """Setup the user interface"""
         # Create canvas and scrollbar for scrolling functionality
@@ -118,11 +159,32 @@ class ATSApplication:
         
         # Boyer-Moore Radio Button with description
         bm_frame = ttk.Frame(algorithm_frame)
-        bm_frame.pack(fill=tk.X)
+        bm_frame.pack(fill=tk.X, pady=(0, 5))
         ttk.Radiobutton(bm_frame, text="BM (Boyer-Moore)", 
                        variable=self.algorithm_var, value="boyer_moore").pack(side=tk.LEFT)
         ttk.Label(bm_frame, text="- Efficient for large texts", 
                  font=("Arial", 9), foreground="gray").pack(side=tk.LEFT, padx=(10, 0))
+        
+        # Boyer-Moore variant (shift rule) selector
+        self.bm_variant_var = tk.StringVar(value="Bad Character")
+        ttk.Combobox(bm_frame, textvariable=self.bm_variant_var,
+                    values=list(self.BM_VARIANTS), width=14, state="readonly").pack(side=tk.LEFT, padx=(10, 0))
+        
+        # Aho-Corasick Radio Button with description
+        ac_frame = ttk.Frame(algorithm_frame)
+        ac_frame.pack(fill=tk.X, pady=(0, 5))
+        ttk.Radiobutton(ac_frame, text="AC (Aho-Corasick)", 
+                       variable=self.algorithm_var, value="ac").pack(side=tk.LEFT)
+        ttk.Label(ac_frame, text="- All keywords in a single pass", 
+                 font=("Arial", 9), foreground="gray").pack(side=tk.LEFT, padx=(10, 0))
+        
+        # Native (C-level str.find / regex) Radio Button with description
+        native_frame = ttk.Frame(algorithm_frame)
+        native_frame.pack(fill=tk.X)
+        ttk.Radiobutton(native_frame, text="Native (str.find / regex)", 
+                       variable=self.algorithm_var, value="native").pack(side=tk.LEFT)
+        ttk.Label(native_frame, text="- Built-in C search, fastest baseline", 
+                 font=("Arial", 9), foreground="gray").pack(side=tk.LEFT, padx=(10, 0))
           # Top matches selector with better labeling
         ttk.Label(input_frame, text="Number of Top Results:").grid(row=2, column=0, sticky=tk.W, pady=(15, 5))
         top_matches_frame = ttk.Frame(input_frame)
@@ -152,14 +214,29 @@ class ATSApplication:
         def update_threshold_label(*args):
             self.threshold_label.config(text=f"{self.threshold_var.get():.1f}")
         self.threshold_var.trace('w', update_threshold_label)
+        
+        # Role filter: only the shards of these roles are searched
+        ttk.Label(input_frame, text="Role Filter:").grid(row=4, column=0, sticky=tk.W, pady=(10, 5))
+        role_frame = ttk.Frame(input_frame)
+        role_frame.grid(row=4, column=1, sticky=tk.W, pady=(10, 5), padx=(10, 0))
+        
+        self.roles_entry = ttk.Entry(role_frame, width=40)
+        self.roles_entry.pack(side=tk.LEFT)
+        ttk.Label(role_frame, text="comma-separated, empty = all roles", 
+                 font=("Arial", 9), foreground="gray").pack(side=tk.LEFT, padx=(5, 0))
           # Search button with enhanced styling
-        search_btn = ttk.Button(input_frame, text="🔍 Search CVs", command=self.search_cvs, 
-                               style="Accent.TButton")
-        search_btn.grid(row=4, column=0, columnspan=2, pady=(20, 0))
+        self.search_btn = ttk.Button(input_frame, text="🔍 Search CVs", command=self.search_cvs, 
+                                    style="Accent.TButton")
+        self.search_btn.grid(row=5, column=0, columnspan=2, pady=(20, 0))
+        
+        # Cancel button (enabled while a search is running)
+        self.cancel_btn = ttk.Button(input_frame, text="⏹ Cancel", command=self.cancel_search,
+                                    state=tk.DISABLED)
+        self.cancel_btn.grid(row=6, column=0, columnspan=2, pady=(5, 0))
         
         # Clear button
         clear_btn = ttk.Button(input_frame, text="🗑️ Clear Results", command=self.clear_results)
-        clear_btn.grid(row=4, column=1, sticky=tk.E, pady=(20, 0), padx=(10, 0))
+        clear_btn.grid(row=5, column=1, sticky=tk.E, pady=(20, 0), padx=(10, 0))
         
         # Results Section
         results_frame = ttk.LabelFrame(main_frame, text="Search Results", padding="15")
@@ -188,6 +265,10 @@ class ATSApplication:
         self.cvs_processed_label = ttk.Label(performance_frame, text="0", font=("Arial", 9))
         self.cvs_processed_label.grid(row=1, column=3, sticky=tk.W, padx=(10, 0))
         
+        ttk.Label(performance_frame, text="Stage Breakdown:", font=("Arial", 9, "bold")).grid(row=2, column=0, sticky=(tk.W, tk.N), pady=(5, 0))
+        self.stage_breakdown_label = ttk.Label(performance_frame, text="-", font=("Arial", 9), justify=tk.LEFT)
+        self.stage_breakdown_label.grid(row=2, column=1, columnspan=3, sticky=tk.W, padx=(10, 0), pady=(5, 0))
+        
         # Results summary section
         self.summary_label = ttk.Label(results_frame, text="No search performed yet.", 
                                       font=("Arial", 11), foreground="gray")
@@ -240,7 +321,10 @@ class ATSApplication:
         style = ttk.Style()
         style.configure("Accent.TButton", font=("Arial", 11, "bold"))
     def search_cvs(self):
-        """Perform CV search based on user input"""
+        """Start a CV search on a background worker thread"""
+        if self.search_thread is not None and self.search_thread.is_alive():
+            return
+        
         keywords_text = self.keywords_entry.get().strip()
         if not keywords_text:
             messagebox.showwarning("Input Error", "Please enter keywords to search.")
@@ -248,6 +332,8 @@ class ATSApplication:
         
         keywords = [kw.strip().lower() for kw in keywords_text.split(",") if kw.strip()]
         algorithm = self.algorithm_var.get()
+        if algorithm == "boyer_moore":
+            algorithm = self.BM_VARIANTS.get(self.bm_variant_var.get(), algorithm)
         
         # Get top matches setting
         top_matches_text = self.top_matches_var.get()
@@ -259,35 +345,114 @@ class ATSApplication:
             except ValueError:
                 top_matches = 10
         
+        roles = [role.strip() for role in self.roles_entry.get().split(",") if role.strip()]
+        
         # Update CV matcher threshold
         self.cv_matcher.similarity_threshold = self.threshold_var.get()
-        
-        # Get all CV data from database
-        cv_data_list = self.db.get_all_applicants()
-        if not cv_data_list:
-            messagebox.showinfo("No Data", "No CV data found in the database.")
-            return
+        if self.sharded_search:
+            self.sharded_search.similarity_threshold = self.threshold_var.get()
         
         # Show loading message
         self.summary_label.config(text="🔍 Searching CVs... Please wait.")
-        self.root.update()
-        
+        self.search_btn.config(state=tk.DISABLED)
+        self.cancel_btn.config(state=tk.NORMAL)
+        
+        self.cancel_event = threading.Event()
+        self.search_queue = queue.Queue()
+        self.search_thread = threading.Thread(
+            target=self._run_search,
+            args=(keywords, algorithm, top_matches, roles, self.cancel_event, self.search_queue),
+            daemon=True
+        )
+        self.search_thread.start()
+        self.root.after(100, self._poll_search_queue)
+    
+    def _run_search(self, keywords, algorithm, top_matches, roles, cancel_event, search_queue):
+        """Worker thread: run the search and report back through the queue (no Tk calls here)"""
         try:
-            # Perform enhanced search with ranking
-            results, timing_info = self.cv_matcher.search_cvs(cv_data_list, keywords, algorithm, top_matches)
-            
-            # Store results and timing
-            self.current_results = results
-            self.timing_info = timing_info
+            # Get all CV data from database
+            fetch_start = time.perf_counter_ns()
+            cv_data_list = self.db.get_all_applicants()
+            fetch_time_ns = time.perf_counter_ns() - fetch_start
+            if not cv_data_list:
+                search_queue.put(('no_data',))
+                return
             
-            # Update UI displays
-            self.update_results_display()
-            self.update_performance_display()
+            def report_progress(processed, total, partial_results):
+                search_queue.put(('progress', processed, total, partial_results))
             
+            # Perform enhanced search with ranking (per role shard when filtering by role)
+            if self.sharded_search and (roles or APP_CONFIG.get('sharded_search')):
+                results, timing_info = self.sharded_search.search(
+                    cv_data_list, keywords, algorithm, top_matches, roles=roles,
+                    progress_callback=report_progress, cancel_event=cancel_event,
+                    fetch_time_ns=fetch_time_ns
+                )
+            else:
+                results, timing_info = self.cv_matcher.search_cvs(
+                    cv_data_list, keywords, algorithm, top_matches,
+                    progress_callback=report_progress, cancel_event=cancel_event,
+                    fetch_time_ns=fetch_time_ns
+                )
+            search_queue.put(('done', results, timing_info))
         except Exception as e:
-            messagebox.showerror("Search Error", f"An error occurred during search: {str(e)}")
-            self.summary_label.config(text="❌ Search failed.")
-            print(f"Search error details: {e}")  # For debugging
+            search_queue.put(('error', e))
+    
+    def _poll_search_queue(self):
+        """Apply messages from the search worker to the UI"""
+        finished = False
+        latest_progress = None  # Only the newest progress report is drawn, older ones are stale
+        try:
+            while True:
+                message = self.search_queue.get_nowait()
+                kind = message[0]
+                
+                if kind == 'progress':
+                    latest_progress = message
+                elif kind == 'done':
+                    _, results, timing_info = message
+                    # Store results and timing
+                    self.current_results = results
+                    self.timing_info = timing_info
+                    
+                    # Update UI displays
+                    self.update_results_display()
+                    self.update_performance_display()
+                    finished = True
+                elif kind == 'no_data':
+                    messagebox.showinfo("No Data", "No CV data found in the database.")
+                    self.summary_label.config(text="No search performed yet.")
+                    finished = True
+                elif kind == 'error':
+                    error = message[1]
+                    messagebox.showerror("Search Error", f"An error occurred during search: {str(error)}")
+                    self.summary_label.config(text="❌ Search failed.")
+                    print(f"Search error details: {error}")  # For debugging
+                    finished = True
+        except queue.Empty:
+            pass
+        
+        if latest_progress is not None and not finished:
+            _, processed, total, partial_results = latest_progress
+            self.current_results = partial_results
+            self.update_results_display()
+            self.cvs_processed_label.config(text=f"{processed}/{total}")
+            self.summary_label.config(
+                text=f"🔍 Searching CVs... {processed}/{total} processed, "
+                     f"top {len(partial_results)} matches so far")
+        
+        if finished:
+            self.search_btn.config(state=tk.NORMAL)
+            self.cancel_btn.config(state=tk.DISABLED)
+        else:
+            self.root.after(100, self._poll_search_queue)
+    
+    def cancel_search(self):
+        """Ask the running search to stop; results found so far are kept"""
+        if self.cancel_event is not None:
+            self.cancel_event.set()
+            self.summary_label.config(text="⏹ Cancelling search...")
+    
     def update_results_display(self):
         """Update the results treeview with enhanced information"""
         # Clear existing items
@@ -367,14 +532,12 @@ class ATSApplication:
         cv_data = result['cv_data']
         cv_path = cv_data['cv_path']
         
-        # Extract CV text and details
-        cv_text = self.cv_matcher.extract_cv_text(cv_path)
-        if not cv_text:
+        # CV details stored at ingest time (parsed from the PDF only for older rows)
+        cv_details = self.cv_matcher.get_cv_sections(cv_data)
+        if not cv_details:
             messagebox.showerror("Error", "Could not extract text from CV.")
             return
         
-        cv_details = extract_details_regex(cv_text)
-        
         # Create summary window
         summary_window = tk.Toplevel(self.root)
         summary_window.title(f"CV Summary - {cv_data['first_name']} {cv_data['last_name'] or ''}")
@@ -499,8 +662,15 @@ class ATSApplication:
     def on_closing(self):
         """Handle application closing"""
         try:
+            if self.cancel_event is not None:
+                self.cancel_event.set()
             if hasattr(self.db, 'close_connection'):
                 self.db.close_connection()
+            if self.cv_matcher:
+                self.cv_matcher.shutdown_executor()
+                self.cv_matcher.close_corpus_index()
+            if self.sharded_search:
+                self.sharded_search.shutdown_executor()
         except Exception as e:
             print(f"Warning: Could not close database connection: {e}")
         finally:
@@ -518,6 +688,7 @@ class ATSApplication:
         self.exact_time_label.config(text="0.000s")
         self.fuzzy_time_label.config(text="0.000s")
         self.cvs_processed_label.config(text="0")
+        self.stage_breakdown_label.config(text="-")
         
         # Clear internal data
         self.current_results = []
@@ -565,12 +736,41 @@ class ATSApplication:
                             result['exact_score'], result['fuzzy_score'], 
                             f"{result['total_score']:.1f}", ', '.join(keywords_found)
                         ])
+                    
+                    # Per-stage timing of the search that produced these results
+                    stage_timings = self.timing_info.get('stage_timings') if self.timing_info else None
+                    if stage_timings:
+                        writer.writerow([])
+                        writer.writerow(['Stage', 'Total (ms)', 'Samples', 'Min (ms)', 'Avg (ms)', 'Max (ms)'])
+                        for stage, timing in stage_timings.items():
+                            writer.writerow([
+                                STAGE_LABELS[stage], f"{timing['total_ms']:.3f}", timing['count'],
+                                f"{timing['min_ms']:.3f}", f"{timing['avg_ms']:.3f}", f"{timing['max_ms']:.3f}"
+                            ])
                 
                 messagebox.showinfo("Export Complete", f"Results exported to {filename}")
                 
         except Exception as e:
             messagebox.showerror("Export Error", f"Failed to export results: {str(e)}")
 
+    def format_stage_breakdown(self):
+        """One line per search stage: total time and per-CV min/avg/max"""
+        stage_timings = self.timing_info.get('stage_timings') if self.timing_info else None
+        if not stage_timings:
+            return "-"
+        lines = []
+        for stage, timing in stage_timings.items():
+            if not timing['count']:
+                continue
+            line = f"{STAGE_LABELS[stage]}: {timing['total_ms']:.1f}ms"
+            if timing['count'] > 1:
+                line += (f" (per CV min {timing['min_ms']:.2f} / avg {timing['avg_ms']:.2f}"
+                         f" / max {timing['max_ms']:.2f}ms)")
+            lines.append(line)
+        if self.timing_info.get('profile_path'):
+            lines.append(f"Profile: {self.timing_info['profile_path']}")
+        return "\n".join(lines)
+    
     def update_performance_display(self):
         """Update performance metrics display"""
         if not self.timing_info:
@@ -586,6 +786,7 @@ class ATSApplication:
         self.exact_time_label.config(text=f"{exact_time:.3f}s")
         self.fuzzy_time_label.config(text=f"{fuzzy_time:.3f}s")
         self.cvs_processed_label.config(text=str(total_cvs))
+        self.stage_breakdown_label.config(text=self.format_stage_breakdown())
         
         # Update summary
         total_results = len(self.current_results)
@@ -593,7 +794,21 @@ class ATSApplication:
         if exact_time > 0 or fuzzy_time > 0:
             total_time = exact_time + fuzzy_time
             summary_text += f" | Total processing time: {total_time:.3f}s"
-        
+        saved = self.timing_info.get('fuzzy_computations_saved', 0)
+        if saved:
+            summary_text += f" | Fuzzy comparisons reused: {saved}"
+        if self.timing_info.get('result_cache') == 'hit':
+            hits = self.timing_info.get('result_cache_hits', 0)
+            misses = self.timing_info.get('result_cache_misses', 0)
+            summary_text += f" | Served from result cache ({hits} hits / {misses} misses)"
+        shards = self.timing_info.get('shards')
+        if shards:
+            summary_text += f" | Roles searched: {len(shards)}"
+            if self.timing_info.get('shards_skipped'):
+                summary_text += f" ({self.timing_info['shards_skipped']} skipped)"
+        if self.timing_info.get('cancelled'):
+            summary_text += " | Search cancelled (partial results)"
+
         self.summary_label.config(text=summary_text)
 
 def main():
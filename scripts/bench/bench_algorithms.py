@@ -0,0 +1,325 @@
+"""
+Benchmark suite for the pattern matching algorithms on the real CV corpus
+
+Loads extracted CV texts from data/ (through the extraction cache) and runs
+every exact matching engine and every fuzzy matching engine across keyword
+lengths, hit rates and corpus sizes. Reports throughput (MB/s, CVs/s),
+per-CV latency percentiles and peak memory, and writes the results as JSON
+so that two runs can be compared.
+
+Usage:
+    python scripts/bench/bench_algorithms.py --sizes 100,500 --output bench.json
+    python scripts/bench/bench_algorithms.py --compare before.json after.json
+"""
+
+import os
+import sys
+import json
+import math
+import time
+import random
+import platform
+import argparse
+import tracemalloc
+from collections import Counter
+from datetime import datetime
+
+# Add project root to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, project_root)
+
+from algorithms.KMP import kmp_search_all, compile_kmp
+from algorithms.BM import boyer_moore_all, compile_bm
+from algorithms.native import native_search_all, compile_native
+from algorithms.levenshtein import levenshtein_distance, compile_levenshtein
+from config import APP_CONFIG, PATHS
+
+def compiled_engine(compile_pattern):
+    """Exact engine that compiles each pattern once and reuses it for every CV"""
+    searchers = {}
+    def searcher_for(pattern):
+        searcher = searchers.get(pattern)
+        if searcher is None:
+            searcher = searchers[pattern] = compile_pattern(pattern)
+        return searcher
+    def search(text, pattern):
+        return searcher_for(pattern).find_all(text)
+    search.searcher_for = searcher_for
+    return search
+
+def compiled_fuzzy_engine(compile_pattern):
+    """Fuzzy engine that compiles each keyword once and reuses it for every word"""
+    matchers = {}
+    def distance(keyword, word):
+        matcher = matchers.get(keyword)
+        if matcher is None:
+            matcher = matchers[keyword] = compile_pattern(keyword)
+        return matcher.distance(word)
+    return distance
+
+# Exact matching engines: name -> fn(text, pattern) -> list of positions
+EXACT_ENGINES = {
+    'kmp': kmp_search_all,
+    'bm': boyer_moore_all,
+    'kmp_compiled': compiled_engine(compile_kmp),
+    'bm_compiled': compiled_engine(compile_bm),
+    'bm_full': compiled_engine(lambda pattern: compile_bm(pattern, 'full')),
+    'horspool': compiled_engine(lambda pattern: compile_bm(pattern, 'horspool')),
+    'sunday': compiled_engine(lambda pattern: compile_bm(pattern, 'sunday')),
+    'native': native_search_all,
+    'native_compiled': compiled_engine(compile_native),
+}
+
+# Fuzzy matching engines: name -> fn(keyword, word) -> edit distance
+FUZZY_ENGINES = {
+    'levenshtein': levenshtein_distance,
+    'myers': compiled_fuzzy_engine(compile_levenshtein),
+}
+
+# Keyword length buckets (inclusive ranges)
+KEYWORD_LENGTHS = {
+    'short': (3, 4),
+    'medium': (6, 8),
+    'long': (11, 16),
+}
+
+# Fraction of keywords in a query that actually occur in the corpus
+HIT_RATES = {
+    'high': 1.0,
+    'low': 0.0,
+}
+
+KEYWORDS_PER_QUERY = 5
+
+
+def spread(items, limit):
+    """Evenly spaced sample of a list, so every category is represented"""
+    if limit >= len(items):
+        return list(items)
+    step = len(items) / limit
+    return [items[int(i * step)] for i in range(limit)]
+
+
+def load_corpus(data_dir, limit=None):
+    """Load lowercased extracted texts of the CVs under data_dir (sorted, optionally limited)"""
+    from src.ekstrak_regex import extract_regex
+    from utils.extraction_cache import get_extraction_cache
+
+    pdf_paths = []
+    for category in sorted(os.listdir(data_dir)):
+        category_path = os.path.join(data_dir, category)
+        if os.path.isdir(category_path):
+            pdf_paths.extend(
+                os.path.join(category_path, name)
+                for name in sorted(os.listdir(category_path)) if name.lower().endswith('.pdf')
+            )
+
+    if limit:
+        pdf_paths = spread(pdf_paths, limit)
+
+    cache = get_extraction_cache(os.path.join(project_root, APP_CONFIG['extraction_cache_path']))
+    texts = []
+    for path in pdf_paths:
+        text = cache.get_or_extract(path, extract_regex) if cache else extract_regex(path)
+        if text:
+            texts.append(text.lower())
+    return texts
+
+
+def build_queries(texts, seed=42):
+    """Build one keyword query for every (keyword length, hit rate) combination"""
+    rng = random.Random(seed)
+    vocabulary = Counter(word for text in texts for word in set(text.split()) if word.isalpha())
+
+    queries = {}
+    for length_name, (low, high) in KEYWORD_LENGTHS.items():
+        # Words of the right length that appear in many CVs
+        frequent = [word for word, _ in vocabulary.most_common() if low <= len(word) <= high][:50]
+        for rate_name, rate in HIT_RATES.items():
+            hits = round(KEYWORDS_PER_QUERY * rate)
+            keywords = rng.sample(frequent, min(hits, len(frequent)))
+            while len(keywords) < KEYWORDS_PER_QUERY:
+                # 'q' followed only by 'x'/'z' does not occur in CV text, so this is a guaranteed miss
+                size = rng.randint(low, high)
+                keywords.append('q' + ''.join(rng.choice('xz') for _ in range(size - 1)))
+            queries[(length_name, rate_name)] = keywords
+    return queries
+
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of a list of numbers"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = max(0, math.ceil(fraction * len(ordered)) - 1)
+    return ordered[index]
+
+
+def run_exact(engine, texts, keywords):
+    """Run an exact engine over every CV; returns per-CV latencies (s) and match count"""
+    latencies = []
+    total_matches = 0
+    for text in texts:
+        start = time.perf_counter()
+        for keyword in keywords:
+            total_matches += len(engine(text, keyword))
+        latencies.append(time.perf_counter() - start)
+    return latencies, total_matches
+
+
+def run_fuzzy(engine, texts, keywords):
+    """Run a fuzzy engine against every word of every CV; returns per-CV latencies (s) and comparisons"""
+    latencies = []
+    comparisons = 0
+    for text in texts:
+        words = text.split()
+        start = time.perf_counter()
+        for keyword in keywords:
+            for word in words:
+                engine(keyword, word)
+        latencies.append(time.perf_counter() - start)
+        comparisons += len(words) * len(keywords)
+    return latencies, comparisons
+
+
+def average_shift(engine, texts, keywords):
+    """Average pattern shift per alignment for Boyer-Moore family engines (None for others)"""
+    searcher_for = getattr(engine, 'searcher_for', None)
+    if searcher_for is None or not hasattr(searcher_for(keywords[0]), 'shift_stats'):
+        return None
+    alignments = 0
+    total_shift = 0.0
+    for keyword in keywords:
+        searcher = searcher_for(keyword)
+        for text in texts:
+            stats = searcher.shift_stats(text)
+            alignments += stats['alignments']
+            total_shift += stats['average_shift'] * stats['alignments']
+    return total_shift / alignments if alignments else 0.0
+
+
+def measure(kind, name, engine, texts, keywords, track_memory):
+    """Benchmark one engine on one corpus and query, returning a result record"""
+    runner = run_exact if kind == 'exact' else run_fuzzy
+    latencies, work = runner(engine, texts, keywords)
+
+    peak_memory = None
+    if track_memory:
+        # Separate pass, tracemalloc slows the code down and would skew the timings
+        tracemalloc.start()
+        runner(engine, texts, keywords)
+        peak_memory = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    total_time = sum(latencies)
+    total_bytes = sum(len(text) for text in texts)
+    return {
+        'kind': kind,
+        'engine': name,
+        'cvs': len(texts),
+        'keywords': keywords,
+        'total_time_s': total_time,
+        'mb_per_s': (total_bytes / 1e6) / total_time if total_time else 0.0,
+        'cvs_per_s': len(texts) / total_time if total_time else 0.0,
+        'p50_ms': percentile(latencies, 0.50) * 1000,
+        'p95_ms': percentile(latencies, 0.95) * 1000,
+        'peak_memory_kb': peak_memory / 1024 if peak_memory is not None else None,
+        'matches' if kind == 'exact' else 'comparisons': work,
+        'average_shift': average_shift(engine, texts, keywords) if kind == 'exact' else None,
+    }
+
+
+def run_suite(args):
+    sizes = [None if size == 'all' else int(size) for size in args.sizes.split(',')]
+    exact_names = [name for name in args.engines.split(',') if name in EXACT_ENGINES]
+    fuzzy_names = [name for name in args.engines.split(',') if name in FUZZY_ENGINES]
+
+    print("Loading corpus...")
+    full_corpus = load_corpus(args.data_dir, max(sizes) if None not in sizes else None)
+    queries = build_queries(full_corpus, args.seed)
+
+    results = []
+    for size in sizes:
+        texts = spread(full_corpus, size) if size else full_corpus
+        fuzzy_texts = texts[:args.fuzzy_cvs]
+        for (length_name, rate_name), keywords in queries.items():
+            for name in exact_names:
+                record = measure('exact', name, EXACT_ENGINES[name], texts, keywords, not args.no_memory)
+                record.update({'corpus_size': size or 'all', 'keyword_length': length_name, 'hit_rate': rate_name})
+                results.append(record)
+                print_record(record)
+            for name in fuzzy_names:
+                record = measure('fuzzy', name, FUZZY_ENGINES[name], fuzzy_texts, keywords, not args.no_memory)
+                record.update({'corpus_size': size or 'all', 'keyword_length': length_name, 'hit_rate': rate_name})
+                results.append(record)
+                print_record(record)
+
+    report = {
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'corpus_bytes': sum(len(text) for text in full_corpus),
+        'results': results,
+    }
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"\nResults written to {args.output}")
+    return report
+
+
+def record_key(record):
+    return (record['kind'], record['engine'], str(record['corpus_size']),
+            record['keyword_length'], record['hit_rate'])
+
+
+def print_record(record):
+    memory = f"{record['peak_memory_kb']:.0f}KB" if record['peak_memory_kb'] is not None else "-"
+    shift = f" shift={record['average_shift']:.2f}" if record.get('average_shift') is not None else ""
+    print(f"  {record['kind']:5} {record['engine']:15} n={str(record['corpus_size']):5} "
+          f"{record['keyword_length']:6} {record['hit_rate']:4} | "
+          f"{record['mb_per_s']:8.2f} MB/s {record['cvs_per_s']:9.1f} CVs/s "
+          f"p50={record['p50_ms']:8.3f}ms p95={record['p95_ms']:8.3f}ms peak={memory}{shift}")
+
+
+def compare_reports(before_path, after_path):
+    """Print throughput and latency changes between two JSON reports"""
+    with open(before_path, encoding='utf-8') as f:
+        before = {record_key(r): r for r in json.load(f)['results']}
+    with open(after_path, encoding='utf-8') as f:
+        after = {record_key(r): r for r in json.load(f)['results']}
+
+    print(f"{'benchmark':55} {'MB/s before':>12} {'MB/s after':>12} {'change':>8} {'p95 change':>11}")
+    for key in sorted(before.keys() & after.keys()):
+        old, new = before[key], after[key]
+        change = (new['mb_per_s'] / old['mb_per_s'] - 1) * 100 if old['mb_per_s'] else 0.0
+        p95_change = (new['p95_ms'] / old['p95_ms'] - 1) * 100 if old['p95_ms'] else 0.0
+        print(f"{' '.join(key):55} {old['mb_per_s']:12.2f} {new['mb_per_s']:12.2f} "
+              f"{change:+7.1f}% {p95_change:+10.1f}%")
+    for key in sorted(before.keys() ^ after.keys()):
+        print(f"{' '.join(key):55} only in {'before' if key in before else 'after'}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the ATS pattern matching algorithms")
+    parser.add_argument('--data-dir', default=os.path.join(project_root, PATHS['data_dir']),
+                        help="Folder with the CV PDFs")
+    parser.add_argument('--sizes', default='100,500', help="Comma-separated corpus sizes ('all' for everything)")
+    parser.add_argument('--engines', default=','.join(list(EXACT_ENGINES) + list(FUZZY_ENGINES)),
+                        help="Comma-separated engines to run")
+    parser.add_argument('--fuzzy-cvs', type=int, default=20,
+                        help="Maximum CVs used for fuzzy engines (they are much slower)")
+    parser.add_argument('--seed', type=int, default=42, help="Seed for keyword selection")
+    parser.add_argument('--no-memory', action='store_true', help="Skip the peak memory pass")
+    parser.add_argument('--output', help="Write results to this JSON file")
+    parser.add_argument('--compare', nargs=2, metavar=('BEFORE', 'AFTER'), help="Compare two JSON reports")
+    args = parser.parse_args()
+
+    if args.compare:
+        compare_reports(*args.compare)
+    else:
+        run_suite(args)
+
+
+if __name__ == "__main__":
+    main()
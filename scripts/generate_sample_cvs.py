@@ -10,10 +10,17 @@ from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, Tabl
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
 from reportlab.lib import colors
-from faker import Faker
 import random
 
-fake = Faker()
+_fake = None
+
+def get_fake():
+    """Faker instance, created on first use (importing faker is slow)"""
+    global _fake
+    if _fake is None:
+        from faker import Faker
+        _fake = Faker()
+    return _fake
 
 # Sample data for different roles
 ROLE_SKILLS = {
@@ -79,6 +86,7 @@ EXPERIENCE_TEMPLATES = {
 
 def generate_cv_content(role):
     """Generate CV content for a specific role"""
+    fake = get_fake()
     name = fake.name()
     email = fake.email()
     phone = fake.phone_number()
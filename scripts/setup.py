@@ -6,6 +6,7 @@ Installs dependencies, creates database, and sets up initial data
 import subprocess
 import sys
 import os
+import re
 import mysql.connector
 from mysql.connector import Error
 import logging
@@ -25,6 +26,44 @@ def install_dependencies():
         logger.error(f"Failed to install dependencies: {e}")
         return False
 
+SCHEMA_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                           'database', 'database_schema.sql')
+
+# Indexes managed by the migration: (table, index name, kind, columns)
+INDEXES = [
+    ('ApplicantProfile', 'idx_applicant_name', 'INDEX', 'first_name, last_name'),
+    ('ApplicantProfile', 'idx_applicant_email', 'INDEX', 'email'),
+    ('ApplicationDetail', 'idx_detail_applicant', 'INDEX', 'applicant_id'),
+    ('ApplicationDetail', 'idx_application_role', 'INDEX', 'application_role'),
+    ('ApplicationDetail', 'idx_cv_path', 'INDEX', 'cv_path'),
+    ('ApplicationDetail', 'idx_application_status', 'INDEX', 'application_status'),
+    ('ApplicationDetail', 'idx_applied_date', 'INDEX', 'applied_date'),
+    ('ApplicantProfile', 'ft_applicant_name', 'FULLTEXT INDEX', 'first_name, last_name'),
+    ('ApplicantProfile', 'ft_applicant_skills', 'FULLTEXT INDEX', 'skills'),
+    ('ApplicantProfile', 'ft_applicant_profile', 'FULLTEXT INDEX', 'summary, skills, experience, education'),
+    ('ApplicationDetail', 'ft_application_role', 'FULLTEXT INDEX', 'application_role'),
+]
+
+def is_index_statement(command):
+    """True for CREATE [FULLTEXT] INDEX statements (comment lines ignored)"""
+    sql = "\n".join(line for line in command.splitlines() if not line.strip().startswith('--'))
+    return re.match(r'\s*CREATE\s+(FULLTEXT\s+)?INDEX\b', sql, re.IGNORECASE) is not None
+
+def migrate_indexes(cursor, database='ats_db'):
+    """Create the missing B-tree and FULLTEXT indexes (safe to run on an existing database)"""
+    for table, index_name, kind, columns in INDEXES:
+        cursor.execute(
+            """
+            SELECT COUNT(*) FROM information_schema.STATISTICS
+            WHERE TABLE_SCHEMA = %s AND TABLE_NAME = %s AND INDEX_NAME = %s
+            """,
+            (database, table, index_name)
+        )
+        if cursor.fetchone()[0]:
+            continue
+        logger.info(f"Creating {kind.lower()} {index_name} on {table}({columns})")
+        cursor.execute(f"CREATE {kind} {index_name} ON {table}({columns})")
+
 def create_database():
     """Create the ATS database and tables"""
     logger.info("Setting up database...")
@@ -43,16 +82,18 @@ def create_database():
         cursor = connection.cursor()
         
         # Read and execute SQL schema
-        with open('database_schema.sql', 'r') as file:
+        with open(SCHEMA_PATH, 'r') as file:
             sql_commands = file.read()
         
         # Split commands by semicolon and execute each
         commands = [cmd.strip() for cmd in sql_commands.split(';') if cmd.strip()]
         
         for command in commands:
-            if command:
+            # Indexes are created by the migration below, which skips existing ones
+            if command and not is_index_statement(command):
                 cursor.execute(command)
         
+        migrate_indexes(cursor)
         connection.commit()
         logger.info("Database created successfully!")
         
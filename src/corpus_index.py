@@ -0,0 +1,150 @@
+"""
+Memory-mapped corpus of every CV text for single-buffer scans.
+
+The build step writes the lowercased texts of all CVs of a search into one
+UTF-8 file, separated by NUL bytes, next to a small JSON index with the
+start/end byte offsets of each document. Searching maps the file with mmap
+and runs each pattern once over the whole buffer; hit offsets are mapped back
+to documents by binary search over the start offsets. Documents that are pure
+ASCII have byte offsets equal to character offsets, the others are converted
+by decoding the document prefix.
+"""
+
+import os
+import json
+import mmap
+from bisect import bisect_right
+from typing import Dict, Iterable, List
+
+from algorithms.aho_corasick import AhoCorasickAutomaton
+from algorithms.native import NativeMultiSearcher
+
+SEPARATOR = b'\0'
+INDEX_VERSION = 1
+
+
+def normalize_text(text: str) -> str:
+    """Text as stored in the corpus: lowercased, without the separator"""
+    return (text or '').lower().replace('\0', ' ')
+
+
+class CorpusIndex:
+    """
+    Read-only view of a built corpus. Document numbers are positions in the
+    list of texts given to build(), so they line up with the searched cv_data_list
+    """
+    def __init__(self, path: str):
+        self.path = path
+        with open(path + '.idx', 'r', encoding='utf-8') as f:
+            index = json.load(f)
+        if index.get('version') != INDEX_VERSION:
+            raise ValueError(f"Unsupported corpus index version: {index.get('version')}")
+
+        self.signature = index['signature']
+        self.starts: List[int] = index['starts']
+        self.ends: List[int] = index['ends']
+        self.ascii: List[bool] = index['ascii']
+
+        self._file = open(path + '.bin', 'rb')
+        if os.fstat(self._file.fileno()).st_size:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            # Indexing and iterating a memoryview both give ints, without copying the buffer
+            self.buffer = memoryview(self._map)
+        else:
+            # An empty file cannot be mapped
+            self._map = None
+            self.buffer = memoryview(b'')
+
+    @classmethod
+    def build(cls, path: str, texts: Iterable[str], signature: str) -> 'CorpusIndex':
+        """Write the corpus of the given texts and open it"""
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        starts, ends, ascii_flags = [], [], []
+        offset = 0
+        # Per-process temporary names, so concurrent builds never write the same file
+        suffix = f'.{os.getpid()}.tmp'
+
+        with open(path + '.bin' + suffix, 'wb') as f:
+            for text in texts:
+                normalized = normalize_text(text)
+                data = normalized.encode('utf-8')
+                starts.append(offset)
+                ends.append(offset + len(data))
+                ascii_flags.append(len(data) == len(normalized))
+                f.write(data)
+                f.write(SEPARATOR)
+                offset += len(data) + 1
+
+        with open(path + '.idx' + suffix, 'w', encoding='utf-8') as f:
+            json.dump({'version': INDEX_VERSION, 'signature': signature,
+                       'starts': starts, 'ends': ends, 'ascii': ascii_flags}, f)
+
+        # The index is replaced last, so a corpus file is never paired with a stale index
+        os.replace(path + '.bin' + suffix, path + '.bin')
+        os.replace(path + '.idx' + suffix, path + '.idx')
+        return cls(path)
+
+    def __len__(self):
+        return len(self.starts)
+
+    def close(self):
+        """Release the mapping (required before the files can be replaced on Windows)"""
+        self.buffer.release()
+        if self._map is not None:
+            self._map.close()
+        self._file.close()
+
+    def text(self, doc: int) -> str:
+        """Normalized text of a document"""
+        return self.buffer[self.starts[doc]:self.ends[doc]].tobytes().decode('utf-8')
+
+    def doc_at(self, offset: int) -> int:
+        """Document containing a byte offset of the buffer"""
+        return bisect_right(self.starts, offset) - 1
+
+    def char_offset(self, doc: int, offset: int) -> int:
+        """Character position inside a document of a byte offset of the buffer"""
+        start = self.starts[doc]
+        if self.ascii[doc]:
+            return offset - start
+        return len(self.buffer[start:offset].tobytes().decode('utf-8'))
+
+    def search(self, compiled) -> Dict[int, Dict[str, List[int]]]:
+        """
+        Run compiled byte patterns over the whole buffer, one pass per pattern
+        (a single pass for Aho-Corasick and the native regex alternation). compiled is CVMatcher.compile_keywords
+        with encoding='utf-8'. Returns doc -> {pattern: character positions}
+        """
+        if isinstance(compiled, (AhoCorasickAutomaton, NativeMultiSearcher)):
+            all_positions = compiled.search_all(self.buffer)
+        else:
+            all_positions = {pattern: searcher.find_all(self.buffer) for pattern, searcher in compiled.items()}
+
+        hits = {}
+        for pattern, positions in all_positions.items():
+            key = pattern.decode('utf-8')
+            if not pattern:
+                # Empty pattern: found at the start of every non-empty document, as per CV
+                for doc in range(len(self)):
+                    if self.ends[doc] > self.starts[doc]:
+                        hits.setdefault(doc, {})[key] = [0]
+                continue
+            for offset in positions:
+                doc = self.doc_at(offset)
+                if offset + len(pattern) > self.ends[doc]:
+                    continue  # Runs over the separator into the next document
+                hits.setdefault(doc, {}).setdefault(key, []).append(self.char_offset(doc, offset))
+        return hits
+
+
+def open_corpus_index(path: str, signature: str, texts: Iterable[str]) -> CorpusIndex:
+    """Open the corpus at path if it was built for this signature, otherwise rebuild it"""
+    try:
+        index = CorpusIndex(path)
+    except (OSError, ValueError, KeyError):
+        index = None
+    if index is not None and index.signature == signature:
+        return index
+    if index is not None:
+        index.close()
+    return CorpusIndex.build(path, texts, signature)
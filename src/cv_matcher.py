@@ -1,55 +1,221 @@
+import re
 import time
 import os
-from typing import List, Dict, Tuple
-from algorithms.KMP import kmp_search, kmp_search_all
-from algorithms.BM import boyer_moore, boyer_moore_all
-from algorithms.levenshtein import levenshtein_distance
+import hashlib
+from bisect import bisect_left, bisect_right
+from collections import deque
+from typing import Callable, Iterator, List, Dict, Tuple
+from algorithms.KMP import compile_kmp
+from algorithms.BM import compile_bm
+from algorithms.levenshtein import compile_levenshtein, max_distance_for_similarity
+from algorithms.aho_corasick import AhoCorasickAutomaton
+from algorithms.bitap import compile_bitap
+from algorithms.native import compile_native, NativeMultiSearcher
 from .ekstrak_regex import extract_regex, extract_details_regex
-from database.database import DatabaseConnection
+from .ranking import TopNCollector
+from .corpus_index import open_corpus_index
+from .stage_timing import StageTimings, profile_search
+from database.database import DatabaseConnection, decode_sections, like_pattern
+from utils.extraction_cache import get_extraction_cache
+from utils.result_cache import ResultCache
+from config import APP_CONFIG, DB_CONFIG, DB_POOL_CONFIG
+
+# Names accepted for each exact matching algorithm
+ALGORITHM_ALIASES = {
+    'KMP': 'KMP',
+    'BM': 'BM',
+    'BOYER_MOORE': 'BM',
+    'BM_FULL': 'BM_FULL',
+    'HORSPOOL': 'HORSPOOL',
+    'BMH': 'HORSPOOL',
+    'SUNDAY': 'SUNDAY',
+    'AC': 'AC',
+    'AHO_CORASICK': 'AC',
+    'NATIVE': 'NATIVE',
+}
+
+def normalize_algorithm(algorithm: str) -> str:
+    """Map an algorithm name from the GUI or API to its short name (defaults to BM)"""
+    return ALGORITHM_ALIASES.get(algorithm.upper().replace('-', '_'), 'BM')
+
+# Boyer-Moore family: short algorithm name -> compile_bm variant
+BM_VARIANT_NAMES = {
+    'BM': 'bad_char',
+    'BM_FULL': 'full',
+    'HORSPOOL': 'horspool',
+    'SUNDAY': 'sunday',
+}
+
+# Words of a text for phrase matching: word characters (plus + and #, e.g. c++, c#),
+# joined by . ' / & - inside a word (node.js, e-mail); other punctuation separates words
+PHRASE_TOKEN = re.compile(r"[\w+#]+(?:[.'/&-][\w+#]+)*")
+
+# Per-CV counters summed over a search (times in milliseconds)
+SEARCH_STATS = ('distance_computations', 'words_compared')
+
+def collect_matches(keywords: List[str], all_positions: Dict) -> Dict:
+    """keyword -> {'count', 'positions'} for the keywords found, from pattern -> positions"""
+    matches = {}
+    for keyword in keywords:
+        positions = all_positions.get(keyword.lower().strip())
+        if positions:
+            matches[keyword] = {
+                'count': len(positions),
+                'positions': list(positions)
+            }
+    return matches
+
+def new_search_totals() -> Dict:
+    """Empty search totals: the SEARCH_STATS counters plus per-stage timings"""
+    totals = dict.fromkeys(SEARCH_STATS, 0)
+    totals['stages'] = StageTimings()
+    return totals
+
+def add_search_stats(totals: Dict, stats: Dict):
+    """Add the counters and stage timings of one CV (or chunk of CVs) to the search totals"""
+    for key in SEARCH_STATS:
+        totals[key] += stats[key]
+    if isinstance(stats['stages'], StageTimings):
+        totals['stages'].merge(stats['stages'])
+    else:
+        totals['stages'].add_all(stats['stages'])
+
+class AnyEvent:
+    """Cancel event that is set when any of the given events (None entries are ignored) is set"""
+    def __init__(self, *events):
+        self.events = [event for event in events if event is not None]
+    
+    def is_set(self) -> bool:
+        return any(event.is_set() for event in self.events)
 
 class CVMatcher:
-    def __init__(self, similarity_threshold=0.8):
+    def __init__(self, similarity_threshold=0.8, use_cache=None, corpus_index_path=None):
         self.similarity_threshold = similarity_threshold
-        self.db = DatabaseConnection(password='root')
+        # Database access is set up on first use (see the db property)
+        self._db = None
         
-    def extract_cv_text(self, cv_path: str) -> str:
-        """Extract text from CV PDF"""
-        # Handle relative paths from database
+        # Persistent cache of extracted CV text (shared by every matcher in the process)
+        if use_cache is None:
+            use_cache = APP_CONFIG.get('use_extraction_cache', True)
+        self.text_cache = get_extraction_cache(APP_CONFIG['extraction_cache_path']) if use_cache else None
+        
+        # Recently used search results, dropped when the corpus version changes
+        self.result_cache = ResultCache(APP_CONFIG.get('result_cache_size', 32),
+                                        APP_CONFIG.get('result_cache_ttl', 300),
+                                        APP_CONFIG.get('result_cache_max_results', 5000))
+        
+        # Process pool for parallel searches, created on first use
+        self._executor = None
+        self._executor_workers = 0
+        
+        # Memory-mapped corpus of the last searched CVs (see get_corpus_index)
+        self.corpus_index_path = corpus_index_path or APP_CONFIG['corpus_index_path']
+        self._corpus_index = None
+        
+    @property
+    def db(self) -> DatabaseConnection:
+        """Database connection, created on first use so building a matcher stays cheap"""
+        if self._db is None:
+            # Connections come from the pool shared with the GUI (same DB_CONFIG)
+            self._db = DatabaseConnection(
+                host=DB_CONFIG['host'],
+                port=DB_CONFIG['port'],
+                user=DB_CONFIG['user'],
+                password=DB_CONFIG['password'],
+                database=DB_CONFIG['database'],
+                use_fulltext=APP_CONFIG.get('fulltext_search', False),
+                **DB_POOL_CONFIG
+            )
+        return self._db
+    
+    def resolve_cv_path(self, cv_path: str) -> str:
+        """Path of a CV file on disk (relative paths from the database are under data/)"""
         if not os.path.isabs(cv_path):
             # Normalize path separators and join with data directory
             normalized_path = cv_path.replace('\\', os.sep).replace('/', os.sep)
-            full_path = os.path.join('data', normalized_path)
-        else:
-            full_path = cv_path
+            return os.path.join('data', normalized_path)
+        return cv_path
+    
+    def extract_cv_text(self, cv_path: str) -> str:
+        """Extract text from CV PDF"""
+        full_path = self.resolve_cv_path(cv_path)
             
         if not os.path.exists(full_path):
             return ""
+        if self.text_cache is not None:
+            return self.text_cache.get_or_extract(full_path, extract_regex)
         return extract_regex(full_path)
     
-    def exact_match_search(self, text: str, keywords: List[str], algorithm: str) -> Dict:
-        """Perform exact matching using specified algorithm"""
-        start_time = time.time()
-        matches = {}
+    def get_cv_text(self, cv_item: Dict) -> str:
+        """CV text stored in the database at ingest time, read from the PDF only if missing"""
+        return cv_item.get('cv_text') or self.extract_cv_text(cv_item.get('cv_path', ''))
+    
+    def get_cv_sections(self, cv_item: Dict) -> Dict:
+        """Parsed CV sections stored in the database, parsed from the CV text only if missing"""
+        if cv_item.get('cv_sections'):
+            return decode_sections(cv_item['cv_sections'])
+        cv_text = self.get_cv_text(cv_item)
+        return extract_details_regex(cv_text) if cv_text else None
+    
+    def get_cache_stats(self) -> Dict:
+        """Get statistics of the extracted text cache"""
+        if self.text_cache is None:
+            return {}
+        return self.text_cache.stats()
+    
+    def purge_cache(self, missing_only: bool = False) -> int:
+        """Remove entries from the extracted text cache"""
+        if self.text_cache is None:
+            return 0
+        return self.text_cache.purge(missing_only)
+    
+    def compile_keywords(self, keywords: List[str], algorithm: str, encoding: str = None):
+        """
+        Compile the keywords once so the same pattern objects can be reused for every CV
+        of a search: an Aho-Corasick automaton for AC, a regex alternation for NATIVE with
+        several keywords, otherwise a dict of keyword -> KMP, Boyer-Moore family or str.find searcher.
+        With an encoding the patterns are encoded to bytes, for searching the corpus index
+        """
+        algorithm = normalize_algorithm(algorithm)
+        patterns = list(dict.fromkeys(keyword.lower().strip() for keyword in keywords))
+        if encoding:
+            patterns = [pattern.encode(encoding) for pattern in patterns]
+        
+        if algorithm == 'AC':
+            return AhoCorasickAutomaton(patterns)
+        if algorithm == 'NATIVE':
+            if len(patterns) > 1:
+                return NativeMultiSearcher(patterns)
+            return {pattern: compile_native(pattern) for pattern in patterns}
+        if algorithm == 'KMP':
+            return {pattern: compile_kmp(pattern) for pattern in patterns}
+        variant = BM_VARIANT_NAMES[algorithm]
+        return {pattern: compile_bm(pattern, variant) for pattern in patterns}
+    
+    def exact_match_search(self, text: str, keywords: List[str], algorithm: str, compiled=None) -> Dict:
+        """
+        Perform exact matching using specified algorithm.
+        compiled is the result of compile_keywords for the same keywords and algorithm
+        (compiled on the fly if not given)
+        """
+        start_time = time.perf_counter_ns()
+        
+        if compiled is None:
+            compiled = self.compile_keywords(keywords, algorithm)
         
         # Convert text to lowercase for case-insensitive matching
         text_lower = text.lower()
         
-        for keyword in keywords:
-            keyword_lower = keyword.lower().strip()
-              # Use the appropriate algorithm to find all occurrences
-            if algorithm.upper() == 'KMP':
-                positions = kmp_search_all(text_lower, keyword_lower)
-            else:  # Boyer-Moore
-                positions = boyer_moore_all(text_lower, keyword_lower)
-            
-            if positions:
-                matches[keyword] = {
-                    'count': len(positions),
-                    'positions': positions
-                }
+        if isinstance(compiled, (AhoCorasickAutomaton, NativeMultiSearcher)):
+            # Aho-Corasick and the regex alternation find every keyword in a single pass over the text
+            all_positions = compiled.search_all(text_lower)
+        else:
+            # Use the appropriate precompiled searcher to find all occurrences
+            all_positions = {pattern: searcher.find_all(text_lower) for pattern, searcher in compiled.items()}
+        
+        matches = collect_matches(keywords, all_positions)
         
-        end_time = time.time()
-        execution_time = (end_time - start_time) * 1000  # Convert to milliseconds
+        execution_time = (time.perf_counter_ns() - start_time) / 1e6  # Convert to milliseconds
         
         return {
             'matches': matches,
@@ -58,44 +224,150 @@ class CVMatcher:
             'total_matches': sum(match['count'] for match in matches.values())
         }
     
-    def fuzzy_match_search(self, text: str, keywords: List[str]) -> Dict:
-        """Perform fuzzy matching using Levenshtein distance"""
-        start_time = time.time()
+    def compare_words(self, keyword_lower: str, words, known_words: Dict, threshold: float = None) -> int:
+        """
+        Compare the words not yet in known_words with the keyword: known_words[word] becomes
+        (similarity, distance) when the similarity reaches the threshold, otherwise None.
+        Large batches of new words go through NumPy when it is installed, the rest through
+        the bit-parallel matcher. Returns the number of words compared
+        """
+        if threshold is None:
+            threshold = self.similarity_threshold
+        new_words = [word for word in dict.fromkeys(words) if word not in known_words]
+        if not new_words:
+            return 0
+        
+        # Imported here so NumPy is not loaded at startup
+        from algorithms.levenshtein_batch import HAS_NUMPY, levenshtein_batch_within
+        if (HAS_NUMPY and APP_CONFIG.get('fuzzy_batch', True)
+                and len(new_words) >= APP_CONFIG.get('fuzzy_batch_min_words', 256)):
+            distances, max_distances = levenshtein_batch_within(keyword_lower, new_words, threshold)
+            bounded = zip(new_words, distances.tolist(), max_distances.tolist())
+        else:
+            # Bit-parallel matcher: the keyword's Peq table is built once for all words.
+            # Only distances within the limit can reach the threshold,
+            # so the bounded variant can give up early on the rest
+            matcher = compile_levenshtein(keyword_lower)
+            bounded = []
+            for word in new_words:
+                max_distance = max_distance_for_similarity(max(len(keyword_lower), len(word)), threshold)
+                bounded.append((word, matcher.within(word, max_distance), max_distance))
+        
+        for word, distance, max_distance in bounded:
+            scored = None
+            max_len = max(len(keyword_lower), len(word))
+            if max_len > 0 and distance <= max_distance:
+                # Calculate similarity
+                similarity = 1 - (distance / max_len)
+                if similarity >= threshold:
+                    scored = (similarity, distance)
+            known_words[word] = scored
+        return len(new_words)
+    
+    def phrase_matches(self, phrase: str, text: str) -> List[Dict]:
+        """
+        Approximate occurrences of a multi-word keyword in the text, found in one Bitap
+        pass over its words (PHRASE_TOKEN) joined by single spaces. Each match is widened
+        or narrowed to whole words and scored again, so a phrase never matches part of a
+        word. Returns {'word', 'similarity', 'distance', 'start', 'end'} entries like
+        fuzzy_match_search, best first; start and end are character offsets in text
+        """
+        phrase = " ".join(PHRASE_TOKEN.findall(phrase.lower()))
+        lowered = text.lower()
+        words = PHRASE_TOKEN.findall(lowered)
+        joined = " ".join(words)
+        max_distance = max_distance_for_similarity(len(phrase), self.similarity_threshold)
+        found = compile_bitap(phrase, max_distance).find_all(joined)
+        if not found:
+            return []
+        
+        # Offsets of each word in text and in joined, only needed once something is found
+        spans = [match.span() for match in PHRASE_TOKEN.finditer(lowered)]
+        word_starts, word_ends = [], []
+        offset = 0
+        for word in words:
+            word_starts.append(offset)
+            word_ends.append(offset + len(word))
+            offset += len(word) + 1
+        
+        distance_to = compile_levenshtein(phrase).distance
+        matches = []
+        last_word = -1
+        for start, end, _ in found:
+            # A match starting or ending inside a word either takes the whole word or drops it
+            first = bisect_right(word_starts, start) - 1
+            firsts = [first + 1] if start >= word_ends[first] else [first, first + 1]
+            last = bisect_left(word_ends, end)
+            lasts = [last - 1] if end <= word_starts[last] else [last, last - 1]
+            windows = [(f, l) for f in firsts for l in lasts if last_word < f <= l]
+            if not windows:
+                continue
+            scored = [(distance_to(joined[word_starts[f]:word_ends[l]]), f, l) for f, l in windows]
+            distance, first, last = min(
+                scored, key=lambda item: (item[0], abs(word_ends[item[2]] - word_starts[item[1]] - len(phrase)))
+            )
+            matched = joined[word_starts[first]:word_ends[last]]
+            similarity = 1 - (distance / max(len(phrase), len(matched)))
+            if similarity >= self.similarity_threshold:
+                matches.append({'word': matched, 'similarity': similarity, 'distance': distance,
+                                'start': spans[first][0], 'end': spans[last][1]})
+                last_word = last
+        matches.sort(key=lambda x: x['similarity'], reverse=True)
+        return matches
+    
+    def fuzzy_match_search(self, text: str, keywords: List[str], vocabulary: Dict = None) -> Dict:
+        """
+        Perform fuzzy matching using Levenshtein distance. Multi-word keywords are
+        searched as approximate phrases (see phrase_matches).
+        vocabulary maps keyword -> {word: (similarity, distance) or None} and can be
+        shared between CVs of one search, so every unique word is only compared once.
+        """
+        start_time = time.perf_counter_ns()
         fuzzy_matches = {}
+        distance_computations = 0
+        words_compared = 0
+        
+        if vocabulary is None:
+            vocabulary = {}
         
         # Split text into words for fuzzy matching
         words = text.lower().split()
         
         for keyword in keywords:
             keyword_lower = keyword.lower().strip()
+            if len(keyword_lower.split()) > 1:
+                # A multi-word keyword never matches a single word, search it as a phrase
+                best_matches = self.phrase_matches(keyword_lower, text)
+                if best_matches:
+                    fuzzy_matches[keyword] = best_matches[:5]
+                continue
+            
+            known_words = vocabulary.setdefault(keyword_lower, {})
+            distance_computations += self.compare_words(keyword_lower, words, known_words)
+            words_compared += len(words)
             best_matches = []
             
             for word in words:
-                # Calculate similarity
-                distance = levenshtein_distance(keyword_lower, word)
-                max_len = max(len(keyword_lower), len(word))
-                
-                if max_len > 0:
-                    similarity = 1 - (distance / max_len)
-                    
-                    if similarity >= self.similarity_threshold:
-                        best_matches.append({
-                            'word': word,
-                            'similarity': similarity,
-                            'distance': distance
-                        })
+                scored = known_words[word]
+                if scored is not None:
+                    best_matches.append({
+                        'word': word,
+                        'similarity': scored[0],
+                        'distance': scored[1]
+                    })
             
             if best_matches:
                 # Sort by similarity (highest first)
                 best_matches.sort(key=lambda x: x['similarity'], reverse=True)
                 fuzzy_matches[keyword] = best_matches[:5]  # Keep top 5 matches
         
-        end_time = time.time()
-        execution_time = (end_time - start_time) * 1000  # Convert to milliseconds
+        execution_time = (time.perf_counter_ns() - start_time) / 1e6  # Convert to milliseconds
         
         return {
             'fuzzy_matches': fuzzy_matches,
-            'execution_time': execution_time
+            'execution_time': execution_time,
+            'distance_computations': distance_computations,
+            'words_compared': words_compared
         }
     
     def calculate_relevance_score(self, exact_matches: Dict, fuzzy_matches: Dict, keywords: List[str]) -> float:
@@ -138,72 +410,424 @@ class CVMatcher:
     
     def rank_results(self, results: List[Dict], top_n: int = None) -> List[Dict]:
         """Rank results by relevance score and return top N"""
-        # Sort by total score (descending)
-        ranked_results = sorted(results, key=lambda x: x['total_score'], reverse=True)
+        # Bounded heap: O(n log N) instead of sorting every result
+        collector = TopNCollector(top_n)
+        for index, result in enumerate(results):
+            collector.push(result['total_score'], index, result)
+        return collector.ranked()
+    
+    def score_cv(self, cv_item: Dict, keywords: List[str], algorithm: str, vocabulary: Dict = None,
+                 compiled=None, cv_text: str = None, exact_matches: Dict = None) -> Tuple[Dict, Dict]:
+        """
+        Extract, match and score a single CV.
+        cv_text and exact_matches can be given when they were already found by a scan
+        of the corpus index (the extraction and exact match stages are then not timed per CV).
+        Returns (candidate or None, statistics of the work done for this CV);
+        build_result turns a candidate into the full result payload
+        """
+        stages = {}  # stage -> elapsed nanoseconds for this CV
+        stats = dict.fromkeys(SEARCH_STATS, 0)
+        stats['stages'] = stages
         
-        # Apply top N filter
-        if top_n and top_n > 0:
-            ranked_results = ranked_results[:top_n]
+        if cv_text is None:
+            start = time.perf_counter_ns()
+            cv_text = self.get_cv_text(cv_item)
+            stages['extraction'] = time.perf_counter_ns() - start
+        
+        if not cv_text:
+            return None, stats
+        
+        # Perform exact matching
+        if exact_matches is None:
+            start = time.perf_counter_ns()
+            exact_result = self.exact_match_search(cv_text, keywords, algorithm, compiled)
+            exact_matches = exact_result['matches']
+            stages['exact_match'] = time.perf_counter_ns() - start
+        
+        # Perform fuzzy matching for keywords not found exactly
+        start = time.perf_counter_ns()
+        unfound_keywords = [kw for kw in keywords if kw not in exact_matches or not exact_matches[kw]]
+        fuzzy_result = self.fuzzy_match_search(cv_text, unfound_keywords, vocabulary)
+        fuzzy_matches = fuzzy_result['fuzzy_matches']
+        stages['fuzzy_match'] = time.perf_counter_ns() - start
+        
+        stats['distance_computations'] = fuzzy_result['distance_computations']
+        stats['words_compared'] = fuzzy_result['words_compared']
+        
+        # Calculate comprehensive score
+        start = time.perf_counter_ns()
+        total_score = self.calculate_relevance_score(exact_matches, fuzzy_matches, keywords)
+        stages['scoring'] = time.perf_counter_ns() - start
         
-        return ranked_results
+        # Only include results with meaningful scores
+        candidate = None
+        if total_score > 0:
+            candidate = {
+                'cv_data': cv_item,
+                'exact_matches': exact_matches,
+                'fuzzy_matches': fuzzy_matches,
+                'total_score': total_score,
+                'cv_text': cv_text
+            }
+        
+        return candidate, stats
+    
+    def build_result(self, candidate: Dict) -> Dict:
+        """Build the full result payload, only done for CVs that make it into the ranking"""
+        exact_matches = candidate['exact_matches']
+        fuzzy_matches = candidate['fuzzy_matches']
+        cv_text = candidate['cv_text']
+        
+        # Count matches for display
+        exact_count = sum(info['count'] for info in exact_matches.values())
+        fuzzy_count = len([k for k, v in fuzzy_matches.items() if v])
+        
+        return {
+            'cv_data': candidate['cv_data'],
+            'exact_matches': exact_matches,
+            'fuzzy_matches': fuzzy_matches,
+            'exact_score': exact_count,
+            'fuzzy_score': fuzzy_count,
+            'total_score': candidate['total_score'],
+            'cv_text': cv_text[:500] + '...' if len(cv_text) > 500 else cv_text  # Preview
+        }
     
-    def search_cvs(self, cv_data_list: List[Dict], keywords: List[str], algorithm: str, top_n: int = None) -> Tuple[List[Dict], Dict]:
-        """Search through all CVs and return ranked results"""
-        results = []
-        total_exact_time = 0
-        total_fuzzy_time = 0
-        total_cvs_scanned = len(cv_data_list)        
+    def corpus_signature(self, cv_data_list: List[Dict]) -> str:
+        """
+        Fingerprint of the CVs being searched: stored content hash, or file mtime/size
+        for CVs that are read from the PDF. Changes when a CV is added, removed or edited
+        """
+        digest = hashlib.sha1()
         for cv_item in cv_data_list:
-            cv_path = cv_item.get('cv_path', '')
-            cv_text = self.extract_cv_text(cv_path)
+            version = cv_item.get('content_hash')
+            if version is None:
+                try:
+                    stat = os.stat(self.resolve_cv_path(cv_item.get('cv_path', '')))
+                    version = (stat.st_mtime_ns, stat.st_size)
+                except OSError:
+                    version = None
+            digest.update(repr((cv_item.get('applicant_id'), cv_item.get('cv_path'), version)).encode())
+        return digest.hexdigest()
+    
+    def result_cache_key(self, cv_data_list: List[Dict], keywords: List[str], algorithm: str,
+                         top_n: int = None) -> Tuple:
+        """Key of a search in the result cache"""
+        return (
+            tuple(keyword.lower().strip() for keyword in keywords),
+            normalize_algorithm(algorithm),
+            self.similarity_threshold,
+            top_n,
+            self.corpus_signature(cv_data_list)
+        )
+    
+    def get_corpus_index(self, cv_data_list: List[Dict], signature: str = None):
+        """
+        Memory-mapped corpus of the CV texts in cv_data_list (document n is cv_data_list[n]).
+        Reused while the corpus signature is unchanged, rebuilt otherwise.
+        Returns None if the corpus file cannot be written or mapped
+        """
+        if signature is None:
+            signature = self.corpus_signature(cv_data_list)
+        if self._corpus_index is not None:
+            if self._corpus_index.signature == signature:
+                return self._corpus_index
+            # Release the mapping so the files can be replaced
+            self._corpus_index.close()
+            self._corpus_index = None
+        
+        texts = (self.get_cv_text(cv_item) for cv_item in cv_data_list)
+        try:
+            self._corpus_index = open_corpus_index(self.corpus_index_path, signature, texts)
+        except OSError as e:
+            print(f"Corpus index unavailable, searching CVs one by one: {e}")
+        return self._corpus_index
+    
+    def close_corpus_index(self):
+        """Release the memory-mapped corpus"""
+        if self._corpus_index is not None:
+            self._corpus_index.close()
+            self._corpus_index = None
+    
+    def _get_executor(self, workers: int):
+        """Get (or create) the process pool used for parallel searches"""
+        if self._executor is None or self._executor_workers != workers:
+            self.shutdown_executor()
+            # Imported here: multiprocessing is only needed for parallel searches
+            from concurrent.futures import ProcessPoolExecutor
+            self._executor = ProcessPoolExecutor(max_workers=workers)
+            self._executor_workers = workers
+        return self._executor
+    
+    def shutdown_executor(self):
+        """Shut down the process pool used for parallel searches"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+            self._executor_workers = 0
+    
+    def search_cvs(self, cv_data_list: List[Dict], keywords: List[str], algorithm: str, top_n: int = None,
+                   workers: int = None, progress_callback: Callable = None, cancel_event=None,
+                   fetch_time_ns: int = None) -> Tuple[List[Dict], Dict]:
+        """
+        Search through all CVs and return ranked results.
+        progress_callback(processed, total, partial_results) is called while scanning and
+        cancel_event (e.g. threading.Event) stops the scan early, keeping the partial results.
+        fetch_time_ns is the time spent loading cv_data_list from the database, reported as
+        the db_fetch stage. With ATS_PROFILE=1 (or APP_CONFIG['profile_search']) the search
+        runs under cProfile and timing_info['profile_path'] names the .prof file.
+        """
+        with profile_search() as profile_path:
+            events = self.iter_search(cv_data_list, keywords, algorithm, top_n, workers, cancel_event,
+                                      fetch_time_ns, partial_results=progress_callback is not None)
+            for event in events:
+                if event['type'] == 'progress' and progress_callback:
+                    progress_callback(event['processed'], event['total'], event['results'])
+                elif event['type'] == 'done':
+                    ranked_results, timing_info = event['results'], event['timing_info']
+        if profile_path:
+            timing_info['profile_path'] = profile_path
+        return ranked_results, timing_info
+    
+    async def search_cvs_async(self, cv_data_list: List[Dict], keywords: List[str], algorithm: str,
+                               top_n: int = None, workers: int = None, progress_callback: Callable = None,
+                               cancel_event=None, fetch_time_ns: int = None, executor=None) -> Tuple[List[Dict], Dict]:
+        """search_cvs for asyncio: the scan runs in an executor (see aiter_search)"""
+        ranked_results, timing_info = [], {}
+        async for event in self.aiter_search(cv_data_list, keywords, algorithm, top_n, workers, cancel_event,
+                                             fetch_time_ns, partial_results=progress_callback is not None,
+                                             executor=executor):
+            if event['type'] == 'progress' and progress_callback:
+                progress_callback(event['processed'], event['total'], event['results'])
+            elif event['type'] == 'done':
+                ranked_results, timing_info = event['results'], event['timing_info']
+        return ranked_results, timing_info
+    
+    async def aiter_search(self, cv_data_list: List[Dict], keywords: List[str], algorithm: str, top_n: int = None,
+                           workers: int = None, cancel_event=None, fetch_time_ns: int = None,
+                           partial_results: bool = True, executor=None):
+        """
+        Async generator over the events of iter_search. Each step of the search runs in
+        executor (the loop's default thread pool when None), so the event loop keeps
+        serving other tasks while CVs are being scored. Cancelling the awaiting task
+        stops the scan at the next CV and raises CancelledError
+        """
+        import asyncio
+        import threading
+        
+        loop = asyncio.get_running_loop()
+        stop = threading.Event()
+        events = self.iter_search(cv_data_list, keywords, algorithm, top_n, workers,
+                                  AnyEvent(cancel_event, stop), fetch_time_ns, partial_results)
+        finished = object()
+        # A cancelled await leaves its step running in the executor; close() waits for it
+        step_lock = threading.Lock()
+        
+        def step():
+            with step_lock:
+                return next(events, finished)
+        
+        def close():
+            with step_lock:
+                events.close()
+        
+        try:
+            while True:
+                event = await loop.run_in_executor(executor, step)
+                if event is finished:
+                    break
+                yield event
+        finally:
+            stop.set()
+            # Runs the generator's cleanup (e.g. cancelling pending chunks) off the event loop
+            await loop.run_in_executor(executor, close)
+    
+    def iter_search(self, cv_data_list: List[Dict], keywords: List[str], algorithm: str, top_n: int = None,
+                    workers: int = None, cancel_event=None, fetch_time_ns: int = None,
+                    partial_results: bool = True) -> Iterator[Dict]:
+        """
+        Search CVs incrementally, yielding events as they are produced:
+          {'type': 'result', 'index', 'cv_data', 'total_score', 'exact_matches', 'fuzzy_matches',
+           'processed', 'total'}  for each CV with a score (in parallel searches, each chunk's top_n)
+          {'type': 'progress', 'processed', 'total', 'results'}  every progress_interval CVs (or chunk),
+           results being the best progress_preview_size results so far (None unless partial_results;
+           CV text previews may be lowercased)
+          {'type': 'done', 'results', 'timing_info'}  once, last, with the same values search_cvs returns
+        The scan only advances when the next event is requested, so a slow consumer holds it back
+        (parallel searches keep at most two chunks per worker in flight). Closing the generator
+        stops the search; the time the consumer takes between events counts towards search_time.
+        """
+        search_start = time.perf_counter_ns()
+        total_cvs = len(cv_data_list)
+        
+        # Repeated query on an unchanged corpus: serve the previous results
+        cache_key = self.result_cache_key(cv_data_list, keywords, algorithm, top_n)
+        cached = self.result_cache.get(cache_key)
+        if cached is not None:
+            cached_entries, cached_timing = cached
+            cached_results = [dict(result, cv_data=cv_data_list[index]) for index, result in cached_entries]
+            timing_info = dict(cached_timing, algorithm_used=algorithm, result_cache='hit',
+                               result_cache_hits=self.result_cache.hits,
+                               result_cache_misses=self.result_cache.misses)
+            yield {'type': 'progress', 'processed': total_cvs, 'total': total_cvs,
+                   'results': list(cached_results[:APP_CONFIG.get('progress_preview_size', 50)])
+                   if partial_results else None}
+            yield {'type': 'done', 'results': list(cached_results), 'timing_info': timing_info}
+            return
+        
+        # Only the best top_n CVs are kept while scanning (all of them when top_n is None)
+        collector = TopNCollector(top_n)
+        totals = new_search_totals()
+        if fetch_time_ns is not None:
+            totals['stages'].add('db_fetch', fetch_time_ns)
+        ranking_ns = 0
+        processed = 0
+        cancelled = False
+        corpus = None  # Memory-mapped corpus, only used by sequential searches
+        progress_interval = max(1, APP_CONFIG.get('progress_interval', 25))
+        # Progress reports carry a bounded preview of the ranking, not all of it
+        preview_size = max(1, APP_CONFIG.get('progress_preview_size', 50))
+        if top_n and top_n > 0:
+            preview_size = min(preview_size, top_n)
+        
+        if workers is None:
+            workers = APP_CONFIG.get('search_workers', 1)
+        if workers <= 0:
+            workers = os.cpu_count() or 1
+        
+        if workers > 1 and total_cvs > 1:
+            # Spread extraction and matching across processes in chunks.
+            # Chunks are merged in submission order, so the list matches the sequential order.
+            chunk_size = max(1, APP_CONFIG.get('parallel_chunk_size', 25))
+            chunk_starts = iter(range(0, total_cvs, chunk_size))
+            executor = self._get_executor(workers)
+            in_flight = deque()
             
-            if not cv_text:
-                continue
+            def submit_next():
+                first_index = next(chunk_starts, None)
+                if first_index is not None:
+                    chunk = cv_data_list[first_index:first_index + chunk_size]
+                    in_flight.append((chunk, executor.submit(
+                        _score_cv_chunk, chunk, first_index, self.similarity_threshold,
+                        keywords, algorithm, top_n
+                    )))
             
-            # Perform exact matching
-            exact_result = self.exact_match_search(cv_text, keywords, algorithm)
-            exact_matches = exact_result['matches']
-            total_exact_time += exact_result['time_taken']
+            for _ in range(workers * 2):
+                submit_next()
+            try:
+                while in_flight:
+                    if cancel_event is not None and cancel_event.is_set():
+                        cancelled = True
+                        break
+                    chunk, future = in_flight.popleft()
+                    # Every chunk returns its own top_n, already built; the global top_n is among them
+                    chunk_entries, chunk_stats = future.result()
+                    submit_next()
+                    start = time.perf_counter_ns()
+                    for score, sequence, result in chunk_entries:
+                        collector.push(score, sequence, result)
+                    ranking_ns += time.perf_counter_ns() - start
+                    add_search_stats(totals, chunk_stats)
+                    processed += len(chunk)
+                    for score, sequence, result in chunk_entries:
+                        yield {'type': 'result', 'index': sequence, 'cv_data': result['cv_data'],
+                               'total_score': score, 'exact_matches': result['exact_matches'],
+                               'fuzzy_matches': result['fuzzy_matches'],
+                               'processed': processed, 'total': total_cvs}
+                    yield {'type': 'progress', 'processed': processed, 'total': total_cvs,
+                           'results': collector.top(preview_size) if partial_results else None}
+            finally:
+                # Cancelled, closed early or failed: drop the chunks that have not started
+                for _, pending in in_flight:
+                    pending.cancel()
+            start = time.perf_counter_ns()
+            ranked_entries = collector.entries()
+            ranked_results = [result for _, _, result in ranked_entries]
+            ranking_ns += time.perf_counter_ns() - start
+        else:
+            workers = 1
+            # Patterns are compiled once and fuzzy distances are shared by all CVs of this search
+            compiled = self.compile_keywords(keywords, algorithm)
+            vocabulary = {}
+            
+            if APP_CONFIG.get('use_corpus_index', True) and total_cvs:
+                # One scan per pattern over the memory-mapped corpus instead of one per CV
+                start = time.perf_counter_ns()
+                corpus = self.get_corpus_index(cv_data_list, cache_key[-1])
+                totals['stages'].add('corpus_index', time.perf_counter_ns() - start)
+            if corpus is not None:
+                start = time.perf_counter_ns()
+                corpus_hits = corpus.search(self.compile_keywords(keywords, algorithm, encoding='utf-8'))
+                totals['stages'].add('exact_match', time.perf_counter_ns() - start)
             
-            # Perform fuzzy matching for keywords not found exactly
-            unfound_keywords = [kw for kw in keywords if kw not in exact_matches or not exact_matches[kw]]
-            fuzzy_result = self.fuzzy_match_search(cv_text, unfound_keywords)
-            fuzzy_matches = fuzzy_result['fuzzy_matches']
-            total_fuzzy_time += fuzzy_result['execution_time']
+            def build(candidate):
+                if corpus is not None:
+                    # The corpus holds lowercased text; previews show the original
+                    candidate = dict(candidate, cv_text=self.get_cv_text(candidate['cv_data']))
+                return self.build_result(candidate)
             
-            # Calculate comprehensive score
-            total_score = self.calculate_relevance_score(exact_matches, fuzzy_matches, keywords)
+            for index, cv_item in enumerate(cv_data_list):
+                if cancel_event is not None and cancel_event.is_set():
+                    cancelled = True
+                    break
+                if corpus is not None:
+                    candidate, stats = self.score_cv(
+                        cv_item, keywords, algorithm, vocabulary, compiled, cv_text=corpus.text(index),
+                        exact_matches=collect_matches(keywords, corpus_hits.get(index, {}))
+                    )
+                else:
+                    candidate, stats = self.score_cv(cv_item, keywords, algorithm, vocabulary, compiled)
+                add_search_stats(totals, stats)
+                processed += 1
+                if candidate is not None:
+                    start = time.perf_counter_ns()
+                    collector.push(candidate['total_score'], index, candidate)
+                    ranking_ns += time.perf_counter_ns() - start
+                    yield {'type': 'result', 'index': index, 'cv_data': cv_item,
+                           'total_score': candidate['total_score'], 'exact_matches': candidate['exact_matches'],
+                           'fuzzy_matches': candidate['fuzzy_matches'],
+                           'processed': processed, 'total': total_cvs}
+                if processed % progress_interval == 0 or processed == total_cvs:
+                    # Previews keep the scanned text instead of re-reading the original (see build)
+                    yield {'type': 'progress', 'processed': processed, 'total': total_cvs,
+                           'results': [self.build_result(c) for c in collector.top(preview_size)]
+                           if partial_results else None}
             
-            # Only include results with meaningful scores
-            if total_score > 0:
-                # Count matches for display
-                exact_count = sum(info['count'] for info in exact_matches.values())
-                fuzzy_count = len([k for k, v in fuzzy_matches.items() if v])
-                
-                result = {
-                    'cv_data': cv_item,
-                    'exact_matches': exact_matches,
-                    'fuzzy_matches': fuzzy_matches,
-                    'exact_score': exact_count,
-                    'fuzzy_score': fuzzy_count,
-                    'total_score': total_score,
-                    'cv_text': cv_text[:500] + '...' if len(cv_text) > 500 else cv_text  # Preview
-                }
-                
-                results.append(result)
-        
-        # Rank and filter results
-        ranked_results = self.rank_results(results, top_n)
-          # Timing information
+            # Build the result payload only for the CVs that stayed in the ranking
+            start = time.perf_counter_ns()
+            ranked_entries = collector.entries()
+            ranked_results = [build(candidate) for _, _, candidate in ranked_entries]
+            ranking_ns += time.perf_counter_ns() - start
+        stages = totals['stages']
+        stages.add('ranking', ranking_ns)
+        
+        # Timing information (times in seconds)
         timing_info = {
-            'exact_match_time': total_exact_time / 1000,  # Convert to seconds
-            'fuzzy_match_time': total_fuzzy_time / 1000,  # Convert to seconds
-            'total_cvs_scanned': total_cvs_scanned,
+            'exact_match_time': stages.total_seconds('exact_match'),
+            'fuzzy_match_time': stages.total_seconds('fuzzy_match'),
+            'extraction_time': stages.total_seconds('extraction'),
+            'db_fetch_time': stages.total_seconds('db_fetch'),
+            'search_time': (time.perf_counter_ns() - search_start) / 1e9,
+            'stage_timings': stages.summary(),
+            'fuzzy_distance_computations': totals['distance_computations'],
+            'fuzzy_computations_saved': totals['words_compared'] - totals['distance_computations'],
+            'total_cvs_scanned': processed,
             'algorithm_used': algorithm,
-            'results_returned': len(ranked_results)
+            'results_returned': len(ranked_results),
+            'workers': workers,
+            'corpus_index': corpus is not None,
+            'cancelled': cancelled
         }
+        # Partial results of a cancelled search are not reused. Results are cached without
+        # cv_data (which can hold the whole CV text), by position in cv_data_list; the key's
+        # corpus signature guarantees the same list order on a hit
+        if not cancelled:
+            cached_entries = [(index, {key: value for key, value in result.items() if key != 'cv_data'})
+                              for (_, index, _), result in zip(ranked_entries, ranked_results)]
+            self.result_cache.put(cache_key, (cached_entries, dict(timing_info)), size=len(cached_entries))
+        timing_info.update(result_cache='miss', result_cache_hits=self.result_cache.hits,
+                           result_cache_misses=self.result_cache.misses)
         
-        return ranked_results, timing_info
+        yield {'type': 'done', 'results': ranked_results, 'timing_info': timing_info}
     
     def get_all_applicants(self) -> List[Dict]:
         """Get all applicants from database"""
@@ -214,13 +838,16 @@ class CVMatcher:
             query = """
             SELECT ap.applicant_id, ap.first_name, ap.last_name, ap.email, ap.phone_number,
                    ap.summary, ap.skills, ap.experience, ap.education,
-                   ad.application_role, ad.cv_path, ad.application_status
+                   ad.application_role, ad.cv_path, ad.application_status,
+                   cc.cv_text, cc.sections AS cv_sections, cc.content_hash
             FROM ApplicantProfile ap
             JOIN ApplicationDetail ad ON ap.applicant_id = ad.applicant_id
+            LEFT JOIN CVContent cc ON ap.applicant_id = cc.applicant_id
             ORDER BY ap.first_name, ap.last_name
             """
             
             results = self.db.execute_query(query)
+            # No-op with a pool: the connection was already returned after the query
             self.db.disconnect()
             return results if results else []
             
@@ -228,6 +855,27 @@ class CVMatcher:
             print(f"Error getting applicants: {e}")
             return []
     
+    def get_prefiltered_applicants(self, keyword: str) -> List[Dict]:
+        """
+        Applicants whose searchable text (the fields KMP/BM search, joined by spaces)
+        contains the keyword, case-insensitively. LIKE '%keyword%' finds every substring
+        KMP/BM can find, e.g. 'sql' in "MySQL", so this is a superset of their matches.
+        FULLTEXT word prefixes are not, so they are not used here. The rows come without
+        the CV text, and the algorithm still verifies every match. Returns None when the
+        query fails, so the caller scans every applicant instead
+        """
+        query = """
+        SELECT ap.applicant_id, ap.first_name, ap.last_name, ap.email, ap.phone_number,
+               ap.summary, ap.skills, ap.experience, ap.education,
+               ad.application_role, ad.cv_path, ad.application_status
+        FROM ApplicantProfile ap
+        JOIN ApplicationDetail ad ON ap.applicant_id = ad.applicant_id
+        WHERE CONCAT_WS(' ', ap.first_name, ap.last_name, ad.application_role, ap.summary,
+                        ap.skills, ap.experience, ap.education) LIKE %s
+        ORDER BY ap.first_name, ap.last_name
+        """
+        return self.db.execute_query(query, (like_pattern(keyword.strip()),))
+    
     def search_applicants_kmp(self, keyword: str, limit: int = 50) -> List[Dict]:
         """Search applicants using KMP algorithm"""
         return self._search_applicants_with_algorithm(keyword, 'KMP', limit)
@@ -245,7 +893,9 @@ class CVMatcher:
         matches = []
         
         keyword_lower = keyword.lower().strip()
+        known_words = {}  # word -> (similarity, distance) or None when below the threshold
         
+        applicant_words = []
         for applicant in applicants:
             # Combine all searchable text
             searchable_text = " ".join([
@@ -258,23 +908,22 @@ class CVMatcher:
                 str(applicant.get('education', ''))
             ]).lower()
             
-            # Split into words for fuzzy matching
-            words = searchable_text.split()
+            # Split into words for fuzzy matching, skipping very short words
+            applicant_words.append([word for word in searchable_text.split() if len(word) >= 2])
+        
+        # Each unique word is compared once for the whole search, in one batch
+        self.compare_words(keyword_lower, (word for words in applicant_words for word in words),
+                           known_words, threshold)
+        
+        for applicant, words in zip(applicants, applicant_words):
             best_similarity = 0
             best_word = ""
             
             for word in words:
-                if len(word) < 2:  # Skip very short words
-                    continue
-                    
-                distance = levenshtein_distance(keyword_lower, word)
-                max_len = max(len(keyword_lower), len(word))
-                
-                if max_len > 0:
-                    similarity = 1 - (distance / max_len)
-                    if similarity > best_similarity:
-                        best_similarity = similarity
-                        best_word = word
+                scored = known_words[word]
+                if scored is not None and scored[0] > best_similarity:
+                    best_similarity = scored[0]
+                    best_word = word
             
             if best_similarity >= threshold:
                 applicant['similarity_score'] = best_similarity
@@ -288,10 +937,17 @@ class CVMatcher:
     
     def _search_applicants_with_algorithm(self, keyword: str, algorithm: str, limit: int) -> List[Dict]:
         """Internal method to search applicants with specified algorithm"""
-        applicants = self.get_all_applicants()
+        applicants = None
+        if APP_CONFIG.get('search_prefilter', False):
+            # The database narrows the candidates, the algorithm below still verifies every match
+            applicants = self.get_prefiltered_applicants(keyword)
+        if applicants is None:
+            applicants = self.get_all_applicants()
         matches = []
         
         keyword_lower = keyword.lower().strip()
+        # Compile the pattern once for all applicants
+        searcher = compile_kmp(keyword_lower) if algorithm == 'KMP' else compile_bm(keyword_lower)
         
         for applicant in applicants:
             # Combine all searchable text
@@ -306,10 +962,7 @@ class CVMatcher:
             ]).lower()
             
             # Use the specified algorithm to search
-            if algorithm == 'KMP':
-                positions = kmp_search_all(searchable_text, keyword_lower)
-            else:  # Boyer-Moore
-                positions = boyer_moore_all(searchable_text, keyword_lower)
+            positions = searcher.find_all(searchable_text)
             
             if positions:
                 applicant['match_count'] = len(positions)
@@ -320,3 +973,38 @@ class CVMatcher:
         matches.sort(key=lambda x: x['match_count'], reverse=True)
         
         return matches[:limit]
+
+
+# Matcher reused by every chunk that runs in the same worker process
+_worker_matcher = None
+
+def _score_cv_chunk(cv_chunk: List[Dict], first_index: int, similarity_threshold: float, keywords: List[str],
+                    algorithm: str, top_n: int = None) -> Tuple[List[Tuple[float, int, Dict]], Dict]:
+    """
+    Score a chunk of CVs inside a worker process of the parallel search.
+    Returns the chunk's top_n as (score, index in the full CV list, result) and the chunk statistics
+    """
+    global _worker_matcher
+    if _worker_matcher is None:
+        _worker_matcher = CVMatcher(similarity_threshold)
+    _worker_matcher.similarity_threshold = similarity_threshold
+    
+    collector = TopNCollector(top_n)
+    totals = new_search_totals()
+    ranking_ns = 0
+    compiled = _worker_matcher.compile_keywords(keywords, algorithm)
+    vocabulary = {}
+    for index, cv_item in enumerate(cv_chunk, first_index):
+        candidate, stats = _worker_matcher.score_cv(cv_item, keywords, algorithm, vocabulary, compiled)
+        add_search_stats(totals, stats)
+        if candidate is not None:
+            start = time.perf_counter_ns()
+            collector.push(candidate['total_score'], index, candidate)
+            ranking_ns += time.perf_counter_ns() - start
+    
+    # Only the surviving CVs get their payload built and sent back to the main process
+    start = time.perf_counter_ns()
+    entries = [(score, index, _worker_matcher.build_result(candidate))
+               for score, index, candidate in collector.entries()]
+    totals['stages'].add('ranking', ranking_ns + time.perf_counter_ns() - start)
+    return entries, totals
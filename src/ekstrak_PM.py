@@ -1,4 +1,3 @@
-import fitz
 import re
 import os
 
@@ -8,6 +7,7 @@ def extract_text_pm(pdf_path: str) -> str:
         return ""
 
     try:
+        import fitz  # PyMuPDF is slow to import, load it on the first extraction
         doc = fitz.open(pdf_path)
         raw_text = "".join(page.get_text("text") for page in doc)
         doc.close()
@@ -1,13 +1,14 @@
-import fitz
 import re
 import json
 import os
+import hashlib
 
 def extract_regex(pdf_path: str) -> str:
     if not os.path.exists(pdf_path):
         print(f"Error: File tidak ditemukan di '{pdf_path}'")
         return ""
     try:
+        import fitz  # PyMuPDF is slow to import, load it on the first extraction
         doc = fitz.open(pdf_path)
         raw_text = "".join(page.get_text("text") for page in doc)
         doc.close()
@@ -65,6 +66,24 @@ def extract_details_regex(cv_text: str) -> dict:
         
     return details
 
+def content_hash(cv_text: str) -> str:
+    """SHA-256 of the normalized CV text, used to detect changed content"""
+    return hashlib.sha256(cv_text.encode('utf-8')).hexdigest()
+
+def build_cv_content(pdf_path: str) -> dict:
+    """
+    Extract a CV once for storage in the database: normalized text, its hash
+    and the parsed sections. Returns None if no text could be extracted
+    """
+    cv_text = extract_regex(pdf_path)
+    if not cv_text:
+        return None
+    return {
+        "content_hash": content_hash(cv_text),
+        "cv_text": cv_text,
+        "sections": extract_details_regex(cv_text)
+    }
+
 if __name__ == "__main__":
     cv_pdf_path = "10276858.pdf"
     
@@ -0,0 +1,41 @@
+import heapq
+from typing import Any, List, Tuple
+
+class TopNCollector:
+    """
+    Keeps the N best scoring entries seen so far in a bounded min-heap.
+    Ties are broken by sequence number (earlier wins), which gives the same
+    order as a stable sort by score descending over the whole list.
+    """
+    def __init__(self, top_n: int = None):
+        self.top_n = top_n if top_n and top_n > 0 else None
+        self._heap = []  # (score, -sequence, item); the root is the weakest entry kept
+
+    def push(self, score: float, sequence: int, item: Any) -> bool:
+        """Offer an entry, returns True if it is kept"""
+        entry = (score, -sequence, item)
+        if self.top_n is None or len(self._heap) < self.top_n:
+            heapq.heappush(self._heap, entry)
+            return True
+        if entry[:2] > self._heap[0][:2]:
+            heapq.heapreplace(self._heap, entry)
+            return True
+        return False
+
+    def __len__(self):
+        return len(self._heap)
+
+    def entries(self) -> List[Tuple[float, int, Any]]:
+        """Kept entries as (score, sequence, item), best first"""
+        ordered = sorted(self._heap, key=lambda entry: entry[:2], reverse=True)
+        return [(score, -negative_sequence, item) for score, negative_sequence, item in ordered]
+
+    def ranked(self) -> List[Any]:
+        """Kept items, best first"""
+        return [item for _, _, item in self.entries()]
+
+    def top(self, n: int = None) -> List[Any]:
+        """The n best kept items, best first (all of them when n is None)"""
+        if n is None:
+            return self.ranked()
+        return [item for _, _, item in heapq.nlargest(n, self._heap, key=lambda entry: entry[:2])]
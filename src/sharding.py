@@ -0,0 +1,310 @@
+"""
+Category-sharded CV search.
+
+The corpus is partitioned by role (the category folder under data/, stored as
+ApplicationDetail.application_role). Each shard is searched by its own
+CVMatcher, with its own memory-mapped corpus index and result cache, so a
+change in one category only rebuilds that shard. Shards run in parallel worker
+processes when more than one worker is configured, each shard pinned to one
+worker so its matcher, index and cache are reused by the next search, and
+their top-N lists are combined with a k-way heap merge. A role filter skips the other shards entirely.
+Cancelling a search stops every running shard at its next CV, and a profiled
+search writes a single .prof file (the workers' profiles are merged into it).
+"""
+
+import os
+import re
+import time
+import heapq
+from itertools import islice
+from typing import Callable, Dict, Iterable, List, Tuple
+
+from .cv_matcher import CVMatcher
+from .stage_timing import StageTimings, profile_search, merge_profiles
+from config import APP_CONFIG
+
+UNKNOWN_SHARD = 'UNKNOWN'
+
+
+def shard_key(cv_item: Dict) -> str:
+    """Shard of a CV: its application role, or the category folder of its CV file"""
+    role = cv_item.get('application_role')
+    if not role:
+        cv_path = (cv_item.get('cv_path') or '').replace('\\', '/')
+        role = os.path.basename(os.path.dirname(cv_path))
+    return role.strip().upper() if role else UNKNOWN_SHARD
+
+
+def split_shards(cv_data_list: List[Dict], roles: Iterable[str] = None) -> Dict[str, List[int]]:
+    """
+    Shard -> positions in cv_data_list (ascending), in order of first appearance.
+    With roles, only the shards of those roles are returned (case-insensitive)
+    """
+    wanted = {role.strip().upper() for role in roles} if roles else None
+    shards = {}
+    for index, cv_item in enumerate(cv_data_list):
+        shard = shard_key(cv_item)
+        if wanted is None or shard in wanted:
+            shards.setdefault(shard, []).append(index)
+    return shards
+
+
+def merge_top_n(shard_entries: List[List[Tuple[float, int, Dict]]], top_n: int = None) -> List[Dict]:
+    """
+    k-way merge of per-shard rankings of (score, sequence, result), each best first.
+    Ties are broken by sequence (position in the full CV list), as in an unsharded search
+    """
+    merged = heapq.merge(*shard_entries, key=lambda entry: (-entry[0], entry[1]))
+    if top_n and top_n > 0:
+        merged = islice(merged, top_n)
+    return [result for _, _, result in merged]
+
+
+def shard_index_path(shard: str, worker: int = None) -> str:
+    """
+    Corpus index file of a shard, next to the unsharded one. Worker processes get a
+    file of their own, so no process replaces a file another one has mapped
+    """
+    path = f"{APP_CONFIG['corpus_index_path']}_{re.sub(r'[^A-Za-z0-9_-]', '_', shard)}"
+    return path if worker is None else f"{path}_w{worker}"
+
+
+def search_shard(matcher: CVMatcher, cv_items: List[Dict], sequences: List[int], keywords: List[str],
+                 algorithm: str, top_n: int = None, cancel_event=None) -> Tuple[List[Tuple], Dict]:
+    """
+    Search one shard sequentially. Returns its ranking as (score, sequence, result),
+    sequence being the position of the CV in the full list, and the shard's timing_info.
+    The shard is not profiled on its own: the caller's profile covers it
+    """
+    for event in matcher.iter_search(cv_items, keywords, algorithm, top_n, workers=1,
+                                     cancel_event=cancel_event, partial_results=False):
+        if event['type'] == 'done':
+            results, timing_info = event['results'], event['timing_info']
+    # CVs are identified by (applicant_id, cv_path); duplicates take their positions in order
+    positions = {}
+    for cv_item, sequence in zip(cv_items, sequences):
+        positions.setdefault((cv_item.get('applicant_id'), cv_item.get('cv_path')), []).append(sequence)
+    entries = []
+    for result in results:
+        cv_data = result['cv_data']
+        entries.append((result['total_score'],
+                        positions[(cv_data.get('applicant_id'), cv_data.get('cv_path'))].pop(0), result))
+    return entries, timing_info
+
+
+# Per-process matchers of the shards searched by this worker
+_worker_shards = {}
+# Cancel flag shared with the parent process (a multiprocessing.Event), set by _init_shard_worker
+_worker_cancel = None
+
+def _init_shard_worker(cancel_flag):
+    """Process pool initializer: keep the parent's cancel flag for the shard searches"""
+    global _worker_cancel
+    _worker_cancel = cancel_flag
+
+def _search_shard_in_worker(shard: str, index_path: str, cv_items: List[Dict], sequences: List[int],
+                            similarity_threshold: float, use_cache: bool, keywords: List[str], algorithm: str,
+                            top_n: int = None, profile: bool = False) -> Tuple[List[Tuple], Dict, str]:
+    """
+    search_shard inside a worker process, reusing the shard's matcher between searches.
+    Also returns the path of the worker's .prof file when profile is set (else None)
+    """
+    matcher = _worker_shards.get(shard)
+    if matcher is None:
+        matcher = _worker_shards[shard] = CVMatcher(similarity_threshold, use_cache, corpus_index_path=index_path)
+    matcher.similarity_threshold = similarity_threshold
+    with profile_search(profile) as profile_path:
+        entries, timing_info = search_shard(matcher, cv_items, sequences, keywords, algorithm, top_n, _worker_cancel)
+    return entries, timing_info, profile_path
+
+
+class ShardedSearch:
+    """
+    Search CVs shard by shard (one shard per role) and merge the per-shard top-N.
+    Same results as CVMatcher.search_cvs over the selected shards
+    """
+    def __init__(self, similarity_threshold=0.8, use_cache=None):
+        self.similarity_threshold = similarity_threshold
+        self.use_cache = use_cache
+        self.shards: Dict[str, CVMatcher] = {}  # In-process matcher of each shard, created on first use
+
+        # One single-process pool per worker, created on first use. A shard always runs in the
+        # same worker, so its matcher, corpus index and result cache live in one process only
+        self._executors = []
+        self._shard_workers: Dict[str, int] = {}  # Shard -> position in _executors
+        self._cancel_flag = None  # multiprocessing.Event seen by every worker
+
+    def get_shard(self, shard: str) -> CVMatcher:
+        """Matcher of a shard, with its own corpus index and result cache"""
+        matcher = self.shards.get(shard)
+        if matcher is None:
+            matcher = self.shards[shard] = CVMatcher(self.similarity_threshold, self.use_cache,
+                                                     corpus_index_path=shard_index_path(shard))
+        matcher.similarity_threshold = self.similarity_threshold
+        return matcher
+
+    def _get_executors(self, workers: int):
+        """Get (or create) the worker processes used for parallel shards"""
+        if len(self._executors) != workers:
+            self.shutdown_executor()
+            # Imported here: multiprocessing is only needed for parallel searches
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+            self._cancel_flag = multiprocessing.Event()
+            self._executors = [ProcessPoolExecutor(max_workers=1, initializer=_init_shard_worker,
+                                                   initargs=(self._cancel_flag,))
+                               for _ in range(workers)]
+        return self._executors
+
+    def shard_worker(self, shard: str) -> int:
+        """Worker a shard is pinned to; new shards are assigned round-robin"""
+        worker = self._shard_workers.get(shard)
+        if worker is None:
+            worker = self._shard_workers[shard] = len(self._shard_workers) % len(self._executors)
+        return worker
+
+    def shutdown_executor(self):
+        """Shut down the worker processes and release the shards' corpus indexes"""
+        for executor in self._executors:
+            executor.shutdown(wait=True)
+        self._executors = []
+        self._shard_workers = {}
+        self._cancel_flag = None
+        for matcher in self.shards.values():
+            matcher.close_corpus_index()
+
+    def search(self, cv_data_list: List[Dict], keywords: List[str], algorithm: str, top_n: int = None,
+               roles: Iterable[str] = None, workers: int = None, progress_callback: Callable = None,
+               cancel_event=None, fetch_time_ns: int = None) -> Tuple[List[Dict], Dict]:
+        """
+        Search the shards of cv_data_list and return (ranked results, timing_info) like
+        CVMatcher.search_cvs. roles limits the search to those roles' shards.
+        progress_callback(processed, total, partial_results) is called after each shard, with
+        the best progress_preview_size results so far. Setting cancel_event stops the running
+        shards at their next CV and skips the others, keeping the partial results.
+        When profiling is on, timing_info['profile_path'] names one .prof file for the whole
+        search, with the worker processes' stats merged into it
+        """
+        with profile_search() as profile_path:
+            ranked_results, timing_info, worker_profiles = self._search(
+                cv_data_list, keywords, algorithm, top_n, roles, workers, progress_callback,
+                cancel_event, fetch_time_ns, profile_path is not None)
+        if profile_path:
+            merge_profiles(profile_path, worker_profiles)
+            timing_info['profile_path'] = profile_path
+        return ranked_results, timing_info
+
+    def _search(self, cv_data_list, keywords, algorithm, top_n, roles, workers, progress_callback,
+                cancel_event, fetch_time_ns, profile) -> Tuple[List[Dict], Dict, List[str]]:
+        """Body of search; also returns the .prof files written by the worker processes"""
+        search_start = time.perf_counter_ns()
+        shards = split_shards(cv_data_list, roles)
+        total_cvs = sum(len(indexes) for indexes in shards.values())
+
+        if workers is None:
+            workers = APP_CONFIG.get('search_workers', 1)
+        if workers <= 0:
+            workers = os.cpu_count() or 1
+        # Sized by every shard, not the filtered ones, so a role filter keeps the pinned workers
+        all_shards = split_shards(cv_data_list) if roles else shards
+        workers = max(1, min(workers, len(all_shards)))
+
+        preview_size = max(1, APP_CONFIG.get('progress_preview_size', 50))
+        if top_n and top_n > 0:
+            preview_size = min(preview_size, top_n)
+
+        shard_entries = []
+        shard_timings = {}
+        worker_profiles = []
+        processed = 0
+        cancelled = False
+
+        def collect(shard, entries, timing_info):
+            nonlocal processed
+            shard_entries.append(entries)
+            shard_timings[shard] = timing_info
+            processed += timing_info['total_cvs_scanned']
+            if progress_callback:
+                progress_callback(processed, total_cvs, merge_top_n(shard_entries, preview_size))
+
+        if workers > 1:
+            from concurrent.futures import wait, FIRST_COMPLETED
+            executors = self._get_executors(workers)
+            self._cancel_flag.clear()
+            pending = {}
+            for shard, indexes in shards.items():
+                worker = self.shard_worker(shard)
+                future = executors[worker].submit(
+                    _search_shard_in_worker, shard, shard_index_path(shard, worker),
+                    [cv_data_list[i] for i in indexes], indexes, self.similarity_threshold, self.use_cache,
+                    keywords, algorithm, top_n, profile)
+                pending[future] = shard
+            try:
+                while pending:
+                    if not cancelled and cancel_event is not None and cancel_event.is_set():
+                        # Queued shards are dropped; running ones stop at their next CV
+                        cancelled = True
+                        self._cancel_flag.set()
+                        for future in pending:
+                            future.cancel()
+                    done, _ = wait(pending, timeout=0.1, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        shard = pending.pop(future)
+                        if future.cancelled():
+                            continue
+                        entries, timing_info, worker_profile = future.result()
+                        if worker_profile:
+                            worker_profiles.append(worker_profile)
+                        collect(shard, entries, timing_info)
+                        cancelled = cancelled or timing_info['cancelled']
+            finally:
+                for future in pending:
+                    future.cancel()
+        else:
+            for shard, indexes in shards.items():
+                if cancel_event is not None and cancel_event.is_set():
+                    cancelled = True
+                    break
+                entries, timing_info = search_shard(self.get_shard(shard), [cv_data_list[i] for i in indexes],
+                                                    indexes, keywords, algorithm, top_n, cancel_event)
+                collect(shard, entries, timing_info)
+                cancelled = cancelled or timing_info['cancelled']
+
+        start = time.perf_counter_ns()
+        ranked_results = merge_top_n(shard_entries, top_n)
+        merge_ns = time.perf_counter_ns() - start
+
+        stages = StageTimings()
+        if fetch_time_ns is not None:
+            stages.add('db_fetch', fetch_time_ns)
+        for timing_info in shard_timings.values():
+            stages.merge(StageTimings.from_summary(timing_info['stage_timings']))
+        stages.add('ranking', merge_ns)
+
+        timing_info = {
+            'exact_match_time': stages.total_seconds('exact_match'),
+            'fuzzy_match_time': stages.total_seconds('fuzzy_match'),
+            'extraction_time': stages.total_seconds('extraction'),
+            'db_fetch_time': stages.total_seconds('db_fetch'),
+            'search_time': (time.perf_counter_ns() - search_start) / 1e9,
+            'stage_timings': stages.summary(),
+            'fuzzy_distance_computations': sum(t['fuzzy_distance_computations'] for t in shard_timings.values()),
+            'fuzzy_computations_saved': sum(t['fuzzy_computations_saved'] for t in shard_timings.values()),
+            'total_cvs_scanned': processed,
+            'algorithm_used': algorithm,
+            'results_returned': len(ranked_results),
+            'workers': workers,
+            'corpus_index': any(t.get('corpus_index') for t in shard_timings.values()),
+            'cancelled': cancelled,
+            'result_cache': 'hit' if shard_timings and all(t.get('result_cache') == 'hit'
+                                                          for t in shard_timings.values()) else 'miss',
+            'result_cache_hits': sum(t.get('result_cache_hits', 0) for t in shard_timings.values()),
+            'result_cache_misses': sum(t.get('result_cache_misses', 0) for t in shard_timings.values()),
+            'shards': {
+                shard: {'cvs': len(shards[shard]), 'results': len(shard_entries[position]),
+                        'search_time': t['search_time'], 'result_cache': t.get('result_cache')}
+                for position, (shard, t) in enumerate(shard_timings.items())
+            },
+            'shards_skipped': len(all_shards) - len(shards),
+        }
+        return ranked_results, timing_info, worker_profiles
@@ -0,0 +1,133 @@
+import os
+import time
+import cProfile
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, List
+
+from config import APP_CONFIG
+
+# Stages of a CV search, in pipeline order
+# (corpus_index: building or reusing the memory-mapped corpus, which extracts the CV texts in one pass)
+STAGES = ('db_fetch', 'corpus_index', 'extraction', 'exact_match', 'fuzzy_match', 'scoring', 'ranking')
+
+STAGE_LABELS = {
+    'db_fetch': 'DB Fetch',
+    'corpus_index': 'Corpus Index',
+    'extraction': 'Extraction',
+    'exact_match': 'Exact Match',
+    'fuzzy_match': 'Fuzzy Match',
+    'scoring': 'Scoring',
+    'ranking': 'Ranking',
+}
+
+class StageTimings:
+    """
+    Per-stage timing samples in nanoseconds (perf_counter_ns).
+    Per-CV stages get one sample per CV, so min/avg/max are per CV
+    """
+    def __init__(self):
+        self.total = dict.fromkeys(STAGES, 0)
+        self.count = dict.fromkeys(STAGES, 0)
+        self.min = dict.fromkeys(STAGES, None)
+        self.max = dict.fromkeys(STAGES, 0)
+
+    @classmethod
+    def from_summary(cls, summary: Dict[str, Dict]) -> 'StageTimings':
+        """Rebuild timings from summary() output, e.g. to merge the timings of several searches"""
+        timings = cls()
+        for stage, values in summary.items():
+            if stage not in timings.total or not values['count']:
+                continue
+            timings.total[stage] = round(values['total_ms'] * 1e6)
+            timings.count[stage] = values['count']
+            timings.min[stage] = round(values['min_ms'] * 1e6)
+            timings.max[stage] = round(values['max_ms'] * 1e6)
+        return timings
+
+    def add(self, stage: str, elapsed_ns: int):
+        """Record one sample"""
+        self.total[stage] += elapsed_ns
+        self.count[stage] += 1
+        if self.min[stage] is None or elapsed_ns < self.min[stage]:
+            self.min[stage] = elapsed_ns
+        if elapsed_ns > self.max[stage]:
+            self.max[stage] = elapsed_ns
+
+    def add_all(self, samples: Dict[str, int]):
+        """Record one sample for each stage in a dict of stage -> elapsed_ns"""
+        for stage, elapsed_ns in samples.items():
+            self.add(stage, elapsed_ns)
+
+    def merge(self, other: 'StageTimings'):
+        """Add the samples of another StageTimings (e.g. from a worker process)"""
+        for stage in STAGES:
+            if not other.count[stage]:
+                continue
+            self.total[stage] += other.total[stage]
+            self.count[stage] += other.count[stage]
+            if self.min[stage] is None or other.min[stage] < self.min[stage]:
+                self.min[stage] = other.min[stage]
+            self.max[stage] = max(self.max[stage], other.max[stage])
+
+    def total_seconds(self, stage: str) -> float:
+        return self.total[stage] / 1e9
+
+    def summary(self) -> Dict[str, Dict]:
+        """stage -> {'total_ms', 'count', 'min_ms', 'avg_ms', 'max_ms'} for every stage"""
+        summary = {}
+        for stage in STAGES:
+            count = self.count[stage]
+            summary[stage] = {
+                'total_ms': self.total[stage] / 1e6,
+                'count': count,
+                'min_ms': (self.min[stage] or 0) / 1e6,
+                'avg_ms': self.total[stage] / count / 1e6 if count else 0.0,
+                'max_ms': self.max[stage] / 1e6,
+            }
+        return summary
+
+def profiling_enabled() -> bool:
+    """cProfile is switched on by ATS_PROFILE=1 or APP_CONFIG['profile_search']"""
+    value = os.environ.get('ATS_PROFILE')
+    if value is not None:
+        return value.strip().lower() not in ('', '0', 'false', 'no')
+    return bool(APP_CONFIG.get('profile_search', False))
+
+@contextmanager
+def profile_search(enabled: bool = None):
+    """
+    Run the enclosed code under cProfile and dump the stats to a .prof file
+    (open with `python -m pstats file.prof` or snakeviz). Yields the file path,
+    or None when profiling is off. Only the calling thread is profiled
+    """
+    if enabled is None:
+        enabled = profiling_enabled()
+    if not enabled:
+        yield None
+        return
+
+    profile_dir = APP_CONFIG.get('profile_dir', 'logs/profiles')
+    os.makedirs(profile_dir, exist_ok=True)
+    path = os.path.join(profile_dir, f"search_{datetime.now():%Y%m%d_%H%M%S}_{time.perf_counter_ns() % 10**6}.prof")
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield path
+    finally:
+        profiler.disable()
+        profiler.dump_stats(path)
+
+
+def merge_profiles(path: str, other_paths: List[str]):
+    """Add the stats of other .prof files (e.g. dumped by worker processes) to path and delete them"""
+    others = [other for other in other_paths if other and os.path.exists(other)]
+    if not others:
+        return
+    import pstats
+    stats = pstats.Stats(path)
+    stats.add(*others)
+    stats.dump_stats(path)
+    for other in others:
+        os.remove(other)
@@ -0,0 +1,30 @@
+"""
+Shared fixtures for the test scripts
+"""
+
+import pytest
+
+from config import APP_CONFIG
+
+@pytest.fixture(autouse=True)
+def corpus_index_path(monkeypatch, tmp_path):
+    """Every test writes its corpus index files under its own tmp_path, not the repository's temp/ folder"""
+    path = str(tmp_path / "corpus")
+    monkeypatch.setitem(APP_CONFIG, 'corpus_index_path', path)
+    return path
+
+@pytest.fixture
+def make_cvs():
+    """Build CV items from texts (and optional roles) the way search_cvs gets them from the database"""
+    def make(texts, roles=None):
+        return [
+            {'applicant_id': i, 'application_role': roles[i] if roles else None, 'cv_path': f'missing/{i}.pdf',
+             'content_hash': f'h{i}', 'cv_text': text}
+            for i, text in enumerate(texts)
+        ]
+    return make
+
+@pytest.fixture
+def two_cvs(make_cvs):
+    """A matching and a non-matching CV for searches on 'python'/'sql'"""
+    return make_cvs(["python and sql", "java developer"])
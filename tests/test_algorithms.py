@@ -2,9 +2,12 @@
 Test script to verify KMP, Boyer-Moore, and Levenshtein algorithms
 """
 
-from algorithms.KMP import kmp_search, kmp_search_all
-from algorithms.BM import boyer_moore, boyer_moore_all
-from algorithms.levenshtein import levenshtein_distance
+from algorithms.KMP import kmp_search, kmp_search_all, compile_kmp
+from algorithms.BM import boyer_moore, boyer_moore_all, compile_bm
+from algorithms.aho_corasick import aho_corasick_search_all
+from algorithms.bitap import bitap_search_all
+from algorithms.native import native_search_all, NativeMultiSearcher
+from algorithms.levenshtein import levenshtein_distance, levenshtein_within, compile_levenshtein
 
 def test_kmp():
     """Test KMP algorithm"""
@@ -48,6 +51,89 @@ def test_boyer_moore():
     
     print()
 
+def test_compiled_searchers():
+    """Test precompiled KMP and Boyer-Moore searchers"""
+    print("Testing Compiled Searchers:")
+    
+    texts = ["hello world hello python hello", "aaaaaa", "abababab", "", "no match here"]
+    patterns = ["hello", "aa", "aba", "xyz", "a", ""]
+    
+    # One compiled searcher is reused for every text
+    for pattern in patterns:
+        kmp = compile_kmp(pattern)
+        bm = compile_bm(pattern)
+        for text in texts:
+            assert kmp.find_all(text) == kmp_search_all(text, pattern)
+            assert bm.find_all(text) == boyer_moore_all(text, pattern)
+            assert kmp.count(text) == bm.count(text) == len(kmp_search_all(text, pattern))
+    
+    # Searchers are immutable
+    try:
+        kmp.pattern = "changed"
+        assert False, "KMPSearcher should be immutable"
+    except AttributeError:
+        pass
+    
+    print(f"  {compile_kmp('hello')} positions: {compile_kmp('hello').find_all(texts[0])}")
+    print()
+
+def test_boyer_moore_variants():
+    """Test the Boyer-Moore variants against boyer_moore_all, including non-Latin-1 text"""
+    print("Testing Boyer-Moore Variants:")
+    
+    texts = ["hello world hello python hello", "aaaaaa", "abababab", "", "no match here",
+             "senior\xa0engineer, ingénieur – \u4e2d\u6587 engineer"]
+    patterns = ["hello", "aa", "aba", "abab", "xyz", "a", "", "engineer", "\u4e2d\u6587", "ingénieur –"]
+    
+    for variant in ('bad_char', 'full', 'horspool', 'sunday'):
+        for pattern in patterns:
+            searcher = compile_bm(pattern, variant)
+            for text in texts:
+                assert searcher.find_all(text) == boyer_moore_all(text, pattern) == kmp_search_all(text, pattern), \
+                    f"{variant} failed for {pattern!r} in {text!r}"
+        stats = compile_bm("hello", variant).shift_stats(texts[0])
+        print(f"  {variant:9} average shift for 'hello': {stats['average_shift']:.2f}")
+    
+    try:
+        compile_bm("hello", "unknown")
+        assert False, "unknown variant should raise ValueError"
+    except ValueError:
+        pass
+    print()
+
+def test_aho_corasick():
+    """Test Aho-Corasick algorithm"""
+    print("Testing Aho-Corasick Algorithm:")
+    
+    text = "java developer with javascript, java and script skills; aaaa"
+    patterns = ["java", "javascript", "script", "aa", "xyz", ""]
+    
+    # Single pass over the text must agree with KMP and BM for every pattern
+    positions = aho_corasick_search_all(text, patterns)
+    for pattern in patterns:
+        print(f"  Search '{pattern}': positions {positions[pattern]}")
+        assert positions[pattern] == kmp_search_all(text, pattern)
+        assert positions[pattern] == boyer_moore_all(text, pattern)
+    
+    print()
+
+def test_native():
+    """Test the str.find and regex alternation baseline against KMP and Aho-Corasick"""
+    print("Testing Native Search:")
+    
+    text = "java and javascript, aaaa, python"
+    patterns = ["java", "javascript", "aa", "python", "ruby", ""]
+    
+    for pattern in patterns:
+        assert native_search_all(text, pattern) == kmp_search_all(text, pattern), pattern
+    # Overlapping keywords starting at the same position are all reported
+    assert NativeMultiSearcher(patterns).search_all(text) == aho_corasick_search_all(text, patterns)
+    # Regex metacharacters are matched literally
+    assert native_search_all("c++ and c#", "c++") == [0]
+    
+    print(f"  'aa' in 'aaaa': {native_search_all('aaaa', 'aa')}")
+    print()
+
 def test_levenshtein():
     """Test Levenshtein Distance algorithm"""
     print("Testing Levenshtein Distance:")
@@ -69,6 +155,60 @@ def test_levenshtein():
     
     print()
 
+def test_levenshtein_within():
+    """Test bounded Levenshtein Distance"""
+    print("Testing Bounded Levenshtein Distance:")
+    
+    words = ["python", "pyton", "pythons", "java", "react", "reach", "javascript", "javscript", ""]
+    
+    # Within the limit the exact distance is returned, otherwise limit + 1
+    for str1 in words:
+        for str2 in words:
+            distance = levenshtein_distance(str1, str2)
+            for max_distance in range(0, 5):
+                bounded = levenshtein_within(str1, str2, max_distance)
+                expected = distance if distance <= max_distance else max_distance + 1
+                assert bounded == expected, (str1, str2, max_distance)
+    
+    print(f"  'python' vs 'java' with limit 2: {levenshtein_within('python', 'java', 2)}")
+    print()
+
+def test_levenshtein_bit_parallel():
+    """Test that the bit-parallel matcher agrees with the dynamic programming versions"""
+    print("Testing Bit-Parallel Levenshtein:")
+    
+    words = ["python", "pyton", "pythons", "java", "react", "reach", "javascript", "javscript", "",
+             "café", "cafe", "a" * 64, "a" * 65 + "b", "b" * 70]
+    
+    for str1 in words:
+        matcher = compile_levenshtein(str1)
+        for str2 in words:
+            assert matcher.distance(str2) == levenshtein_distance(str1, str2), (str1, str2)
+            for max_distance in range(0, 5):
+                assert matcher.within(str2, max_distance) == levenshtein_within(str1, str2, max_distance)
+    
+    print(f"  'javascript' vs 'javscript': {compile_levenshtein('javascript').distance('javscript')}")
+    print()
+
+def test_bitap():
+    """Test approximate phrase search with k errors"""
+    print("Testing Bitap Approximate Search:")
+    
+    text = "experience in machne lerning and machine-learning, also project managment"
+    matches = bitap_search_all(text, "machine learning", 3)
+    assert [(text[start:end], distance) for start, end, distance in matches] == [
+        ("machne lerning", 2), ("machine-learning", 1)
+    ]
+    
+    # Every reported distance is the edit distance of the reported substring
+    for pattern in ("project management", "python", "data science"):
+        for start, end, distance in bitap_search_all(text, pattern, 2):
+            assert distance == levenshtein_distance(pattern, text[start:end]) <= 2
+    assert bitap_search_all(text, "data science", 2) == []
+    
+    print(f"  'project management' in text: {bitap_search_all(text, 'project management', 2)}")
+    print()
+
 def test_case_sensitivity():
     """Test case sensitivity handling"""
     print("Testing Case Sensitivity:")
@@ -123,7 +263,14 @@ def main():
     
     test_kmp()
     test_boyer_moore()
+    test_compiled_searchers()
+    test_boyer_moore_variants()
+    test_aho_corasick()
+    test_native()
     test_levenshtein()
+    test_levenshtein_within()
+    test_levenshtein_bit_parallel()
+    test_bitap()
     test_case_sensitivity()
     test_performance()
     
@@ -0,0 +1,91 @@
+"""
+Test script to verify the database connection pool (without a MySQL server)
+"""
+
+import threading
+
+from database.database import ConnectionPool
+
+class FakeConnection:
+    """Minimal stand-in for a PyMySQL connection"""
+    def __init__(self):
+        self.open = True
+        self.pings = 0
+
+    def ping(self, reconnect=True):
+        self.pings += 1
+
+    def close(self):
+        self.open = False
+
+class FakePool(ConnectionPool):
+    def __init__(self, **options):
+        super().__init__(**options)
+        self.created = []
+
+    def _create_connection(self):
+        connection = FakeConnection()
+        self.created.append(connection)
+        return connection
+
+def test_connection_pool_reuse():
+    """Test that connections are reused and health-checked"""
+    print("Testing Connection Pool:")
+
+    pool = FakePool(min_size=1, max_size=2)
+    pool.fill()
+    assert len(pool.created) == 1
+
+    for _ in range(5):
+        with pool.connection() as connection:
+            assert connection is pool.created[0]
+    assert pool.created[0].pings == 5
+    print(f"  Stats after 5 checkouts: {pool.stats()}")
+
+    # Closed connections are dropped instead of going back to the pool
+    with pool.connection() as connection:
+        connection.close()
+    assert pool.stats()['open'] == 0
+
+    pool.close_all()
+    print()
+
+def test_connection_pool_max_size():
+    """Test that the pool never opens more than max_size connections"""
+    print("Testing Connection Pool Limits:")
+
+    pool = FakePool(min_size=0, max_size=2, acquire_timeout=5)
+    in_use = []
+    peak = []
+    lock = threading.Lock()
+
+    def worker():
+        with pool.connection() as connection:
+            with lock:
+                in_use.append(connection)
+                peak.append(len(in_use))
+            with lock:
+                in_use.remove(connection)
+
+    threads = [threading.Thread(target=worker) for _ in range(10)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(pool.created) <= 2
+    assert max(peak) <= 2
+    assert pool.stats()['in_use'] == 0
+
+    # With every connection checked out, acquire times out
+    pool.acquire_timeout = 0.05
+    first, second = pool.acquire(), pool.acquire()
+    try:
+        pool.acquire()
+        assert False, "acquire should time out"
+    except TimeoutError:
+        pass
+    pool.release(first)
+    pool.release(second)
+    print(f"  Connections created for 10 threads: {len(pool.created)}")
+    print()
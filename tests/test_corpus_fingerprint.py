@@ -0,0 +1,53 @@
+"""
+Test script to verify the incremental corpus sync planning
+"""
+
+import os
+
+from utils.corpus_fingerprint import scan_corpus, plan_sync, file_sha256
+
+def test_plan_sync(tmp_path):
+    """Test that only new, changed and deleted files are reported, and unchanged files are not hashed"""
+    print("Testing Corpus Sync Plan:")
+
+    category = tmp_path / "ACCOUNTANT"
+    category.mkdir()
+    for name in ("a.pdf", "b.pdf", "c.pdf", "d.pdf"):
+        (category / name).write_bytes(name.encode())
+    (category / "notes.txt").write_text("ignored")
+
+    data_dir = str(tmp_path)
+    scanned = scan_corpus(data_dir)
+    assert len(scanned) == 4
+
+    path = lambda name: os.path.normpath(os.path.join(data_dir, "ACCOUNTANT", name))
+    stored = {}
+    for applicant_id, name in enumerate(("a.pdf", "b.pdf", "c.pdf"), start=1):
+        mtime_ns, size = scanned[path(name)]
+        stored[path(name)] = {'applicant_id': applicant_id, 'mtime_ns': mtime_ns, 'size': size,
+                              'file_hash': file_sha256(path(name))}
+    stored[path("gone.pdf")] = {'applicant_id': 9, 'mtime_ns': 0, 'size': 1, 'file_hash': ''}
+
+    # b.pdf: new content; c.pdf: same content, new mtime
+    (category / "b.pdf").write_bytes(b"b.pdf changed")
+    os.utime(category / "c.pdf", ns=(0, 10**9))
+
+    hashed = []
+    def hash_file(cv_path):
+        hashed.append(os.path.basename(cv_path))
+        return file_sha256(cv_path)
+
+    plan = plan_sync(scan_corpus(data_dir), stored, hash_file=hash_file)
+    print(f"  Plan: {plan}")
+    assert plan['new'] == [path("d.pdf")]
+    assert [entry[:2] for entry in plan['changed']] == [(path("b.pdf"), 2)]
+    assert [entry[:2] for entry in plan['touched']] == [(path("c.pdf"), 3)]
+    assert plan['deleted'] == [(path("gone.pdf"), 9)]
+    assert plan['unchanged'] == 1
+    assert sorted(hashed) == ["b.pdf", "c.pdf"]
+
+    # CVs seeded before fingerprints existed are adopted, not inserted again
+    plan = plan_sync(scan_corpus(data_dir), {}, untracked={path("a.pdf"): 1})
+    assert [entry[:2] for entry in plan['changed']] == [(path("a.pdf"), 1)]
+    assert len(plan['new']) == 3
+    print()
@@ -0,0 +1,67 @@
+"""
+Test script to verify searches over the memory-mapped corpus index
+"""
+
+from src.corpus_index import CorpusIndex, open_corpus_index
+from src.cv_matcher import CVMatcher
+from config import APP_CONFIG
+
+TEXTS = [
+    "Python developer, SQL and Python",
+    "",
+    "Café manager from İstanbul, knows python",
+    "Accountant with Excel",
+]
+
+def test_corpus_index_search(tmp_path):
+    """Test that hits are mapped back to the right document and character position"""
+    print("Testing Corpus Index Search:")
+
+    path = str(tmp_path / "corpus")
+    index = CorpusIndex.build(path, TEXTS, "sig-1")
+    matcher = CVMatcher(use_cache=False)
+
+    for algorithm in ('KMP', 'BM', 'SUNDAY', 'AC'):
+        keywords = ['python', 'sql', 'excel', 'café']
+        hits = index.search(matcher.compile_keywords(keywords, algorithm, encoding='utf-8'))
+        for doc, text in enumerate(TEXTS):
+            expected = matcher.exact_match_search(text, keywords, algorithm)['matches'] if text else {}
+            found = {kw: {'count': len(p), 'positions': p} for kw, p in hits.get(doc, {}).items() if p}
+            assert found == expected, (algorithm, doc)
+
+    # A match never spans the separator between two documents
+    assert index.search(matcher.compile_keywords(['python\0', 'excel'], 'KMP', encoding='utf-8')) == {3: {'excel': [16]}}
+    assert index.text(2) == TEXTS[2].lower()
+    print(f"  {len(index)} documents, {len(index.buffer)} bytes mapped")
+
+    # Reopened while the signature matches, rebuilt when it changes
+    reopened = open_corpus_index(path, "sig-1", [])
+    assert len(reopened) == len(TEXTS)
+    reopened.close()
+    index.close()
+    rebuilt = open_corpus_index(path, "sig-2", ["java"])
+    assert len(rebuilt) == 1 and rebuilt.signature == "sig-2"
+    rebuilt.close()
+    print()
+
+def test_search_with_corpus_index(monkeypatch, make_cvs):
+    """Test that a search over the corpus index ranks CVs like the per-CV search"""
+    print("Testing Search With Corpus Index:")
+
+    cv_items = make_cvs(TEXTS)
+    keywords = ['Python', 'sql', 'exel']
+
+    results = {}
+    for use_index in (False, True):
+        monkeypatch.setitem(APP_CONFIG, 'use_corpus_index', use_index)
+        matcher = CVMatcher(similarity_threshold=0.7, use_cache=False)
+        ranked, timing_info = matcher.search_cvs(cv_items, keywords, 'BM', workers=1)
+        assert timing_info['corpus_index'] == use_index
+        results[use_index] = ranked
+        matcher.close_corpus_index()
+
+    assert results[True] == results[False]
+    # Previews keep the original case
+    assert results[True][0]['cv_text'] == TEXTS[0]
+    print(f"  {len(results[True])} identical results")
+    print()
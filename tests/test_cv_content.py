@@ -0,0 +1,47 @@
+"""
+Test script to verify CV content extracted at ingest time and read back at search time
+"""
+
+import os
+import json
+
+from src.ekstrak_regex import build_cv_content, content_hash, extract_regex
+from src.cv_matcher import CVMatcher
+
+DATA_CV = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                       "data", "ACCOUNTANT", "10554236.pdf")
+
+def test_build_cv_content():
+    """Test that ingest stores the same text the matcher would extract"""
+    print("Testing CV Content Extraction:")
+
+    content = build_cv_content(DATA_CV)
+    assert content['cv_text'] == extract_regex(DATA_CV)
+    assert content['content_hash'] == content_hash(content['cv_text'])
+    assert set(content['sections']) == {"summary", "skills", "experience", "education"}
+    assert build_cv_content("missing.pdf") is None
+
+    print(f"  Hash: {content['content_hash'][:16]}..., sections: {list(content['sections'])}")
+    print()
+
+def test_matcher_uses_stored_content():
+    """Test that search and summary read the stored content instead of the PDF"""
+    print("Testing Stored CV Content:")
+
+    matcher = CVMatcher(use_cache=False)
+    sections = {"summary": ["Python developer"], "skills": ["SQL"], "experience": [], "education": []}
+    cv_item = {
+        'cv_path': 'does/not/exist.pdf',
+        'cv_text': "Summary\nPython developer with SQL skills",
+        'cv_sections': json.dumps(sections),
+    }
+
+    candidate, _ = matcher.score_cv(cv_item, ['python', 'sql'], 'KMP')
+    assert candidate is not None
+    assert candidate['exact_matches']['python']['count'] == 1
+    assert matcher.get_cv_sections(cv_item) == sections
+
+    # Rows ingested before CVContent existed fall back to the PDF
+    assert matcher.get_cv_text({'cv_path': 'does/not/exist.pdf', 'cv_text': None}) == ""
+    print("  Stored text and sections used without opening the PDF")
+    print()
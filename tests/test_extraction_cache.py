@@ -0,0 +1,48 @@
+"""
+Test script to verify the persistent extracted text cache
+"""
+
+import os
+
+from utils.extraction_cache import ExtractionCache
+
+def test_extraction_cache(tmp_path):
+    """Test cache hits, stale re-extraction and purge"""
+    print("Testing Extraction Cache:")
+
+    cv_file = tmp_path / "cv.pdf"
+    cv_file.write_text("first version")
+    cache = ExtractionCache(str(tmp_path / "cache.sqlite3"))
+
+    calls = []
+    def extractor(path):
+        calls.append(path)
+        with open(path) as f:
+            return f.read().upper()
+
+    # First lookup extracts, second one is served from the cache
+    assert cache.get_or_extract(str(cv_file), extractor) == "FIRST VERSION"
+    assert cache.get_or_extract(str(cv_file), extractor) == "FIRST VERSION"
+    assert len(calls) == 1
+
+    # Changing the file (size and mtime) forces re-extraction
+    cv_file.write_text("second, longer version")
+    os.utime(cv_file, ns=(0, 10**9))
+    assert cache.get_or_extract(str(cv_file), extractor) == "SECOND, LONGER VERSION"
+    assert len(calls) == 2
+
+    stats = cache.stats()
+    print(f"  Stats: {stats}")
+    assert stats['entries'] == 1
+    assert stats['hits'] == 1
+    assert stats['misses'] == 2
+    assert stats['stale'] == 1
+
+    # Purging missing files only removes entries whose PDF is gone
+    assert cache.purge(missing_only=True) == 0
+    cv_file.unlink()
+    assert cache.purge(missing_only=True) == 1
+    assert cache.stats()['entries'] == 0
+    cache.close()
+
+    print()
@@ -0,0 +1,94 @@
+"""
+Test script to verify FULLTEXT query building and the LIKE fallback (without a MySQL server)
+"""
+
+from config import APP_CONFIG
+from database.database import DatabaseConnection, fulltext_query, like_pattern
+from src.cv_matcher import CVMatcher
+
+class RecordingDatabase(DatabaseConnection):
+    """
+    Records queries instead of running them; MATCH queries fail when fulltext_available
+    is False and find one row when match_found is True, LIKE queries find like_rows
+    """
+    def __init__(self, fulltext_available=True, use_fulltext=True, match_found=True, like_rows=None):
+        super().__init__(use_fulltext=use_fulltext)
+        self.fulltext_available = fulltext_available
+        self.match_found = match_found
+        self.like_rows = like_rows or []
+        self.queries = []
+
+    def execute_query(self, query, params=None):
+        self.queries.append((query, params))
+        if "MATCH" in query and not self.fulltext_available:
+            return None
+        if "MATCH" in query:
+            return [{'applicant_id': 1}] if self.match_found else []
+        return self.like_rows
+
+def test_fulltext_query():
+    """Test boolean mode query building"""
+    print("Testing FULLTEXT Query:")
+
+    assert fulltext_query("Python") == "+python*"
+    assert fulltext_query("customer service") == "+customer* +service*"
+    # Terms the index cannot serve as a whole are left to LIKE
+    assert fulltext_query("c++ developer") is None
+    assert fulltext_query("C#") is None
+    assert fulltext_query("ui design") is None
+    assert fulltext_query("the") is None
+    assert fulltext_query("sql) OR (1=1") is None
+    assert like_pattern("100%_a") == "%100\\%\\_a%"
+    print(f"  'customer service' -> {fulltext_query('customer service')}")
+    print()
+
+def test_match_or_like_fallback():
+    """Test that searches use MATCH ... AGAINST and fall back to LIKE when needed"""
+    print("Testing FULLTEXT Fallback:")
+
+    db = RecordingDatabase()
+    db.search_applicants_by_name("Budi Santoso")
+    assert len(db.queries) == 1 and "MATCH(first_name, last_name)" in db.queries[0][0]
+    assert db.queries[0][1] == ("+budi* +santoso*",)
+
+    # FULLTEXT is opt-in
+    db = RecordingDatabase(use_fulltext=False)
+    db.search_applications_by_role("accountant")
+    assert len(db.queries) == 1 and "LIKE" in db.queries[0][0]
+
+    # Too short for the FULLTEXT index
+    db = RecordingDatabase()
+    db.search_applicants_by_name("Li")
+    assert "LIKE" in db.queries[0][0] and db.queries[0][1] == ("%Li%", "%Li%")
+
+    # Missing FULLTEXT index
+    db = RecordingDatabase(fulltext_available=False)
+    db.get_applicants_by_role("accountant")
+    assert len(db.queries) == 2 and "LIKE" in db.queries[1][0]
+
+    # One rule for every term: no word match is an empty result, not a second LIKE scan
+    db = RecordingDatabase(match_found=False)
+    assert db.get_applicants_by_role("count") == []
+    assert len(db.queries) == 1
+
+    db = RecordingDatabase()
+    db.search_applicants_by_skill("python")
+    assert len(db.queries) == 1 and "MATCH(skills)" in db.queries[0][0]
+    print("  MATCH used when possible, LIKE otherwise")
+    print()
+
+def test_prefilter_covers_substrings(monkeypatch):
+    """Test that the KMP/BM prefilter asks the database for substrings, not word prefixes"""
+    print("Testing Search Prefilter:")
+
+    db = RecordingDatabase(like_rows=[{'first_name': 'Budi', 'last_name': 'Santoso', 'skills': 'MySQL, JavaScript'}])
+    monkeypatch.setitem(APP_CONFIG, 'search_prefilter', True)
+    matcher = CVMatcher(use_cache=False)
+    matcher._db = db
+
+    results = matcher.search_applicants_kmp("SQL")
+    assert len(db.queries) == 1 and "MATCH" not in db.queries[0][0]
+    assert db.queries[0][1] == ("%SQL%",)
+    assert [r['first_name'] for r in results] == ['Budi']
+    print(f"  Prefilter params: {db.queries[0][1]}")
+    print()
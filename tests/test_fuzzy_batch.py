@@ -0,0 +1,56 @@
+"""
+Test script to verify the NumPy batch Levenshtein used for fuzzy matching
+"""
+
+import pytest
+
+from algorithms.levenshtein import levenshtein_distance, levenshtein_within, max_distance_for_similarity
+from algorithms.levenshtein_batch import HAS_NUMPY, levenshtein_batch, levenshtein_batch_within
+from src.cv_matcher import CVMatcher
+from config import APP_CONFIG
+
+pytestmark = pytest.mark.skipif(not HAS_NUMPY, reason="NumPy is not installed")
+
+WORDS = ["python", "pyton", "pythons", "java", "react", "reach", "javascript", "javscript",
+         "café", "cafe", "a", "", "management", "a" * 70]
+
+def test_levenshtein_batch():
+    """Test that batch distances are identical to levenshtein_distance"""
+    print("Testing Batch Levenshtein:")
+
+    for keyword in WORDS:
+        distances = levenshtein_batch(keyword, WORDS)
+        assert distances.tolist() == [levenshtein_distance(keyword, word) for word in WORDS], keyword
+
+        for threshold in (0.5, 0.7, 0.8):
+            bounded, limits = levenshtein_batch_within(keyword, WORDS, threshold)
+            expected_limits = [max_distance_for_similarity(max(len(keyword), len(word)), threshold) for word in WORDS]
+            assert limits.tolist() == expected_limits
+            assert bounded.tolist() == [levenshtein_within(keyword, word, limit)
+                                        for word, limit in zip(WORDS, expected_limits)]
+
+    assert levenshtein_batch("python", []).tolist() == []
+    print(f"  'python' vs {WORDS[:4]}: {levenshtein_batch('python', WORDS[:4]).tolist()}")
+    print()
+
+def test_fuzzy_search_with_batch(monkeypatch):
+    """Test that fuzzy applicant search gives the same result with and without NumPy batches"""
+    print("Testing Fuzzy Search With Batches:")
+
+    applicants = [
+        {'applicant_id': 1, 'first_name': 'Ana', 'summary': 'Experienced pyton developer', 'skills': 'sql'},
+        {'applicant_id': 2, 'first_name': 'Budi', 'summary': 'Accountant', 'skills': 'excel pythons'},
+        {'applicant_id': 3, 'first_name': 'Citra', 'summary': 'Designer', 'skills': 'figma'},
+    ]
+    matcher = CVMatcher(similarity_threshold=0.7, use_cache=False)
+    monkeypatch.setattr(matcher, 'get_all_applicants', lambda: [dict(a) for a in applicants])
+
+    results = {}
+    for min_words in (1, 10**9):
+        monkeypatch.setitem(APP_CONFIG, 'fuzzy_batch_min_words', min_words)
+        results[min_words] = matcher.search_applicants_fuzzy('python')
+
+    assert results[1] == results[10**9]
+    assert [a['applicant_id'] for a in results[1]] == [2, 1]
+    print(f"  Matched words: {[a['matched_word'] for a in results[1]]}")
+    print()
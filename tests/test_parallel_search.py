@@ -0,0 +1,47 @@
+"""
+Test script to verify that the parallel (process pool) search matches the sequential one
+"""
+
+import pytest
+
+from src.cv_matcher import CVMatcher
+from config import APP_CONFIG
+
+TEXTS = [
+    "Python developer with SQL and Excel",
+    "Graphic designer",
+    "Data analyst: pyton, sql, excel, machne lerning",
+    "Accountant using Excel",
+    "Machine learning engineer, python",
+    "Sales associate",
+    "SQL reporting and python scripts",
+]
+KEYWORDS = ['python', 'sql', 'excel', 'machine learning']
+
+@pytest.fixture
+def cvs(make_cvs):
+    return make_cvs(TEXTS * 3)
+
+def test_parallel_matches_sequential(monkeypatch, cvs):
+    """Test that chunked worker processes give the same ranking and timing keys as one process"""
+    print("Testing Parallel Search:")
+
+    monkeypatch.setitem(APP_CONFIG, 'parallel_chunk_size', 4)
+    matcher = CVMatcher(similarity_threshold=0.8, use_cache=False)
+    try:
+        for top_n in (None, 1, 5):
+            sequential, sequential_timing = matcher.search_cvs(cvs, KEYWORDS, 'KMP', top_n, workers=1)
+            matcher.result_cache.clear()
+            parallel, parallel_timing = matcher.search_cvs(cvs, KEYWORDS, 'KMP', top_n, workers=2)
+            matcher.result_cache.clear()
+
+            assert parallel == sequential, top_n
+            assert set(parallel_timing) == set(sequential_timing)
+            assert parallel_timing['workers'] == 2 and sequential_timing['workers'] == 1
+            assert parallel_timing['total_cvs_scanned'] == len(cvs)
+            assert parallel_timing['results_returned'] == len(sequential)
+    finally:
+        matcher.shutdown_executor()
+        matcher.close_corpus_index()
+    print(f"  Ranking: {[(r['cv_data']['applicant_id'], r['total_score']) for r in sequential]}")
+    print()
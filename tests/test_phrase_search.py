@@ -0,0 +1,37 @@
+"""
+Test script to verify fuzzy matching of multi-word keywords
+"""
+
+from src.cv_matcher import CVMatcher
+
+def test_fuzzy_phrase_match():
+    """Test that misspelled multi-word keywords are found by the fuzzy stage"""
+    print("Testing Fuzzy Phrase Match:")
+
+    matcher = CVMatcher(similarity_threshold=0.8, use_cache=False)
+    text = "Skills\nMachne   Lerning, Python\nLed Project Managment for 3 years"
+
+    result = matcher.fuzzy_match_search(text, ['machine learning', 'project management', 'data science'])
+    matches = result['fuzzy_matches']
+    assert matches['machine learning'][0]['word'] == "machne lerning"
+    assert matches['machine learning'][0]['distance'] == 2
+    assert matches['project management'][0]['word'] == "project managment"
+    assert 'data science' not in matches
+
+    # Positions are offsets of the matched words in the CV text
+    found = matches['project management'][0]
+    assert text[found['start']:found['end']] == "Project Managment"
+
+    # Matches cover whole words: 'customer delive(ry)' is not 'customer service'
+    matcher.similarity_threshold = 0.7
+    assert matcher.phrase_matches('customer service', "Handled customer delivery issues") == []
+    found = matcher.phrase_matches('customer service', "Costumer  servce, retail")
+    assert [(m['word'], m['start'], m['end']) for m in found] == [("costumer servce", 0, 16)]
+    matcher.similarity_threshold = 0.8
+
+    # Phrase matches count towards the score like word matches
+    cv_item = {'cv_path': 'missing.pdf', 'cv_text': text}
+    candidate, _ = matcher.score_cv(cv_item, ['machine learning'], 'KMP')
+    assert candidate is not None and candidate['total_score'] > 0
+    print(f"  {[(kw, m[0]['word'], round(m[0]['similarity'], 2)) for kw, m in matches.items()]}")
+    print()
@@ -0,0 +1,26 @@
+"""
+Test script to verify bounded top-N ranking
+"""
+
+import random
+
+from src.ranking import TopNCollector
+
+def test_top_n_matches_sort():
+    """Test that the bounded heap gives the same order as a full stable sort"""
+    print("Testing Top-N Ranking:")
+    
+    rng = random.Random(7)
+    # Few distinct scores so there are plenty of ties
+    scores = [rng.choice([0.5, 1.0, 2.5, 4.0, 6.95]) for _ in range(200)]
+    expected_all = sorted(range(len(scores)), key=lambda i: scores[i], reverse=True)
+    
+    for top_n in [None, 0, 1, 5, 10, 200, 500]:
+        collector = TopNCollector(top_n)
+        for index, score in enumerate(scores):
+            collector.push(score, index, index)
+        expected = expected_all[:top_n] if top_n else expected_all
+        assert collector.ranked() == expected, top_n
+        print(f"  top_n={top_n}: kept {len(collector)} entries")
+    
+    print()
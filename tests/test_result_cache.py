@@ -0,0 +1,69 @@
+"""
+Test script to verify the search result cache and corpus version invalidation
+"""
+
+import time
+
+from utils.result_cache import ResultCache, bump_corpus_version
+from src.cv_matcher import CVMatcher
+
+def test_result_cache_lru_and_ttl():
+    """Test LRU eviction, TTL expiry and invalidation by corpus version"""
+    print("Testing Result Cache:")
+
+    cache = ResultCache(max_entries=2, ttl=0)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    assert cache.get('a') == 1  # 'a' becomes most recently used
+    cache.put('c', 3)           # evicts 'b'
+    assert cache.get('b') is None
+    assert cache.get('c') == 3
+
+    bump_corpus_version()
+    assert cache.get('a') is None
+    assert cache.stats()['entries'] == 0
+
+    # Entries are also bounded by their summed size
+    cache = ResultCache(max_entries=10, ttl=0, max_size=5)
+    cache.put('a', 1, size=3)
+    cache.put('b', 2, size=2)
+    cache.put('c', 3, size=2)   # evicts 'a'
+    cache.put('d', 4, size=6)   # too large to cache
+    assert cache.get('a') is None and cache.get('d') is None
+    assert cache.get('b') == 2 and cache.stats()['size'] == 4
+
+    cache = ResultCache(max_entries=2, ttl=0.001)
+    cache.put('a', 1)
+    time.sleep(0.01)
+    assert cache.get('a') is None
+    print(f"  Stats: {cache.stats()}")
+    print()
+
+def test_search_served_from_cache(two_cvs):
+    """Test that a repeated search is a cache hit and a changed corpus is a miss"""
+    print("Testing Cached Search:")
+
+    matcher = CVMatcher(use_cache=False)
+
+    first, timing = matcher.search_cvs(two_cvs, ['python', 'sql'], 'BM', top_n=10, workers=1)
+    assert timing['result_cache'] == 'miss'
+    second, timing = matcher.search_cvs(two_cvs, ['Python', 'sql'], 'boyer_moore', top_n=10, workers=1)
+    assert timing['result_cache'] == 'hit'
+    assert timing['algorithm_used'] == 'boyer_moore'
+    assert second == first
+    assert second[0]['cv_data'] is two_cvs[0]
+
+    # Cached results do not keep the CV data, which can hold the whole CV text
+    cached_entries, _ = matcher.result_cache.get(matcher.result_cache_key(two_cvs, ['python', 'sql'], 'BM', 10))
+    assert [index for index, _ in cached_entries] == [0]
+    assert all('cv_data' not in result for _, result in cached_entries)
+
+    # Different top_n, threshold or CV content are separate entries
+    _, timing = matcher.search_cvs(two_cvs, ['python', 'sql'], 'BM', top_n=5, workers=1)
+    assert timing['result_cache'] == 'miss'
+    two_cvs[1] = dict(two_cvs[1], content_hash='h2-edited', cv_text="python developer")
+    results, timing = matcher.search_cvs(two_cvs, ['python', 'sql'], 'BM', top_n=10, workers=1)
+    assert timing['result_cache'] == 'miss'
+    assert len(results) == 2
+    print(f"  Hits: {timing['result_cache_hits']}, misses: {timing['result_cache_misses']}")
+    print()
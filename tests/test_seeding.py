@@ -0,0 +1,60 @@
+"""
+Test script to verify batched seeding (without a MySQL server)
+"""
+
+import os
+
+from database.seeding_db import insert_batch
+from utils.corpus_fingerprint import scan_corpus, plan_sync, file_sha256
+
+class FakeCursor:
+    """Records statements and hands out auto-increment ids per email"""
+    def __init__(self):
+        self.executed = []
+        self.profiles = {}
+        self._result = []
+
+    def executemany(self, query, rows):
+        self.executed.append((query, list(rows)))
+        if "INSERT INTO ApplicantProfile" in query:
+            for row in rows:
+                self.profiles[row[2]] = len(self.profiles) + 1
+
+    def execute(self, query, params=None):
+        self.executed.append((query, params))
+        self._result = [{'applicant_id': self.profiles[email], 'email': email} for email in params]
+
+    def fetchall(self):
+        return self._result
+
+def test_insert_batch(tmp_path):
+    """Test that a batch is inserted with one statement per table and ids are resolved by email"""
+    print("Testing Batched Seeding:")
+
+    (tmp_path / "HR").mkdir()
+    cv_paths = [os.path.normpath(os.path.join(str(tmp_path), "HR", f"{i}.pdf")) for i in range(5)]
+    for i, cv_path in enumerate(cv_paths):
+        with open(cv_path, 'wb') as f:
+            f.write(b"%PDF " + bytes([i]))
+    contents = [{'content_hash': 'h', 'cv_text': 'text', 'sections': {}} if i % 2 == 0 else None
+                for i in range(5)]
+    cursor = FakeCursor()
+    applicant_ids = insert_batch(cursor, cv_paths, contents)
+
+    # Profiles, one id lookup, details, contents and fingerprints: five round trips for the whole batch
+    assert len(cursor.executed) == 5
+    assert len(cursor.executed[0][1]) == 5
+    assert sorted(applicant_ids.values()) == [1, 2, 3, 4, 5]
+    details = cursor.executed[2][1]
+    assert details == [(applicant_ids[path], "HR", path) for path in cv_paths]
+    assert len(cursor.executed[3][1]) == 3  # CVs without text get no CVContent row
+
+    # Fingerprints are stored with the batch, so the next sync finds nothing to do
+    assert "INSERT INTO CorpusFile" in cursor.executed[4][0]
+    stored = {row[0]: {'applicant_id': row[1], 'mtime_ns': row[2], 'size': row[3], 'file_hash': row[4]}
+              for row in cursor.executed[4][1]}
+    assert stored[cv_paths[0]]['file_hash'] == file_sha256(cv_paths[0])
+    plan = plan_sync(scan_corpus(str(tmp_path)), stored)
+    assert plan['unchanged'] == 5 and not plan['new'] and not plan['changed']
+    print(f"  Applicant ids: {applicant_ids}")
+    print()
@@ -0,0 +1,140 @@
+"""
+Test script to verify the category-sharded CV search
+"""
+
+import os
+import threading
+
+import pytest
+
+from src.cv_matcher import CVMatcher
+from config import APP_CONFIG
+from src.sharding import ShardedSearch, split_shards, merge_top_n, shard_index_path
+
+ROLES = ["ACCOUNTANT", "DESIGNER", "ENGINEERING", "ACCOUNTANT", "ENGINEERING", "DESIGNER", None]
+TEXTS = [
+    "Accountant using Excel and SQL reports",
+    "Graphic designer, figma and python scripting",
+    "Python developer with SQL and python tooling",
+    "Auditor, excel, python basics",
+    "Data engineer: sql, spark, pyton",
+    "Illustrator",
+    "Python and SQL analyst",
+]
+KEYWORDS = ['python', 'sql', 'excel']
+
+@pytest.fixture
+def cvs(make_cvs):
+    return make_cvs(TEXTS, ROLES)
+
+def ranking(results):
+    return [(r['cv_data']['applicant_id'], r['total_score']) for r in results]
+
+def test_sharded_search_matches_search_cvs(cvs):
+    """Test that merging the shards' top-N gives the same ranking as one search"""
+    print("Testing Sharded Search:")
+
+    shards = split_shards(cvs)
+    assert list(shards) == ['ACCOUNTANT', 'DESIGNER', 'ENGINEERING', 'MISSING']
+    assert shards['ENGINEERING'] == [2, 4]
+
+    sharded = ShardedSearch(similarity_threshold=0.8, use_cache=False)
+    for algorithm in ('KMP', 'AC'):
+        for top_n in (None, 1, 3, 5):
+            matcher = CVMatcher(similarity_threshold=0.8, use_cache=False)
+            expected, _ = matcher.search_cvs(cvs, KEYWORDS, algorithm, top_n, workers=1)
+            results, timing_info = sharded.search(cvs, KEYWORDS, algorithm, top_n, workers=1)
+            assert ranking(results) == ranking(expected), (algorithm, top_n)
+            assert timing_info['total_cvs_scanned'] == len(cvs)
+            assert set(timing_info['shards']) == set(shards)
+    print(f"  Ranking: {ranking(results)}")
+    print()
+
+def test_role_filter_skips_shards(cvs):
+    """Test that a role filter searches only the matching shards"""
+    print("Testing Role Filter:")
+
+    sharded = ShardedSearch(use_cache=False)
+    progress = []
+    results, timing_info = sharded.search(cvs, KEYWORDS, 'KMP', roles=['engineering', 'Accountant'],
+                                          workers=1, progress_callback=lambda p, t, r: progress.append((p, t)))
+    assert {r['cv_data']['application_role'] for r in results} == {'ENGINEERING', 'ACCOUNTANT'}
+    assert timing_info['total_cvs_scanned'] == 4
+    assert timing_info['shards_skipped'] == 2
+    assert set(sharded.shards) == {'ENGINEERING', 'ACCOUNTANT'}
+    assert progress == [(2, 4), (4, 4)]
+
+    cancel_event = threading.Event()
+    cancel_event.set()
+    results, timing_info = sharded.search(cvs, KEYWORDS, 'KMP', workers=1, cancel_event=cancel_event)
+    assert results == [] and timing_info['cancelled']
+    print(f"  Shards searched: {list(timing_info['shards'])}, skipped: 2")
+    print()
+
+def test_parallel_shards(monkeypatch, tmp_path, cvs):
+    """Test that shards in worker processes give the sequential ranking, one profile and honour cancel"""
+    print("Testing Parallel Shards:")
+
+    monkeypatch.setitem(APP_CONFIG, 'profile_dir', str(tmp_path / "profiles"))
+    monkeypatch.setenv('ATS_PROFILE', '0')
+    sharded = ShardedSearch(similarity_threshold=0.8, use_cache=False)
+    try:
+        expected, _ = sharded.search(cvs, KEYWORDS, 'KMP', 3, workers=1)
+        results, timing_info = sharded.search(cvs, KEYWORDS, 'KMP', 3, workers=2)
+        assert ranking(results) == ranking(expected)
+        assert timing_info['workers'] == 2 and not timing_info['cancelled']
+
+        # Profiling writes a single file, with the workers' stats merged in
+        monkeypatch.setenv('ATS_PROFILE', '1')
+        results, timing_info = sharded.search(cvs, KEYWORDS, 'KMP', 3, workers=2)
+        assert ranking(results) == ranking(expected)
+        assert os.listdir(tmp_path / "profiles") == [os.path.basename(timing_info['profile_path'])]
+        monkeypatch.setenv('ATS_PROFILE', '0')
+
+        cancel_event = threading.Event()
+        cancel_event.set()
+        results, timing_info = sharded.search(cvs, KEYWORDS, 'KMP', workers=2, cancel_event=cancel_event)
+        assert timing_info['cancelled']
+        results, timing_info = sharded.search(cvs, KEYWORDS, 'KMP', 3, workers=2)
+        assert ranking(results) == ranking(expected) and not timing_info['cancelled']
+    finally:
+        sharded.shutdown_executor()
+    print(f"  Ranking: {ranking(results)}")
+    print()
+
+def test_parallel_shards_reuse_index(corpus_index_path, cvs):
+    """Test that each shard stays in one worker, so its index and cache are reused by the next search"""
+    print("Testing Pinned Shard Workers:")
+
+    sharded = ShardedSearch(similarity_threshold=0.8, use_cache=False)
+    try:
+        sharded.search(cvs, KEYWORDS, 'KMP', 3, workers=2)
+        index_files = {shard: shard_index_path(shard, sharded.shard_worker(shard)) + '.bin'
+                       for shard in split_shards(cvs)}
+        built = {shard: os.stat(path).st_mtime_ns for shard, path in index_files.items()}
+        index_dir = os.path.dirname(corpus_index_path)
+        assert len(os.listdir(index_dir)) == 2 * len(index_files)  # One .bin and .idx per shard
+
+        # A new query scans the same files; the same query is a cache hit in every shard
+        _, timing_info = sharded.search(cvs, ['designer', 'spark'], 'KMP', 3, workers=2)
+        assert {t['result_cache'] for t in timing_info['shards'].values()} == {'miss'}
+        assert {shard: os.stat(path).st_mtime_ns for shard, path in index_files.items()} == built
+        _, timing_info = sharded.search(cvs, KEYWORDS, 'KMP', 3, workers=2)
+        assert timing_info['result_cache'] == 'hit'
+        assert len(os.listdir(index_dir)) == 2 * len(index_files)
+    finally:
+        sharded.shutdown_executor()
+    print(f"  Shard indexes: {sorted(os.path.basename(path) for path in index_files.values())}")
+    print()
+
+def test_merge_top_n():
+    """Test the k-way merge order, ties going to the earlier CV"""
+    print("Testing Top-N Merge:")
+
+    first = [(5, 3, 'a'), (2, 0, 'b')]
+    second = [(5, 1, 'c'), (4, 2, 'd'), (1, 5, 'e')]
+    assert merge_top_n([first, second]) == ['c', 'a', 'd', 'b', 'e']
+    assert merge_top_n([first, second], 2) == ['c', 'a']
+    assert merge_top_n([]) == []
+    print(f"  Merged: {merge_top_n([first, second])}")
+    print()
@@ -0,0 +1,68 @@
+"""
+Test script to verify per-stage search timing and the profiler switch
+"""
+
+import os
+
+from config import APP_CONFIG
+from src.stage_timing import StageTimings, STAGES, profile_search
+from src.cv_matcher import CVMatcher
+
+def test_stage_timings_merge():
+    """Test per-sample min/avg/max and merging timings from worker chunks"""
+    print("Testing Stage Timings:")
+
+    first = StageTimings()
+    first.add_all({'extraction': 2_000_000, 'exact_match': 1_000_000})
+    first.add('extraction', 4_000_000)
+    second = StageTimings()
+    second.add('extraction', 1_000_000)
+    first.merge(second)
+
+    summary = first.summary()
+    assert set(summary) == set(STAGES)
+    assert summary['extraction']['count'] == 3
+    assert summary['extraction']['min_ms'] == 1.0
+    assert summary['extraction']['max_ms'] == 4.0
+    assert summary['extraction']['avg_ms'] == 7.0 / 3
+    assert summary['fuzzy_match']['count'] == 0
+    print(f"  Extraction: {summary['extraction']}")
+    print()
+
+def test_search_stage_breakdown(tmp_path, monkeypatch, two_cvs):
+    """Test that a search reports every stage and can be profiled to a .prof file"""
+    print("Testing Search Stage Breakdown:")
+
+    monkeypatch.setitem(APP_CONFIG, 'profile_dir', str(tmp_path))
+    monkeypatch.setenv('ATS_PROFILE', '1')
+    # Per-CV stages; with the corpus index, exact matching is one scan for all CVs
+    monkeypatch.setitem(APP_CONFIG, 'use_corpus_index', False)
+
+    matcher = CVMatcher(use_cache=False)
+    _, timing_info = matcher.search_cvs(two_cvs, ['python', 'javva'], 'KMP', workers=1, fetch_time_ns=5_000_000)
+
+    stages = timing_info['stage_timings']
+    assert stages['db_fetch']['total_ms'] == 5.0
+    for stage in ('extraction', 'exact_match', 'fuzzy_match', 'scoring'):
+        assert stages[stage]['count'] == 2
+    assert stages['ranking']['count'] == 1
+    assert abs(timing_info['exact_match_time'] - stages['exact_match']['total_ms'] / 1000) < 1e-9
+    profile_path = timing_info['profile_path']
+    assert os.path.exists(profile_path)
+
+    # Profiling is off unless switched on
+    monkeypatch.setenv('ATS_PROFILE', '0')
+
+    # With the corpus index, building it is its own stage and no CV is extracted on its own
+    monkeypatch.setitem(APP_CONFIG, 'use_corpus_index', True)
+    matcher.result_cache.clear()
+    _, timing_info = matcher.search_cvs(two_cvs, ['python', 'javva'], 'KMP', workers=1)
+    matcher.close_corpus_index()
+    stages = timing_info['stage_timings']
+    assert stages['corpus_index']['count'] == 1 and stages['exact_match']['count'] == 1
+    assert stages['extraction']['count'] == 0
+    assert stages['fuzzy_match']['count'] == 2
+    with profile_search() as path:
+        assert path is None
+    print(f"  Profile written to {os.path.basename(profile_path)}")
+    print()
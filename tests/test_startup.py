@@ -0,0 +1,75 @@
+"""
+Test script to verify the GUI starts without loading heavy modules or touching the database
+"""
+
+import os
+import sys
+import subprocess
+
+import pytest
+
+from config import APP_CONFIG
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Only needed once a CV is opened, the database is used, fuzzy matching runs or data is generated
+LAZY_MODULES = ('fitz', 'pymupdf', 'pymysql', 'faker', 'numpy')
+
+FIRST_WINDOW = """
+import time
+start = time.perf_counter()
+import tkinter as tk
+try:
+    root = tk.Tk()
+except tk.TclError:
+    print('NO_DISPLAY')
+    raise SystemExit(0)
+from gui.main_gui import ATSApplication
+app = ATSApplication(root)
+root.update()
+print(f'{(time.perf_counter() - start) * 1000:.1f}')
+root.destroy()
+"""
+
+def run_python(*args):
+    return subprocess.run([sys.executable, *args], cwd=PROJECT_ROOT,
+                          capture_output=True, text=True, timeout=60)
+
+def test_gui_import_time():
+    """Test that importing the GUI stays within the budget and skips lazy modules"""
+    print("Testing GUI Import Time:")
+
+    result = run_python('-X', 'importtime', '-c', 'import gui.main_gui')
+    assert result.returncode == 0, result.stderr
+
+    # Lines look like "import time:   self [us] | cumulative | module"
+    cumulative = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or '[us]' in line:
+            continue
+        _, total, module = line.split('|')
+        cumulative[module.strip()] = int(total)
+
+    loaded = [name for name in cumulative if name.split('.')[0] in LAZY_MODULES]
+    assert not loaded, f"Imported at startup: {loaded}"
+
+    import_ms = cumulative['gui.main_gui'] / 1000
+    budget_ms = APP_CONFIG['startup_import_budget_ms']
+    print(f"  gui.main_gui imported in {import_ms:.1f}ms (budget {budget_ms}ms)")
+    assert import_ms < budget_ms
+    print()
+
+def test_time_to_first_window():
+    """Test that the first window is drawn within the budget, before the database connects"""
+    print("Testing Time To First Window:")
+
+    result = run_python('-c', FIRST_WINDOW)
+    assert result.returncode == 0, result.stderr
+    output = result.stdout.strip().splitlines()[-1]
+    if output == 'NO_DISPLAY':
+        pytest.skip("no display available")
+
+    window_ms = float(output)
+    print(f"  First window after {window_ms:.1f}ms")
+    assert window_ms < APP_CONFIG['startup_import_budget_ms']
+    print()
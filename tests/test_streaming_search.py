@@ -0,0 +1,125 @@
+"""
+Test script to verify the streaming (generator and async) search API
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from src.cv_matcher import CVMatcher
+from config import APP_CONFIG
+
+TEXTS = [
+    "Python developer with SQL",
+    "Graphic designer",
+    "Data analyst: python, sql, excel",
+    "Accountant using Excel",
+]
+KEYWORDS = ['python', 'sql']
+
+@pytest.fixture
+def cvs(make_cvs):
+    return make_cvs(TEXTS)
+
+def test_iter_search_events(cvs):
+    """Test that results stream before the final event and match search_cvs"""
+    print("Testing Streaming Search Events:")
+
+    matcher = CVMatcher(use_cache=False)
+    events = list(matcher.iter_search(cvs, KEYWORDS, 'KMP', workers=1))
+
+    assert events[-1]['type'] == 'done'
+    results = [event for event in events if event['type'] == 'result']
+    assert [event['index'] for event in results] == [0, 2]
+    assert all(event['total'] == len(cvs) for event in results)
+    assert events.index(results[0]) < len(events) - 1
+
+    matcher.result_cache.clear()
+    ranked, timing_info = matcher.search_cvs(cvs, KEYWORDS, 'KMP', workers=1)
+    assert ranked == events[-1]['results']
+    assert timing_info['total_cvs_scanned'] == len(cvs)
+
+    # Stopping early does not need the rest of the corpus
+    stream = matcher.iter_search(cvs * 50, KEYWORDS, 'KMP', workers=1)
+    first = next(event for event in stream if event['type'] == 'result')
+    stream.close()
+    assert first['processed'] == 1
+    print(f"  {len(events)} events, first result after {results[0]['processed']} CV(s)")
+    print()
+
+def test_search_cvs_async(cvs):
+    """Test that the async search gives the same results while the event loop stays free"""
+    print("Testing Async Search:")
+
+    matcher = CVMatcher(use_cache=False)
+    expected, _ = matcher.search_cvs(cvs, KEYWORDS, 'KMP', workers=1)
+    matcher.result_cache.clear()
+
+    async def run():
+        ticks = 0
+        done = asyncio.Event()
+
+        async def ticker():
+            nonlocal ticks
+            while not done.is_set():
+                ticks += 1
+                await asyncio.sleep(0)
+
+        task = asyncio.create_task(ticker())
+        ranked, timing_info = await matcher.search_cvs_async(cvs * 25, KEYWORDS, 'KMP', workers=1)
+        done.set()
+        await task
+        return ranked, timing_info, ticks
+
+    ranked, timing_info, ticks = asyncio.run(run())
+    assert [r['cv_data']['applicant_id'] for r in ranked[:2]] == [r['cv_data']['applicant_id'] for r in expected]
+    assert timing_info['total_cvs_scanned'] == len(cvs) * 25
+    assert ticks > 0
+    print(f"  Event loop ran {ticks} times during the search")
+    print()
+
+def test_progress_preview_is_bounded(monkeypatch, cvs):
+    """Test that progress reports carry only the best few results, in final ranking order"""
+    print("Testing Progress Preview:")
+
+    monkeypatch.setitem(APP_CONFIG, 'progress_interval', 3)
+    monkeypatch.setitem(APP_CONFIG, 'progress_preview_size', 2)
+    matcher = CVMatcher(use_cache=False)
+    progress = []
+    ranked, _ = matcher.search_cvs(cvs * 5, KEYWORDS, 'KMP', workers=1,
+                                   progress_callback=lambda p, t, r: progress.append(r))
+
+    assert len(ranked) == 10
+    assert all(len(results) <= 2 for results in progress)
+    assert [r['cv_data']['applicant_id'] for r in progress[-1]] == \
+        [r['cv_data']['applicant_id'] for r in ranked[:2]]
+    print(f"  {len(progress)} progress reports, last preview: {[r['total_score'] for r in progress[-1]]}")
+    print()
+
+def test_cancel_search_cvs_async(monkeypatch, cvs):
+    """Test that cancelling the awaiting task mid-search raises CancelledError and stops the scan"""
+    print("Testing Async Search Cancellation:")
+
+    # One long executor step: no progress event before the end of the scan
+    monkeypatch.setitem(APP_CONFIG, 'progress_interval', 10**9)
+    monkeypatch.setitem(APP_CONFIG, 'use_corpus_index', False)
+    slow_cvs = [dict(cvs[1], applicant_id=i, content_hash=f'd{i}', cv_text=cvs[1]['cv_text'] * 50)
+           for i in range(5000)]
+    matcher = CVMatcher(use_cache=False)
+
+    async def run():
+        task = asyncio.create_task(matcher.search_cvs_async(slow_cvs, ['python'], 'KMP', workers=1))
+        await asyncio.sleep(0.05)
+        start = time.perf_counter()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        return time.perf_counter() - start
+
+    elapsed = asyncio.run(run())
+    assert matcher.result_cache.stats()['entries'] == 0  # The cancelled scan is not cached
+    ranked, _ = matcher.search_cvs(cvs, KEYWORDS, 'KMP', workers=1)
+    assert [r['cv_data']['applicant_id'] for r in ranked] == [0, 2]
+    print(f"  Cancelled in {elapsed * 1000:.1f}ms")
+    print()
@@ -1,14 +1,13 @@
 # ATS Utilities Package
 """
 Utility functions for the ATS system.
-This package is reserved for future utility functions.
 """
 
-# Future utility functions can be added here
-# Examples:
-# - File handling utilities
-# - Data validation functions
-# - Helper functions
-# - Common operations
+from .extraction_cache import ExtractionCache, get_extraction_cache
+from .corpus_fingerprint import file_sha256, scan_corpus, plan_sync
+from .result_cache import ResultCache, get_corpus_version, bump_corpus_version
 
-__all__ = []
+__all__ = [
+    'ExtractionCache', 'get_extraction_cache', 'file_sha256', 'scan_corpus', 'plan_sync',
+    'ResultCache', 'get_corpus_version', 'bump_corpus_version'
+]
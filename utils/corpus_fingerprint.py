@@ -0,0 +1,103 @@
+"""
+Fingerprints of the CV corpus for incremental synchronization.
+
+A file is identified by its path and fingerprinted by (mtime, size, content
+hash). The cheap stat fields are compared first; the file is only hashed when
+they differ, so a run where nothing changed touches no file contents.
+"""
+
+import os
+import hashlib
+import logging
+from typing import Callable, Dict, Optional, Tuple
+
+
+def file_sha256(path: str, chunk_size: int = 1 << 20) -> str:
+    """SHA-256 of a file's contents, read in blocks"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(chunk_size), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def safe_file_hash(path: str, hash_file: Callable[[str], str] = file_sha256) -> Optional[str]:
+    """Hash a file, or None if it cannot be read (e.g. removed during the sync)"""
+    try:
+        return hash_file(path)
+    except OSError as e:
+        logging.warning(f"Could not read {path}: {e}")
+        return None
+
+
+def file_fingerprint(path: str, hash_file: Callable[[str], str] = file_sha256) -> Optional[Tuple[int, int, str]]:
+    """(mtime_ns, size, content hash) of a file, or None if it cannot be read"""
+    try:
+        stat = os.stat(path)
+        return stat.st_mtime_ns, stat.st_size, hash_file(path)
+    except OSError as e:
+        logging.warning(f"Could not read {path}: {e}")
+        return None
+
+
+def scan_corpus(data_dir: str) -> Dict[str, Tuple[int, int]]:
+    """
+    Walk every category folder of data_dir and stat each PDF.
+    Returns cv_path -> (mtime_ns, size), with cv_path built the same way as seeding_db
+    """
+    scanned = {}
+    try:
+        categories = [entry for entry in os.scandir(data_dir) if entry.is_dir()]
+    except FileNotFoundError:
+        logging.error(f"Data folder not found: {data_dir}")
+        return scanned
+
+    for category in sorted(categories, key=lambda entry: entry.name):
+        for entry in sorted(os.scandir(category.path), key=lambda entry: entry.name):
+            if entry.is_file() and entry.name.lower().endswith('.pdf'):
+                stat = entry.stat()
+                cv_path = os.path.normpath(os.path.join(data_dir, category.name, entry.name))
+                scanned[cv_path] = (stat.st_mtime_ns, stat.st_size)
+    return scanned
+
+
+def plan_sync(scanned: Dict, stored: Dict, untracked: Dict = None,
+              hash_file: Callable[[str], str] = file_sha256) -> Dict:
+    """
+    Compare the files on disk with the stored fingerprints.
+
+    scanned: cv_path -> (mtime_ns, size), from scan_corpus
+    stored: cv_path -> {'applicant_id', 'mtime_ns', 'size', 'file_hash'}
+    untracked: cv_path -> applicant_id of CVs already in the database without a fingerprint
+
+    Returns a dict with
+      'new': [cv_path]
+      'changed': [(cv_path, applicant_id, file_hash)]  content must be re-extracted
+      'touched': [(cv_path, applicant_id, file_hash)]  only mtime/size changed
+      'deleted': [(cv_path, applicant_id)]
+      'unchanged': number of files skipped without hashing
+    """
+    untracked = untracked or {}
+    plan = {'new': [], 'changed': [], 'touched': [], 'deleted': [], 'unchanged': 0}
+
+    for cv_path, (mtime_ns, size) in scanned.items():
+        fingerprint = stored.get(cv_path)
+        if fingerprint is None:
+            if cv_path in untracked:
+                # Seeded before fingerprints existed: adopt the existing applicant
+                plan['changed'].append((cv_path, untracked[cv_path], safe_file_hash(cv_path, hash_file)))
+            else:
+                plan['new'].append(cv_path)
+        elif fingerprint['mtime_ns'] == mtime_ns and fingerprint['size'] == size:
+            plan['unchanged'] += 1
+        else:
+            file_hash = safe_file_hash(cv_path, hash_file)
+            if file_hash is not None and file_hash == fingerprint['file_hash']:
+                plan['touched'].append((cv_path, fingerprint['applicant_id'], file_hash))
+            else:
+                plan['changed'].append((cv_path, fingerprint['applicant_id'], file_hash))
+
+    for cv_path, fingerprint in stored.items():
+        if cv_path not in scanned:
+            plan['deleted'].append((cv_path, fingerprint['applicant_id']))
+    return plan
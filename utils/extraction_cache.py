@@ -0,0 +1,190 @@
+"""
+Persistent cache for extracted CV text.
+
+Extracting text from a PDF is the most expensive step of a search, while the
+CV corpus rarely changes between searches. This module stores extracted text
+in a small SQLite database keyed by (normalized path, mtime, size) so that
+unchanged files are served from disk and only new or modified files are
+re-extracted.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+import logging
+from typing import Callable, Dict, Optional
+
+from .result_cache import bump_corpus_version
+
+
+def normalize_path(path: str) -> str:
+    """Normalize a file path so the same file always maps to the same key"""
+    return os.path.normcase(os.path.abspath(os.path.normpath(path)))
+
+
+class ExtractionCache:
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+        self._lock = threading.Lock()
+
+        cache_dir = os.path.dirname(os.path.abspath(db_path))
+        os.makedirs(cache_dir, exist_ok=True)
+
+        self.connection = sqlite3.connect(db_path, check_same_thread=False, timeout=30)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute("""
+            CREATE TABLE IF NOT EXISTS extracted_text (
+                path TEXT PRIMARY KEY,
+                mtime_ns INTEGER NOT NULL,
+                size INTEGER NOT NULL,
+                text TEXT NOT NULL,
+                extracted_at REAL NOT NULL
+            )
+        """)
+        self.connection.commit()
+
+    def _lookup(self, path: str, stat: os.stat_result):
+        """Return (row_exists, text) where text is None unless the entry is fresh"""
+        with self._lock:
+            row = self.connection.execute(
+                "SELECT mtime_ns, size, text FROM extracted_text WHERE path = ?",
+                (normalize_path(path),)
+            ).fetchone()
+
+        if row is None:
+            return False, None
+        if row[0] == stat.st_mtime_ns and row[1] == stat.st_size:
+            return True, row[2]
+        return True, None
+
+    def get(self, path: str) -> Optional[str]:
+        """Return cached text for an unchanged file, or None if missing/stale"""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return self._lookup(path, stat)[1]
+
+    def put(self, path: str, text: str, stat: os.stat_result = None):
+        """Store extracted text for a file using its current mtime and size"""
+        if stat is None:
+            stat = os.stat(path)
+
+        key = normalize_path(path)
+        with self._lock:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO extracted_text (path, mtime_ns, size, text, extracted_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, stat.st_mtime_ns, stat.st_size, text, time.time())
+            )
+            self.connection.commit()
+
+    def get_or_extract(self, path: str, extractor: Callable[[str], str]) -> str:
+        """Return cached text for a file, re-extracting it only if it changed"""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return ""
+
+        exists, text = self._lookup(path, stat)
+        if text is not None:
+            self.hits += 1
+            return text
+
+        self.misses += 1
+        if exists:
+            # The CV file changed since it was cached, so cached search results are outdated
+            self.stale += 1
+            bump_corpus_version()
+
+        text = extractor(path)
+        # Empty text usually means extraction failed, so don't pin it in the cache
+        if text:
+            self.put(path, text, stat)
+        return text
+
+    def stats(self) -> Dict:
+        """Return hit/miss counters and the size of the cache"""
+        with self._lock:
+            entries, total_chars = self.connection.execute(
+                "SELECT COUNT(*), COALESCE(SUM(LENGTH(text)), 0) FROM extracted_text"
+            ).fetchone()
+
+        lookups = self.hits + self.misses
+        return {
+            'entries': entries,
+            'total_chars': total_chars,
+            'hits': self.hits,
+            'misses': self.misses,
+            'stale': self.stale,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'db_path': self.db_path
+        }
+
+    def purge(self, missing_only: bool = False) -> int:
+        """
+        Remove cache entries and return how many were deleted.
+        With missing_only=True only entries whose file no longer exists are removed.
+        """
+        with self._lock:
+            if not missing_only:
+                deleted = self.connection.execute("DELETE FROM extracted_text").rowcount
+                self.connection.commit()
+                return deleted
+
+            paths = [row[0] for row in self.connection.execute("SELECT path FROM extracted_text")]
+            missing = [(path,) for path in paths if not os.path.exists(path)]
+            if missing:
+                self.connection.executemany("DELETE FROM extracted_text WHERE path = ?", missing)
+                self.connection.commit()
+            return len(missing)
+
+    def close(self):
+        """Close the underlying SQLite connection"""
+        with self._lock:
+            self.connection.close()
+
+
+_shared_caches = {}
+_shared_lock = threading.Lock()
+
+
+def get_extraction_cache(db_path: str) -> ExtractionCache:
+    """Return a process-wide cache instance for the given database file"""
+    # SQLite connections must not be shared with forked worker processes
+    key = (normalize_path(db_path), os.getpid())
+    with _shared_lock:
+        cache = _shared_caches.get(key)
+        if cache is None:
+            try:
+                cache = ExtractionCache(db_path)
+            except sqlite3.Error as e:
+                logging.error(f"Could not open extraction cache '{db_path}': {e}")
+                return None
+            _shared_caches[key] = cache
+        return cache
+
+
+if __name__ == "__main__":
+    import argparse
+    import json
+
+    parser = argparse.ArgumentParser(description="Inspect or purge the extracted CV text cache")
+    parser.add_argument("--db", default=os.path.join("temp", "extraction_cache.sqlite3"),
+                        help="Path to the cache database")
+    parser.add_argument("--purge", action="store_true", help="Remove every cached entry")
+    parser.add_argument("--purge-missing", action="store_true",
+                        help="Remove entries whose PDF no longer exists")
+    args = parser.parse_args()
+
+    cache = ExtractionCache(args.db)
+    if args.purge or args.purge_missing:
+        removed = cache.purge(missing_only=not args.purge)
+        print(f"Removed {removed} cached entries")
+    print(json.dumps(cache.stats(), indent=4))
+    cache.close()
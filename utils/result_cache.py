@@ -0,0 +1,98 @@
+"""
+In-memory cache of search results.
+
+Recruiters often repeat the same query while paging through candidates. The
+cache keeps the most recently used results (LRU) for a limited time (TTL).
+A corpus version counter is bumped whenever applicants, applications or CV
+contents change, which drops every cached result at once.
+"""
+
+import time
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+_corpus_version = 0
+_version_lock = threading.Lock()
+
+
+def get_corpus_version() -> int:
+    """Current corpus version (process-wide)"""
+    return _corpus_version
+
+
+def bump_corpus_version() -> int:
+    """Mark the corpus as changed, invalidating cached search results"""
+    global _corpus_version
+    with _version_lock:
+        _corpus_version += 1
+        return _corpus_version
+
+
+class ResultCache:
+    def __init__(self, max_entries: int = 32, ttl: float = 300, max_size: int = None):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.max_size = max_size  # Bound on the summed sizes of the entries (e.g. result rows), None = no bound
+        self._size = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()  # key -> (stored_at, value, size), least recently used first
+        self._version = get_corpus_version()
+        self._lock = threading.Lock()
+
+    def _check_version(self):
+        version = get_corpus_version()
+        if version != self._version:
+            self._entries.clear()
+            self._size = 0
+            self._version = version
+
+    def _remove(self, key: Hashable):
+        self._size -= self._entries.pop(key)[2]
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Cached value for key, or None if missing, expired or the corpus changed"""
+        with self._lock:
+            self._check_version()
+            entry = self._entries.get(key)
+            if entry is not None and self.ttl and time.monotonic() - entry[0] > self.ttl:
+                self._remove(key)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key: Hashable, value: Any, size: int = 1):
+        """
+        Store a value of the given size, evicting the least recently used entries beyond
+        max_entries or max_size. A value larger than max_size on its own is not stored
+        """
+        if self.max_entries <= 0 or (self.max_size is not None and size > self.max_size):
+            return
+        with self._lock:
+            self._check_version()
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (time.monotonic(), value, size)
+            self._size += size
+            while len(self._entries) > self.max_entries or (self.max_size is not None and self._size > self.max_size):
+                self._remove(next(iter(self._entries)))
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'size': self._size,
+                'hits': self.hits,
+                'misses': self.misses,
+                'corpus_version': self._version
+            }